@@ -83,7 +83,8 @@ log "Step 4/7: Running migrations on ${TARGET}..."
 docker compose \
     -f docker-compose.prod.yml \
     -f "docker-compose.${TARGET}.yml" \
-    exec "web-${TARGET}" python manage.py migrate --no-input
+    exec "web-${TARGET}" python manage.py migrate_tenants --noinput \
+        --processes "${MIGRATE_PROCESSES:-4}" --retries "${MIGRATE_RETRIES:-1}"
 ok "Migrations applied"
 
 # ── Step 5: Health check ──
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""
+Requests/second of the current WSGI stack (gunicorn gthread, as in the
+Dockerfile) against the ASGI app under uvicorn.
+
+Each server is started in turn from ``src/`` with the same settings, warmed
+up, then driven by an async httpx client at a fixed concurrency:
+
+    python scripts/bench_asgi.py --host acme.localhost --path /healthz
+
+Use a ``--host`` served by a tenant so TenantMiddleware resolves it; the
+default ``/healthz`` view is async, so under uvicorn the request path runs
+without thread handoffs once the tenant is cached.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+SERVERS = {
+    "wsgi": lambda port, workers: [
+        "gunicorn", "config.wsgi:application", "--bind", f"127.0.0.1:{port}",
+        "--workers", str(workers), "--worker-class", "gthread", "--threads", "2",
+        "--log-level", "warning",
+    ],
+    "asgi": lambda port, workers: [
+        "uvicorn", "config.asgi:application", "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning", "--no-access-log",
+    ],
+}
+
+
+async def _wait_ready(client: httpx.AsyncClient, url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            await client.get(url)
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server did not start: {url}")
+
+
+async def _drive(url: str, host: str, concurrency: int, duration: float) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    headers = {"Host": host} if host else {}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(headers=headers, limits=limits, timeout=10) as client:
+        await _wait_ready(client, url)
+        for _ in range(concurrency * 5):  # warm-up: caches, connections
+            await client.get(url)
+
+        stop = time.monotonic() + duration
+
+        async def worker() -> None:
+            nonlocal errors
+            while time.monotonic() < stop:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+        "errors": errors,
+    }
+
+
+def run(target: str, args) -> dict:
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": args.settings}
+    command = SERVERS[target](args.port, args.workers)
+    server = subprocess.Popen(command, cwd=SRC, env=env)  # noqa: S603 - fixed SERVERS table
+    try:
+        url = f"http://127.0.0.1:{args.port}{args.path}"
+        return asyncio.run(_drive(url, args.host, args.concurrency, args.duration))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--targets", nargs="+", choices=SERVERS, default=list(SERVERS))
+    parser.add_argument("--path", default="/healthz")
+    parser.add_argument("--host", default="", help="Host header (a tenant domain).")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--settings", default="config.settings.dev")
+    args = parser.parse_args()
+
+    print(f"{'server':<8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for target in args.targets:
+        result = run(target, args)
+        print(
+            f"{target:<8}{result['rps']:>10.0f}{result['p50']:>10.2f}"
+            f"{result['p99']:>10.2f}{result['errors']:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
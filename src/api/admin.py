@@ -7,7 +7,16 @@ from .models import ApiKey
 
 @admin.register(ApiKey)
 class ApiKeyAdmin(admin.ModelAdmin):
-    list_display = ("name", "prefix", "organization", "user", "revoked_at", "last_used_at", "created_at")
+    list_display = (
+        "name",
+        "prefix",
+        "organization",
+        "user",
+        "revoked_at",
+        "last_used_at",
+        "request_count",
+        "created_at",
+    )
     search_fields = ("name", "prefix", "user__email")
     list_filter = ("organization", "revoked_at")
 
@@ -5,6 +5,7 @@ from typing import Optional, Tuple
 from django.utils.translation import gettext_lazy as _
 from rest_framework import authentication, exceptions
 
+from api import key_cache
 from api.models import ApiKey
 
 
@@ -24,15 +25,8 @@ class ApiKeyAuthentication(authentication.BaseAuthentication):
         except ValueError:
             raise exceptions.AuthenticationFailed(_("Invalid API key format."))
 
-        try:
-            key = ApiKey.objects.select_related("user", "organization").get(prefix=prefix)
-        except ApiKey.DoesNotExist:
-            raise exceptions.AuthenticationFailed(_("Invalid API key."))
-
-        if not key.check_secret(secret):
-            raise exceptions.AuthenticationFailed(_("Invalid API key."))
-
         organization = getattr(request, "tenant", None)
+        key = self._verify(raw, prefix, secret, getattr(organization, "id", None))
         if organization is None:
             raise exceptions.AuthenticationFailed(_("Tenant required for API key authentication."))
         if key.organization_id != organization.id:
@@ -44,6 +38,25 @@ class ApiKeyAuthentication(authentication.BaseAuthentication):
             raise exceptions.AuthenticationFailed(_("API key not linked to a user."))
         return user, key
 
+    def _verify(self, raw: str, prefix: str, secret: str, tenant_id) -> ApiKey:
+        keys = ApiKey.objects.select_related("user", "organization")
+        if tenant_id is not None:
+            pk = key_cache.get_verified(tenant_id, raw)
+            if pk is not None:
+                key = keys.filter(pk=pk, prefix=prefix, revoked_at__isnull=True).first()
+                if key is not None:
+                    return key
+
+        try:
+            key = keys.get(prefix=prefix)
+        except ApiKey.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_("Invalid API key."))
+        if not key.check_secret(secret):
+            raise exceptions.AuthenticationFailed(_("Invalid API key."))
+        if key.organization_id == tenant_id:
+            key_cache.remember_verified(tenant_id, raw, key.pk)
+        return key
+
     def _get_raw_key(self, request) -> str | None:
         header_val = request.headers.get(self.header)
         if header_val:
@@ -0,0 +1,66 @@
+"""
+Cache of verified API keys.
+
+``ApiKey.check_secret`` runs the configured password hasher (PBKDF2 with
+hundreds of thousands of iterations), which is far too slow to pay on every
+machine-to-machine request. After a key verifies once, the HMAC-SHA256 of
+the presented key (keyed with ``SECRET_KEY``) is cached for
+``API_KEY_CACHE_TIMEOUT`` seconds, mapped to the key's pk. Later requests
+with the same key skip the hasher and load the key by pk.
+
+The plaintext key is never stored, and the digest is useless without
+``SECRET_KEY``. Entries are scoped to the tenant because ``ApiKey`` pks are
+only unique per schema. ``ApiKey.revoke`` deletes the entry immediately, and
+the pk lookup re-checks ``revoked_at`` anyway.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.crypto import salted_hmac
+
+CACHE_KEY_PREFIX = "api:key:"
+
+
+def _timeout() -> int:
+    return int(getattr(settings, "API_KEY_CACHE_TIMEOUT", 60))
+
+
+def key_digest(raw: str) -> str:
+    return salted_hmac("api.key_cache", raw, algorithm="sha256").hexdigest()
+
+
+def _verified_key(tenant_id, digest: str) -> str:
+    return f"{CACHE_KEY_PREFIX}{tenant_id}:verified:{digest}"
+
+
+def _digest_key(tenant_id, pk) -> str:
+    return f"{CACHE_KEY_PREFIX}{tenant_id}:digest:{pk}"
+
+
+def get_verified(tenant_id, raw: str) -> int | None:
+    """Pk of the key ``raw`` verified recently for this tenant, if any."""
+    if _timeout() <= 0:
+        return None
+    return cache.get(_verified_key(tenant_id, key_digest(raw)))
+
+
+def remember_verified(tenant_id, raw: str, pk: int) -> None:
+    timeout = _timeout()
+    if timeout <= 0:
+        return
+    digest = key_digest(raw)
+    cache.set_many(
+        {_verified_key(tenant_id, digest): pk, _digest_key(tenant_id, pk): digest}, timeout
+    )
+
+
+def forget(tenant_id, pk) -> None:
+    """Drop the cached verification of key ``pk`` (revocation)."""
+    digest_key = _digest_key(tenant_id, pk)
+    digest = cache.get(digest_key)
+    keys = [digest_key]
+    if digest:
+        keys.append(_verified_key(tenant_id, digest))
+    cache.delete_many(keys)
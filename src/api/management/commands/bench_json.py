@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from common.api.renderers import FastJSONRenderer
+from multitenant.batch import list_tenants, tenant_scope
+
+
+def _course_detail():
+    from lms.models import Course
+    from lms.serializers import CourseDetailSerializer
+
+    course = Course.objects.select_related("instructor").prefetch_related("sections").first()
+    if course is None:
+        return None
+    return lambda: CourseDetailSerializer(course).data
+
+
+def _topic_list():
+    from community.models import Topic
+    from community.serializers import TopicListSerializer
+
+    topics = list(Topic.objects.select_related("author", "space")[:50])
+    if not topics:
+        return None
+    return lambda: {"count": len(topics), "results": TopicListSerializer(topics, many=True).data}
+
+
+def _mcp_catalog():
+    from mcp.tool_registry import get_tools_catalog
+
+    def payload():
+        tools = get_tools_catalog()
+        return {"tools": tools, "count": len(tools), "version": "1.0"}
+
+    return payload
+
+
+ENDPOINTS = {
+    "course detail": _course_detail,
+    "topic list": _topic_list,
+    "mcp catalog": _mcp_catalog,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "CPU per request of DRF's JSONRenderer vs the orjson FastJSONRenderer on the "
+        "heaviest API payloads (course detail, topic list, MCP catalog) of one tenant."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("tenant", help="Slug of a tenant with courses and topics.")
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        if iterations <= 0:
+            raise CommandError("--iterations must be positive.")
+        refs = list_tenants(slugs=[options["tenant"]], include_inactive=True)
+        if not refs:
+            raise CommandError(f"Unknown tenant: {options['tenant']}")
+
+        rows = []
+        with tenant_scope(refs[0]):
+            for name, build in ENDPOINTS.items():
+                payload = build()
+                if payload is None:
+                    self.stdout.write(self.style.WARNING(f"Skipping {name}: no rows."))
+                    continue
+                rows.append((name, *self._measure(payload, iterations)))
+
+        self.stdout.write(
+            f"{'endpoint':<16}{'KB':>8}{'serialize ms':>14}{'drf ms':>9}{'orjson ms':>11}"
+            f"{'before ms':>11}{'after ms':>10}{'speedup':>9}"
+        )
+        for name, size, serialize, drf, fast in rows:
+            before, after = serialize + drf, serialize + fast
+            self.stdout.write(
+                f"{name:<16}{size / 1024:>8.1f}{serialize:>14.3f}{drf:>9.3f}{fast:>11.3f}"
+                f"{before:>11.3f}{after:>10.3f}{before / after:>8.2f}x"
+            )
+
+    def _measure(self, payload, iterations: int):
+        """Median CPU ms to serialize, render with DRF and render with orjson."""
+        renderers = (JSONRenderer(), FastJSONRenderer())
+        serialize, timings = [], ([], [])
+        for _ in range(iterations):
+            started = time.process_time()
+            data = payload()
+            serialize.append(time.process_time() - started)
+            for renderer, samples in zip(renderers, timings, strict=True):
+                started = time.process_time()
+                body = renderer.render(data, "application/json")
+                samples.append(time.process_time() - started)
+        median = [statistics.median(samples) * 1000 for samples in (serialize, *timings)]
+        return (len(body), *median)
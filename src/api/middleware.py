@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from django.utils.deprecation import MiddlewareMixin
+
+
+class RateLimitHeadersMiddleware(MiddlewareMixin):
+    """Add the ``RateLimit-*`` headers computed by ``api.throttling.TenantPlanThrottle``."""
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        return self.process_response(request, response)
+
+    def process_response(self, request, response):
+        state = getattr(request, "rate_limit", None)
+        if state is not None:
+            for name, value in state.headers().items():
+                response.headers.setdefault(name, value)
+        return response
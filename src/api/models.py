@@ -20,6 +20,7 @@ class ApiKey(models.Model):
     scopes = models.JSONField(default=list, blank=True)
     revoked_at = models.DateTimeField(blank=True, null=True)
     last_used_at = models.DateTimeField(blank=True, null=True)
+    request_count = models.PositiveBigIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -32,9 +33,18 @@ class ApiKey(models.Model):
     def check_secret(self, secret: str) -> bool:
         return self.is_active and check_password(secret, self.hashed_key)
 
+    def revoke(self) -> None:
+        from api.key_cache import forget
+
+        self.revoked_at = timezone.now()
+        self.save(update_fields=["revoked_at"])
+        forget(self.organization_id, self.pk)
+
     def mark_used(self) -> None:
-        self.last_used_at = timezone.now()
-        self.save(update_fields=["last_used_at"])
+        """Buffered: ``last_used_at``/``request_count`` are written by ``api.usage``."""
+        from api.usage import record_use
+
+        record_use(self)
 
     @classmethod
     def generate(cls, *, organization, user, name: str, scopes: list[str] | None = None) -> tuple["ApiKey", str]:
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
 from rest_framework.permissions import BasePermission
+from rest_framework_simplejwt.tokens import Token
 
-from common.policies import has_permission
+from common.policies import StaleAuthorization, has_permission, member_role_from_claims
 
 
 class PolicyPermission(BasePermission):
@@ -12,6 +15,9 @@ class PolicyPermission(BasePermission):
     Views may define:
     - permission_codename: str
     - permission_codenames: list[str]
+
+    Access tokens with authorization claims for the request's tenant (see
+    ``api.serializers_auth``) are trusted while their role version is current.
     """
 
     def has_permission(self, request, view):
@@ -27,4 +33,18 @@ class PolicyPermission(BasePermission):
             codenames = [getattr(view, "permission_codename")]
         if not codenames:
             return True
+        self._trust_token_claims(request, organization)
         return all(has_permission(request.user, organization, code) for code in codenames)
+
+    def _trust_token_claims(self, request, organization) -> None:
+        token = request.auth
+        if not isinstance(token, Token) or token.get("tid") != organization.id:
+            return
+        if token.get("rv") is None or getattr(request.user, "is_superuser", False):
+            return
+        try:
+            member_role_from_claims(request.user, organization, token)
+        except StaleAuthorization as exc:
+            raise exceptions.AuthenticationFailed(
+                _("Permissions changed; refresh the access token."), code="token_stale"
+            ) from exc
@@ -2,11 +2,62 @@
 
 Includes tenant_id and role in JWT claims so the frontend
 can resolve tenant context without extra API calls.
+
+With ``JWT_AUTHZ_CLAIMS`` the access token also carries compact
+authorization claims for the tenant it was issued on:
+
+- ``tid``/``tsc``: tenant id and schema;
+- ``rol``/``rid``: role slug and id;
+- ``rv``: role version (``common.policies.role_version``).
+
+There is no permission claim: ``PolicyPermission`` checks the role's cached
+codenames. It trusts the claims while ``rv`` matches the cached role and
+answers 401 ``token_stale`` once it changes, so the client refreshes; the
+refresh serializer re-reads the claims. The refresh token only keeps ``tid``.
 """
 
 from __future__ import annotations
 
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenObtainSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from common.policies import get_member_role, role_version
+
+AUTHZ_CLAIMS = ("tid", "tsc", "rol", "rid", "rv")
+
+
+def authz_claims_enabled() -> bool:
+    return bool(getattr(settings, "JWT_AUTHZ_CLAIMS", False))
+
+
+def authz_claims(user, tenant) -> dict | None:
+    """Compact authorization claims for ``user`` in ``tenant`` (active schema)."""
+    member_role = get_member_role(user, tenant)
+    if member_role is None:
+        return None
+    return {
+        "tid": tenant.id,
+        "tsc": tenant.schema_name,
+        "rol": member_role.slug,
+        "rid": member_role.role_id,
+        "rv": role_version(member_role.slug, member_role.codenames),
+    }
+
+
+def stamp_access_token(access, user, tenant) -> None:
+    for claim in AUTHZ_CLAIMS:
+        access.payload.pop(claim, None)
+    claims = authz_claims(user, tenant) if tenant is not None else None
+    if claims:
+        access.payload.update(claims)
 
 
 class TenantTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -35,3 +86,52 @@ class TenantTokenObtainPairSerializer(TokenObtainPairSerializer):
             token["role"] = membership.role.slug if membership.role else ""
 
         return token
+
+    def validate(self, attrs):
+        if not authz_claims_enabled():
+            return super().validate(attrs)
+
+        # TokenObtainPairSerializer.validate, with the claims of the tenant
+        # this token is requested on.
+        data = TokenObtainSerializer.validate(self, attrs)
+        tenant = getattr(self.context.get("request"), "tenant", None)
+        refresh = self.get_token(self.user)
+        if tenant is not None:
+            refresh["tid"] = tenant.id
+        access = refresh.access_token
+        stamp_access_token(access, self.user, tenant)
+        data["refresh"] = str(refresh)
+        data["access"] = str(access)
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, self.user)
+        return data
+
+
+class TenantTokenRefreshSerializer(TokenRefreshSerializer):
+    """Re-read the authorization claims when issuing a new access token."""
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        if not authz_claims_enabled():
+            return data
+        access = AccessToken(data["access"])
+        tenant_id = access.get("tid")
+        if tenant_id is None:
+            return data
+
+        from multitenant.batch import TenantRef, tenant_scope
+        from multitenant.resolver import resolve_tenant_id
+
+        tenant = resolve_tenant_id(tenant_id)
+        if tenant is None:
+            stamp_access_token(access, None, None)
+        else:
+            with tenant_scope(TenantRef.from_tenant(tenant)):
+                user = (
+                    get_user_model()
+                    .objects.filter(pk=access[api_settings.USER_ID_CLAIM], is_active=True)
+                    .first()
+                )
+                stamp_access_token(access, user, tenant)
+        data["access"] = str(access)
+        return data
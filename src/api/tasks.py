@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from celery import shared_task
+
+from .usage import flush_usage
+
+
+@shared_task(ignore_result=True)
+def flush_api_key_usage() -> int:
+    """Write buffered API key request counts and last-use times."""
+    return flush_usage()
@@ -0,0 +1,189 @@
+"""
+Write-behind buffer for API key usage.
+
+``ApiKey.mark_used`` used to UPDATE the key row on every authenticated
+request, so busy integrations kept a stream of writes (and row locks) on
+the same row. Usage is now buffered and written in batches:
+
+- ``record_use`` adds one hit to two Redis hashes (request count and last
+  use per key), one round trip, no database access;
+- ``flush_usage`` (Celery beat task ``api.tasks.flush_api_key_usage``,
+  every ``API_KEY_USAGE_FLUSH_SECONDS``) drains both hashes atomically and
+  applies them with one UPDATE per tenant.
+
+Without Redis (local cache backend, Redis down) hits stay in process
+memory. They move to Redis with the first hit after Redis is reachable
+again; meanwhile a daemon thread per process (started with the first local
+hit, again after a fork) writes the buffer every interval on its own
+connection. Requests never flush: that would write to the database (and
+switch the RLS tenant) inside the request's transaction. Counts whose write
+fails go back to the buffer for the next run.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import UTC, datetime
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import BigIntegerField, Case, DateTimeField, F, Value, When
+
+from multitenant.batch import list_tenants, tenant_scope
+
+from .models import ApiKey
+
+logger = logging.getLogger(__name__)
+
+COUNTS_KEY = "api:usage:counts"
+LAST_USED_KEY = "api:usage:last"
+
+_lock = threading.Lock()
+_counts: dict[str, int] = defaultdict(int)
+_last_used: dict[str, float] = {}
+_flusher_lock = threading.Lock()
+_flusher_pid: int | None = None
+
+
+def _redis():
+    """Raw Redis client of the default cache, or None for other backends."""
+    try:
+        from django_redis import get_redis_connection
+
+        return get_redis_connection("default")
+    except (ImportError, NotImplementedError):
+        return None
+
+
+def record_use(key: ApiKey) -> None:
+    """Count one request for ``key`` without touching the database."""
+    field = f"{key.organization_id}:{key.pk}"
+    _buffer({field: 1}, {field: time.time()})
+    client = _redis()
+    if client is None:
+        _start_flusher()
+        return
+    counts, last_used = _take_buffer()
+    try:
+        pipe = client.pipeline(transaction=False)
+        for name, count in counts.items():
+            pipe.hincrby(COUNTS_KEY, name, count)
+            pipe.hset(LAST_USED_KEY, name, last_used[name])
+        pipe.execute()
+    except Exception:
+        _buffer(counts, last_used)
+        _start_flusher()
+        logger.warning("Could not buffer API key usage in Redis", exc_info=True)
+
+
+def _buffer(counts: dict[str, int], last_used: dict[str, float]) -> None:
+    with _lock:
+        for field, count in counts.items():
+            _counts[field] += count
+            _last_used[field] = max(_last_used.get(field, 0.0), last_used[field])
+
+
+def _take_buffer() -> tuple[dict[str, int], dict[str, float]]:
+    with _lock:
+        counts, last_used = dict(_counts), dict(_last_used)
+        _counts.clear()
+        _last_used.clear()
+    return counts, last_used
+
+
+def _start_flusher() -> None:
+    """Start this process's flusher thread, once (again after a fork)."""
+    global _flusher_pid
+    if _flusher_pid == os.getpid():
+        return
+    with _flusher_lock:
+        if _flusher_pid == os.getpid():
+            return
+        _flusher_pid = os.getpid()
+        threading.Thread(target=_run_flusher, name="api-key-usage", daemon=True).start()
+
+
+def _run_flusher() -> None:
+    atexit.register(flush_local_usage)
+    while True:
+        time.sleep(max(settings.API_KEY_USAGE_FLUSH_SECONDS, 1))
+        try:
+            close_old_connections()
+            flush_local_usage()
+        except Exception:
+            logger.exception("API key usage flusher failed")
+
+
+def _drain() -> tuple[dict[str, int], dict[str, float]]:
+    counts, last_used = _take_buffer()
+    client = _redis()
+    if client is None:
+        return counts, last_used
+    try:
+        pipe = client.pipeline(transaction=True)
+        pipe.hgetall(COUNTS_KEY)
+        pipe.hgetall(LAST_USED_KEY)
+        pipe.delete(COUNTS_KEY, LAST_USED_KEY)
+        redis_counts, redis_last, _ = pipe.execute()
+    except Exception:
+        logger.warning("Could not drain API key usage from Redis", exc_info=True)
+        return counts, last_used
+    for field, value in redis_counts.items():
+        counts[field.decode()] = counts.get(field.decode(), 0) + int(value)
+    for field, value in redis_last.items():
+        last_used[field.decode()] = max(last_used.get(field.decode(), 0.0), float(value))
+    return counts, last_used
+
+
+def flush_usage() -> int:
+    """Write buffered usage (Redis and this process) to the keys' rows. Returns keys updated."""
+    return _write(*_drain())
+
+
+def flush_local_usage() -> int:
+    """Write this process's buffer only; the flusher thread's job. Returns keys updated."""
+    return _write(*_take_buffer())
+
+
+def _write(counts: dict[str, int], last_used: dict[str, float]) -> int:
+    if not counts:
+        return 0
+    by_tenant: dict[int, dict[int, tuple[int, float]]] = defaultdict(dict)
+    for field, count in counts.items():
+        tenant_id, pk = (int(part) for part in field.split(":"))
+        by_tenant[tenant_id][pk] = (count, last_used.get(field, time.time()))
+
+    updated = 0
+    for ref in list_tenants(include_inactive=True, ids=by_tenant):
+        usage = by_tenant[ref.id]
+        try:
+            with tenant_scope(ref):
+                updated += ApiKey.objects.filter(pk__in=usage).update(
+                    request_count=F("request_count")
+                    + Case(
+                        *(When(pk=pk, then=Value(count)) for pk, (count, _) in usage.items()),
+                        default=Value(0),
+                        output_field=BigIntegerField(),
+                    ),
+                    last_used_at=Case(
+                        *(
+                            When(pk=pk, then=Value(datetime.fromtimestamp(ts, tz=UTC)))
+                            for pk, (_, ts) in usage.items()
+                        ),
+                        default=F("last_used_at"),
+                        output_field=DateTimeField(),
+                    ),
+                )
+        except Exception:
+            logger.exception("Could not flush API key usage for %s", ref.slug)
+            fields = [f"{ref.id}:{pk}" for pk in usage]
+            _buffer(
+                {field: counts[field] for field in fields},
+                {field: last_used.get(field, time.time()) for field in fields},
+            )
+    return updated
@@ -0,0 +1,110 @@
+"""
+``POST /api/v1/batch``: several read requests against the v1 router in one round trip.
+
+The dashboard loads ``/me``, ``/tenant``, ``dashboard``, ``memberships``,
+``subscriptions`` and ``integrations/status`` together. Sent one by one,
+each goes through the middleware stack again: tenant resolution, session
+or JWT authentication, the membership lookup. Here they run in-process
+after the batch request has done that once:
+
+- every sub-request reuses the batch request's ``tenant`` and, through
+  DRF's forced authentication, its user and token (so the per-user policy
+  memo in ``common.policies`` is shared too);
+- views still run their own permission checks and throttles;
+- ``headers`` per sub-request are passed through, so ``If-None-Match``
+  works and unchanged resources come back as 304 with no body.
+
+Only ``GET`` is accepted: writes keep their own endpoints and transactions.
+
+Body::
+
+    {"requests": [{"id": "me", "path": "/me"}, {"path": "/memberships?page=2"}]}
+
+Response: ``{"responses": [{"id", "status", "headers", "body"}, ...]}`` in order.
+"""
+
+from __future__ import annotations
+
+import logging
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.http import Http404
+from django.urls import resolve
+from rest_framework import serializers, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from common.api.subrequests import make_subrequest, response_data
+
+logger = logging.getLogger(__name__)
+
+URLCONF = "api.v1.urls"
+
+
+class SubRequestSerializer(serializers.Serializer):
+    id = serializers.CharField(required=False, max_length=100)
+    method = serializers.ChoiceField(choices=["GET"], default="GET")
+    path = serializers.CharField(max_length=2000)
+    headers = serializers.DictField(child=serializers.CharField(), required=False)
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    requests = serializers.ListField(child=SubRequestSerializer(), allow_empty=False)
+
+    def validate_requests(self, value):
+        limit = settings.API_BATCH_MAX_REQUESTS
+        if len(value) > limit:
+            raise serializers.ValidationError(f"At most {limit} requests per batch.")
+        return value
+
+
+class BatchView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        payload = BatchRequestSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        base = request.path.rstrip("/").rsplit("/", 1)[0] + "/"
+        specs = payload.validated_data["requests"]
+        return Response({"responses": [self._run(request, base, spec) for spec in specs]})
+
+    def _run(self, request, base: str, spec: dict) -> dict:
+        result = {"id": spec.get("id"), "status": status.HTTP_404_NOT_FOUND, "headers": {}}
+        parts = urlsplit(spec["path"])
+        relative = parts.path.lstrip("/")
+        if relative.startswith(base.lstrip("/")):
+            relative = relative[len(base.lstrip("/")) :]
+        try:
+            match = resolve("/" + relative, urlconf=URLCONF)
+        except Http404:
+            result["body"] = {"detail": "Not found."}
+            return result
+        if getattr(match.func, "view_class", None) is type(self):
+            result.update(status=status.HTTP_400_BAD_REQUEST, body={"detail": "Nested batch."})
+            return result
+
+        sub = make_subrequest(
+            request, spec["method"], base + relative, parts.query, headers=spec.get("headers")
+        )
+        sub.resolver_match = match
+        try:
+            response = match.func(sub, *match.args, **match.kwargs)
+        except Http404:
+            result["body"] = {"detail": "Not found."}
+            return result
+        except Exception:
+            logger.exception("Batch sub-request %s failed", sub.path)
+            result.update(status=status.HTTP_500_INTERNAL_SERVER_ERROR, body=None)
+            return result
+        result.update(
+            status=response.status_code,
+            headers={
+                name: value
+                for name, value in response.items()
+                if name not in ("Content-Type", "Content-Length", "Vary", "Allow")
+            },
+            body=response_data(response),
+        )
+        return result
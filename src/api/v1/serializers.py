@@ -88,7 +88,17 @@ class MembershipSerializer(serializers.ModelSerializer):
 class PlanSerializer(serializers.ModelSerializer):
     class Meta:
         model = Plan
-        fields = ["id", "code", "name", "description", "seat_limit", "trial_days", "roles_on_activation"]
+        fields = [
+            "id",
+            "code",
+            "name",
+            "description",
+            "seat_limit",
+            "trial_days",
+            "roles_on_activation",
+            "api_rate_per_minute",
+            "api_burst",
+        ]
 
 
 class SubscriptionSerializer(serializers.ModelSerializer):
@@ -125,8 +135,17 @@ class InvoiceSerializer(serializers.ModelSerializer):
 class ApiKeySerializer(serializers.ModelSerializer):
     class Meta:
         model = ApiKey
-        fields = ["id", "name", "prefix", "scopes", "revoked_at", "last_used_at", "created_at"]
-        read_only_fields = ["prefix", "revoked_at", "last_used_at", "created_at"]
+        fields = [
+            "id",
+            "name",
+            "prefix",
+            "scopes",
+            "revoked_at",
+            "last_used_at",
+            "request_count",
+            "created_at",
+        ]
+        read_only_fields = ["prefix", "revoked_at", "last_used_at", "request_count", "created_at"]
 
 
 class ApiKeyCreateSerializer(serializers.Serializer):
@@ -19,6 +19,7 @@ from integrations.api import (
     ConnectionStatusViewSet
 )
 from integrations.oauth.views import OAuthConnectView, OAuthCallbackView
+from .batch import BatchView
 from .views import csrf, login_view, logout_view, signup_view
 from .viewsets import (
     ApiKeyViewSet,
@@ -66,6 +67,8 @@ urlpatterns = [
     re_path(r"^auth/token/?$", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     re_path(r"^auth/token/refresh/?$", TokenRefreshView.as_view(), name="token_refresh"),
     re_path(r"^auth/token/verify/?$", TokenVerifyView.as_view(), name="token_verify"),
+    # Batched sub-requests
+    re_path(r"^batch/?$", BatchView.as_view(), name="batch"),
     # Legacy session auth (kept for backward compatibility)
     re_path(r"^csrf/?$", csrf, name="csrf"),
     re_path(r"^me/?$", ProfileViewSet.as_view({"get": "retrieve", "patch": "partial_update"}), name="me"),
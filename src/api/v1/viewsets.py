@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from django.utils import timezone
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
@@ -10,6 +9,8 @@ from api.models import ApiKey
 from api.permissions import PolicyPermission
 from billing.models import Invoice, Plan, Subscription
 from core.models import Membership, Permission, Role, ActivityLog
+from common.api.conditional import ConditionalGetMixin
+from common.api.pagination import CursorPaginationMixin
 from core.services.members import invite_members_to_org
 
 from .serializers import (
@@ -30,13 +31,20 @@ from .serializers import (
 )
 
 
-class ProfileViewSet(viewsets.GenericViewSet):
+class ProfileViewSet(ConditionalGetMixin, viewsets.GenericViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = UserSerializer
+    etag_scopes = ("core.user",)
 
     def get_object(self):
         return self.request.user
 
+    def get_etag_owner(self):
+        return self.request.user.pk
+
+    def get_last_modified(self):
+        return None
+
     def retrieve(self, request, *args, **kwargs):
         """Get current user profile."""
         serializer = self.get_serializer(self.get_object())
@@ -68,9 +76,15 @@ class ProfileViewSet(viewsets.GenericViewSet):
         return Response({"detail": "Password updated successfully."})
 
 
-class TenantViewSet(mixins.RetrieveModelMixin, mixins.UpdateModelMixin, viewsets.GenericViewSet):
+class TenantViewSet(
+    ConditionalGetMixin,
+    mixins.RetrieveModelMixin,
+    mixins.UpdateModelMixin,
+    viewsets.GenericViewSet,
+):
     permission_classes = [PolicyPermission]
     serializer_class = TenantSerializer
+    etag_scopes = ("multitenant.tenant",)
 
     def get_object(self):
         tenant = getattr(self.request, "tenant", None)
@@ -79,6 +93,9 @@ class TenantViewSet(mixins.RetrieveModelMixin, mixins.UpdateModelMixin, viewsets
             raise NotFound("No tenant context available.")
         return tenant
 
+    def get_last_modified(self):
+        return self.get_object().updated_at
+
     def retrieve(self, request, *args, **kwargs):
         """Get current tenant details."""
         return super().retrieve(request, *args, **kwargs)
@@ -191,13 +208,11 @@ class ApiKeyViewSet(mixins.ListModelMixin, mixins.CreateModelMixin, viewsets.Gen
 
     @action(detail=True, methods=["post"])
     def revoke(self, request, pk=None):
-        key = self.get_object()
-        key.revoked_at = timezone.now()
-        key.save(update_fields=["revoked_at"])
+        self.get_object().revoke()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class ActivityLogViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class ActivityLogViewSet(CursorPaginationMixin, mixins.ListModelMixin, viewsets.GenericViewSet):
     serializer_class = ActivityLogSerializer
     permission_classes = [PolicyPermission]
     permission_codename = "core.view_audit_logs"
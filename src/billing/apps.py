@@ -7,3 +7,6 @@ class BillingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "billing"
 
+    def ready(self):
+        from . import signals  # noqa: F401
+
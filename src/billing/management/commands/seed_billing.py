@@ -1,25 +1,29 @@
 from __future__ import annotations
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
 from billing.services.seed import seed_demo_plans
-from multitenant.models import Tenant
-from multitenant.schema import PUBLIC_SCHEMA_NAME, schema_context
+from multitenant.batch import OK, list_tenants, run_for_tenants
 
 
 class Command(BaseCommand):
     help = "Seed demo plans/prices for all tenants."
 
-    def handle(self, *args, **options):
-        with schema_context(PUBLIC_SCHEMA_NAME):
-            tenants = list(Tenant.objects.all())
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=1)
 
-        for tenant_public in tenants:
-            with schema_context(tenant_public.schema_name):
-                try:
-                    tenant_local = Tenant.objects.get(id=tenant_public.id)
-                except Tenant.DoesNotExist:
-                    continue
-                seed_demo_plans(tenant_local)
-                self.stdout.write(self.style.SUCCESS(f"Seeded billing for {tenant_local.slug}"))
+    def handle(self, *args, **options):
+        def progress(done, total, outcome):
+            if outcome.status == OK:
+                self.stdout.write(self.style.SUCCESS(f"Seeded billing for {outcome.slug}"))
 
+        report = run_for_tenants(
+            seed_demo_plans,
+            list_tenants(include_inactive=True),
+            processes=options["processes"],
+            progress=progress,
+        )
+        for outcome in report.failures:
+            self.stderr.write(self.style.ERROR(f"{outcome.slug}:\n{outcome.error}"))
+        if report.failures:
+            raise CommandError(f"Seeding failed for {len(report.failures)} tenant(s).")
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("billing", "0003_plan_max_diagrams_plan_max_requests_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="plan",
+            name="api_rate_per_minute",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Sustained API requests per minute (empty: default)",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="plan",
+            name="api_burst",
+            field=models.PositiveIntegerField(
+                blank=True, help_text="API requests allowed in a burst (empty: default)", null=True
+            ),
+        ),
+    ]
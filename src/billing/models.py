@@ -19,6 +19,12 @@ class Plan(models.Model):
     seat_limit = models.PositiveIntegerField(blank=True, null=True)
     max_diagrams = models.PositiveIntegerField(default=5, help_text="Max stored diagrams")
     max_requests = models.PositiveIntegerField(default=10, help_text="Max integration requests per month")
+    api_rate_per_minute = models.PositiveIntegerField(
+        blank=True, null=True, help_text="Sustained API requests per minute (empty: default)"
+    )
+    api_burst = models.PositiveIntegerField(
+        blank=True, null=True, help_text="API requests allowed in a burst (empty: default)"
+    )
     trial_days = models.PositiveIntegerField(default=0)
     roles_on_activation = models.JSONField(default=list, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Plan
+
+
+@receiver(post_save, sender=Plan, dispatch_uid="billing_plan_saved")
+@receiver(post_delete, sender=Plan, dispatch_uid="billing_plan_deleted")
+def plan_changed(sender, instance: Plan, **kwargs):
+    from api.throttling import invalidate_plan_limits
+
+    # Now (same transaction) and again once the change is visible to others.
+    invalidate_plan_limits(instance.organization_id, instance.code)
+    transaction.on_commit(lambda: invalidate_plan_limits(instance.organization_id, instance.code))
@@ -8,3 +8,5 @@ class CmsConfig(AppConfig):
     name = "cms"
     verbose_name = "CMS"
 
+    def ready(self):
+        from . import signals  # noqa: F401
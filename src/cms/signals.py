@@ -0,0 +1,18 @@
+"""Bump the API ETag version stamps (see ``common.api.conditional``) on changes."""
+
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from common.api.conditional import bump_version
+
+from .models import Category, ContentPage
+
+
+@receiver(post_save, sender=ContentPage, dispatch_uid="cms_page_etag_saved")
+@receiver(post_delete, sender=ContentPage, dispatch_uid="cms_page_etag_deleted")
+@receiver(post_save, sender=Category, dispatch_uid="cms_category_etag_saved")
+@receiver(post_delete, sender=Category, dispatch_uid="cms_category_etag_deleted")
+def cms_changed(sender, instance, **kwargs):
+    bump_version(sender._meta.label_lower, instance.organization_id)
@@ -13,6 +13,8 @@ from cms.serializers import (
     ContentPageListSerializer,
     MediaAssetSerializer,
 )
+from common.api.conditional import ConditionalGetMixin
+from common.api.fieldsets import SparseFieldsetsMixin
 
 
 class TenantScopedMixin:
@@ -44,12 +46,15 @@ class CategoryViewSet(TenantScopedMixin, viewsets.ModelViewSet):
     filterset_fields = ["parent"]
 
 
-class ContentPageViewSet(TenantScopedMixin, viewsets.ModelViewSet):
+class ContentPageViewSet(
+    ConditionalGetMixin, SparseFieldsetsMixin, TenantScopedMixin, viewsets.ModelViewSet
+):
     """CRUD for MDX content pages.
 
     Uses lightweight serializer for list, full serializer for detail/create/update.
     """
     queryset = ContentPage.objects.select_related("author", "category").all()
+    etag_scopes = ("cms.contentpage", "cms.category")
     permission_classes = [permissions.IsAuthenticated]
     search_fields = ["title", "excerpt"]
     filterset_fields = ["status", "category", "is_featured"]
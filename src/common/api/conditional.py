@@ -0,0 +1,141 @@
+"""
+Conditional GET (``ETag``/``Last-Modified`` → 304) for polled API resources.
+
+``ConditionalGetMixin`` computes the validators right after authentication,
+permissions and throttling, before the handler runs, so an unchanged
+resource costs one cache read (plus, for detail routes, one indexed
+``updated_at`` lookup) instead of its queries and serialization.
+
+Validators come from:
+
+- per-owner version stamps: ``bump_version(scope, owner)`` is called from
+  model signals (``scope`` is usually the model label, ``owner`` the tenant
+  id) and ``etag_scopes`` lists the stamps a view's payload depends on, so
+  any change in a tenant's courses changes the ETag of the course list;
+- the ``updated_at`` (``last_modified_field``) of the object on detail
+  routes, or whatever ``get_last_modified()`` returns.
+
+A stamp is the time of the last change in microseconds, so it also feeds
+``Last-Modified``. Object-level permission checks run in ``get_object()``
+and are therefore skipped on 304s; don't use the mixin where they matter.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+CACHE_KEY_PREFIX = "etag:version:"
+
+
+def version_cache_key(scope: str, owner) -> str:
+    return f"{CACHE_KEY_PREFIX}{scope}:{owner}"
+
+
+def _now_us() -> int:
+    return time.time_ns() // 1000
+
+
+def bump_version(scope: str, owner) -> None:
+    """Mark ``scope`` changed for ``owner`` now and again once the transaction commits."""
+    key = version_cache_key(scope, owner)
+    cache.set(key, _now_us(), None)
+    transaction.on_commit(lambda: cache.set(key, _now_us(), None))
+
+
+def get_versions(scopes, owner) -> list[int]:
+    """Current stamps of ``scopes`` for ``owner`` (one cache round trip when warm)."""
+    keys = [version_cache_key(scope, owner) for scope in scopes]
+    found = cache.get_many(keys)
+    versions = []
+    for key in keys:
+        if key not in found:
+            # Unknown (new or evicted): start now, which only ever forces a refetch.
+            cache.add(key, _now_us(), None)
+            found[key] = cache.get(key) or _now_us()
+        versions.append(found[key])
+    return versions
+
+
+class ConditionalResponse(Exception):
+    """Carries the 304 (or 412) answer out of ``initial()``."""
+
+    def __init__(self, response):
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """Answer ``If-None-Match``/``If-Modified-Since`` with 304 before the handler runs."""
+
+    conditional_actions: tuple[str, ...] = ("list", "retrieve")
+    etag_scopes: tuple[str, ...] = ()
+    last_modified_field: str | None = "updated_at"
+
+    def get_etag_owner(self):
+        tenant = getattr(self.request, "tenant", None)
+        return tenant.pk if tenant is not None else None
+
+    def get_last_modified(self) -> datetime | None:
+        """``last_modified_field`` of the object a detail route points at."""
+        lookup_url_kwarg = getattr(self, "lookup_url_kwarg", None) or getattr(
+            self, "lookup_field", None
+        )
+        if not self.last_modified_field or lookup_url_kwarg not in self.kwargs:
+            return None
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        return queryset.values_list(self.last_modified_field, flat=True).first()
+
+    def get_conditional_validators(self) -> tuple[str, int | None]:
+        """(weak ETag, Last-Modified as a Unix timestamp or None)."""
+        request = self.request
+        stamps = get_versions(self.etag_scopes, self.get_etag_owner())
+        last_modified = self.get_last_modified()
+        if last_modified is not None:
+            stamps.append(int(last_modified.timestamp() * 1_000_000))
+        parts = [
+            request.get_full_path(),
+            getattr(request.user, "pk", None),
+            getattr(request, "accepted_media_type", ""),
+            *stamps,
+        ]
+        digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+        modified = max(stamps) // 1_000_000 if stamps else None
+        return f'W/"{digest}"', modified
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._validators = None
+        action = getattr(self, "action", None)
+        if request.method not in ("GET", "HEAD") or action not in self.conditional_actions:
+            return
+        self._validators = self.get_conditional_validators()
+        etag, last_modified = self._validators
+        response = get_conditional_response(request._request, etag, last_modified)
+        if response is not None:
+            raise ConditionalResponse(self._set_validators(response))
+
+    def handle_exception(self, exc):
+        if isinstance(exc, ConditionalResponse):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, "_validators", None) and response.status_code == 200:
+            self._set_validators(response)
+        return response
+
+    def _set_validators(self, response):
+        etag, last_modified = self._validators
+        response.headers.setdefault("ETag", etag)
+        if last_modified is not None:
+            response.headers.setdefault("Last-Modified", http_date(last_modified))
+        return response
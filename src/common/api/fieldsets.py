@@ -0,0 +1,113 @@
+"""
+Sparse fieldsets for read endpoints: ``?fields=`` / ``?exclude=``.
+
+``SparseFieldsetsMixin`` drops the serializer fields the client did not ask
+for and defers the model columns that no remaining field reads, so a list
+of ids and titles does not pull MDX bodies or JSON columns from Postgres::
+
+    GET /api/v1/cms/pages/?fields=id,title,slug
+    GET /api/v1/lms/courses/?exclude=description,tags
+
+Column usage is derived from each field's ``source``. Relations are never
+deferred (they are usually ``select_related``). A ``SerializerMethodField``
+reads nothing unless the serializer declares it in ``Meta.sparse_sources``
+(``{"author_name": ("author",)}``); any other field whose source is not a
+model field turns column deferral off for that serializer.
+"""
+
+from __future__ import annotations
+
+from django.core.exceptions import FieldDoesNotExist
+from django.utils.translation import gettext as _
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+FIELDS_PARAM = "fields"
+EXCLUDE_PARAM = "exclude"
+
+
+def _param(query_params, name: str) -> list[str] | None:
+    raw = query_params.get(name)
+    if raw is None:
+        return None
+    return [part.strip() for part in raw.split(",") if part.strip()]
+
+
+def selected_fields(available, query_params) -> set[str]:
+    """Names from ``available`` kept by ``?fields=``/``?exclude=``; 400 on unknown names."""
+    available = set(available)
+    keep = set(available)
+    for name in (FIELDS_PARAM, EXCLUDE_PARAM):
+        requested = _param(query_params, name)
+        if requested is None:
+            continue
+        unknown = sorted(set(requested) - available)
+        if unknown:
+            raise ValidationError({name: [_("Unknown fields: %s") % ", ".join(unknown)]})
+        keep = keep & set(requested) if name == FIELDS_PARAM else keep - set(requested)
+    return keep
+
+
+def deferrable_columns(serializer, model, always_load=()) -> list[str]:
+    """Concrete, non-relational columns of ``model`` that no field of ``serializer`` reads."""
+    sparse_sources = getattr(getattr(serializer, "Meta", None), "sparse_sources", {})
+    needed = set(always_load)
+    for name, field in serializer.fields.items():
+        if name in sparse_sources:
+            needed.update(sparse_sources[name])
+            continue
+        if isinstance(field, serializers.SerializerMethodField):
+            continue
+        if field.source == "*":
+            return []
+        root = field.source_attrs[0]
+        try:
+            model._meta.get_field(root)
+        except FieldDoesNotExist:
+            return []
+        needed.add(root)
+    return [
+        field.name
+        for field in model._meta.concrete_fields
+        if not field.primary_key and not field.is_relation and field.name not in needed
+    ]
+
+
+class SparseFieldsetsMixin:
+    """Honour ``?fields=``/``?exclude=`` on read actions, in the payload and the SQL."""
+
+    sparse_fieldsets_actions: tuple[str, ...] = ("list", "retrieve")
+    # Columns read by the view itself (not by the serializer).
+    sparse_fieldsets_always_load: tuple[str, ...] = ()
+
+    def _sparse_enabled(self) -> bool:
+        return getattr(self, "action", None) in self.sparse_fieldsets_actions
+
+    def _sparsify(self, serializer):
+        fields = getattr(serializer, "child", serializer).fields
+        keep = selected_fields(fields.keys(), self.request.query_params)
+        for name in list(fields.keys()):
+            if name not in keep:
+                fields.pop(name)
+        return serializer
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if self._sparse_enabled():
+            self._sparsify(serializer)
+        return serializer
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self._sparse_enabled():
+            return queryset
+        serializer = self._sparsify(
+            self.get_serializer_class()(context=self.get_serializer_context())
+        )
+        always_load = list(self.sparse_fieldsets_always_load)
+        ordering = getattr(self.paginator, "ordering", None)
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        always_load += [name.lstrip("-") for name in ordering or ()]
+        deferred = deferrable_columns(serializer, queryset.model, always_load)
+        return queryset.defer(*deferred) if deferred else queryset
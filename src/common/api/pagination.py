@@ -0,0 +1,43 @@
+"""
+Keyset (cursor) pagination for large tenant-scoped lists.
+
+``PageNumberPagination`` runs a ``COUNT(*)`` and an ``OFFSET`` scan per page,
+so deep pages of big tables get slower and slower. ``CursorPaginationMixin``
+lets a viewset serve the same list by cursor instead: each page continues
+from the last row seen (``WHERE created_at < ...``) along an ordering backed
+by a composite ``(organization, -created_at, id)`` index, so page 1000
+costs the same as page 1 and there is no count.
+
+It is opt-in per request, so existing clients keep page numbers: send
+``?cursor=`` (empty) for the first page and follow ``next``/``previous``.
+"""
+
+from __future__ import annotations
+
+from rest_framework.pagination import CursorPagination
+
+
+class TenantCursorPagination(CursorPagination):
+    ordering = ("-created_at", "id")
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+    def __init__(self, ordering=None):
+        if ordering is not None:
+            self.ordering = ordering
+
+
+class CursorPaginationMixin:
+    """Serve ``list`` with keyset pagination when the request asks for a cursor."""
+
+    cursor_ordering: tuple[str, ...] = ("-created_at", "id")
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            params = getattr(getattr(self, "request", None), "query_params", {})
+            if TenantCursorPagination.cursor_query_param in params:
+                self._paginator = TenantCursorPagination(ordering=self.cursor_ordering)
+            else:
+                return super().paginator
+        return self._paginator
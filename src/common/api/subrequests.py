@@ -0,0 +1,68 @@
+"""
+In-process sub-requests that reuse an already resolved request context.
+
+Used by ``/api/v1/batch`` and the MCP tool dispatcher to call DRF views
+directly: the sub-request carries the parent's ``tenant``, session and
+user, and DRF's forced authentication (``_force_auth_user``/
+``_force_auth_token``, honoured by ``rest_framework.request.Request``) skips
+re-authenticating. Views still run their own permissions and throttles.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+
+from django.http import HttpRequest, QueryDict
+from rest_framework.response import Response
+
+# Headers of the parent request that must not leak into sub-requests.
+DROPPED_META = ("CONTENT_LENGTH", "CONTENT_TYPE", "HTTP_IF_NONE_MATCH", "HTTP_IF_MODIFIED_SINCE")
+
+
+def make_subrequest(
+    parent,
+    method: str,
+    path: str,
+    query: str = "",
+    data=None,
+    headers: dict[str, str] | None = None,
+) -> HttpRequest:
+    """A Django request for ``method path?query`` in the context of DRF request ``parent``."""
+    outer = parent._request
+    sub = HttpRequest()
+    sub.method = method.upper()
+    sub.path = sub.path_info = path
+    sub.META = {key: value for key, value in outer.META.items() if key not in DROPPED_META}
+    sub.META.update(REQUEST_METHOD=sub.method, PATH_INFO=path, QUERY_STRING=query)
+    for name, value in (headers or {}).items():
+        sub.META["HTTP_" + name.upper().replace("-", "_")] = value
+    sub.GET = QueryDict(query)
+    sub.COOKIES = outer.COOKIES
+    for attr in ("tenant", "session", "user"):
+        if hasattr(outer, attr):
+            setattr(sub, attr, getattr(outer, attr))
+
+    body = b"" if data is None else json.dumps(data).encode()
+    sub._body = body
+    sub._stream = io.BytesIO(body)
+    if body:
+        sub.META.update(CONTENT_TYPE="application/json", CONTENT_LENGTH=str(len(body)))
+
+    sub._force_auth_user = parent.user
+    sub._force_auth_token = parent.auth
+    return sub
+
+
+def response_data(response):
+    """The payload of a view response, without rendering DRF responses to bytes."""
+    if isinstance(response, Response):
+        return response.data
+    if getattr(response, "is_rendered", True) is False:
+        response.render()
+    content = response.content
+    if not content:
+        return None
+    if response.get("Content-Type", "").startswith("application/json"):
+        return json.loads(content)
+    return content.decode(response.charset or "utf-8", errors="replace")
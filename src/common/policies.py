@@ -1,17 +1,65 @@
 from __future__ import annotations
 
+import zlib
+from dataclasses import dataclass
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
 
+CACHE_KEY_PREFIX = "policies:"
+_NO_MEMBERSHIP = "__none__"
+
+# Bumped on every invalidation so per-request memos never outlive a change
+# made in the same process (e.g. a membership created earlier in the request).
+_generation = 0
+
 
 class PolicyError(Exception):
     pass
 
 
+class StaleAuthorization(PolicyError):
+    """Authorization claims no longer match the user's role: refresh the token."""
+
+
+@dataclass(frozen=True)
+class MemberRole:
+    """The active membership of a user in an organization, as policies see it."""
+
+    role_id: int
+    slug: str
+    codenames: frozenset[str]
+
+
 def allow_all(*_args, **_kwargs) -> bool:
     return True
 
 
+def _timeout() -> int:
+    return int(getattr(settings, "POLICY_CACHE_TIMEOUT", 300))
+
+
+def member_cache_key(organization_id, user_id) -> str:
+    return f"{CACHE_KEY_PREFIX}member:{organization_id}:{user_id}"
+
+
+def role_cache_key(organization_id, role_id) -> str:
+    return f"{CACHE_KEY_PREFIX}role:{organization_id}:{role_id}"
+
+
+def invalidate_member(organization_id, user_id) -> None:
+    global _generation
+    _generation += 1
+    cache.delete(member_cache_key(organization_id, user_id))
+
+
+def invalidate_role(organization_id, role_id) -> None:
+    global _generation
+    _generation += 1
+    cache.delete(role_cache_key(organization_id, role_id))
+
+
 def get_membership(user, organization):
     if user is None or organization is None or not user.is_authenticated:
         return None
@@ -25,14 +73,109 @@ def get_membership(user, organization):
         return None
 
 
+def _load_role(organization_id, role_id) -> dict:
+    from core.models import Role
+
+    timeout = _timeout()
+    key = role_cache_key(organization_id, role_id)
+    data = cache.get(key) if timeout > 0 else None
+    if data is None or "version" not in data:
+        role = Role.objects.filter(pk=role_id).values("slug").first() or {"slug": ""}
+        codenames = sorted(
+            Role.permissions.through.objects.filter(role_id=role_id).values_list(
+                "permission__codename", flat=True
+            )
+        )
+        data = {
+            "slug": role["slug"],
+            "codenames": codenames,
+            "version": role_version(role["slug"], codenames),
+        }
+        if timeout > 0:
+            cache.set(key, data, timeout)
+    return data
+
+
+def _load_member_role(organization_id, user_id) -> MemberRole | None:
+    from core.models import Membership
+
+    timeout = _timeout()
+    key = member_cache_key(organization_id, user_id)
+    role_id = cache.get(key) if timeout > 0 else None
+    if role_id is None:
+        role_id = (
+            Membership.objects.filter(
+                user_id=user_id, organization_id=organization_id, is_active=True
+            )
+            .values_list("role_id", flat=True)
+            .first()
+        )
+        if timeout > 0:
+            cache.set(key, role_id or _NO_MEMBERSHIP, timeout)
+    if role_id in (None, _NO_MEMBERSHIP):
+        return None
+    data = _load_role(organization_id, role_id)
+    return MemberRole(role_id, data["slug"], frozenset(data["codenames"]))
+
+
+def role_version(slug: str, codenames) -> int:
+    """Stamp that changes whenever a role's slug or permission set changes."""
+    return zlib.crc32(f"{slug}:{','.join(sorted(codenames))}".encode())
+
+
+def _memo(user) -> dict:
+    generation, memo = getattr(user, "_policy_cache", (None, None))
+    if generation != _generation:
+        memo = {}
+        user._policy_cache = (_generation, memo)
+    return memo
+
+
+def get_member_role(user, organization) -> MemberRole | None:
+    """
+    Role and permission codenames of ``user`` in ``organization``.
+
+    Resolved once per user object (i.e. once per request), then from the
+    shared cache per (organization, user) and (organization, role); the
+    signal handlers in ``core.signals`` invalidate both.
+    """
+    if user is None or organization is None or not user.is_authenticated:
+        return None
+    memo = _memo(user)
+    if organization.pk not in memo:
+        memo[organization.pk] = _load_member_role(organization.pk, user.pk)
+    return memo[organization.pk]
+
+
+def member_role_from_claims(user, organization, claims) -> MemberRole:
+    """
+    Trust the role carried in token ``claims`` (see ``api.serializers_auth``).
+
+    The claims are accepted while the cached membership still points at role
+    ``rid`` and that role's version equals ``rv``: one cache round trip, no
+    queries. A cold cache is refilled from the database. Raises
+    ``StaleAuthorization`` when the role or its permissions have changed.
+    """
+    member_key = member_cache_key(organization.pk, user.pk)
+    role_key = role_cache_key(organization.pk, claims.get("rid"))
+    cached = cache.get_many([member_key, role_key]) if _timeout() > 0 else {}
+    role_id, data = cached.get(member_key), cached.get(role_key)
+    if role_id is None or data is None or "version" not in data:
+        member_role = _load_member_role(organization.pk, user.pk)
+        role_id = member_role.role_id if member_role else None
+        data = _load_role(organization.pk, role_id) if member_role else None
+    if role_id != claims.get("rid") or data is None or data["version"] != claims.get("rv"):
+        raise StaleAuthorization
+    member_role = MemberRole(role_id, data["slug"], frozenset(data["codenames"]))
+    _memo(user)[organization.pk] = member_role
+    return member_role
+
 
 def has_permission(user, organization, codename: str) -> bool:
     if user is not None and getattr(user, "is_superuser", False):
         return True
-    membership = get_membership(user, organization)
-    if membership is None:
-        return False
-    return membership.role.permissions.filter(codename=codename).exists()
+    member_role = get_member_role(user, organization)
+    return member_role is not None and codename in member_role.codenames
 
 
 def require_permission(user, organization, codename: str) -> None:
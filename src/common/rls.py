@@ -4,13 +4,33 @@ PostgreSQL Row-Level Security (RLS) utilities.
 Provides helpers to enable RLS on tenant-scoped tables and generate
 security policies that restrict access based on the current tenant.
 
-The middleware sets `app.tenant_id` via SET LOCAL on each request,
-and RLS policies use this to filter rows automatically.
+The middleware sets `app.tenant_id` on each request through
+`common.session_state`, which skips values the connection already has;
+RLS policies use it to filter rows automatically.
+
+Policies compare the tenant column against a typed, once-per-query value
+(`organization_id = (SELECT ...::bigint)`) so Postgres can use the
+column's index. The admin bypass is a policy granted to
+`RLS_BYPASS_ROLE` (switched to with `SET ROLE`) instead of a second
+permissive policy on a setting: permissive policies are OR-ed into every
+query, and an OR with a non-indexable term would defeat the index again.
+The app's role is granted the bypass role `WITH INHERIT FALSE`: with an
+inherited membership the bypass policy would apply to every query.
+
+In shared-schema mode (`MULTITENANT_MODE = "shared"`) RLS is the only
+isolation: policies are applied after every `migrate` and the tenant id is
+set per transaction (`tenant_transaction`), so it can never outlive the
+request that set it, even behind a transaction-pooling proxy.
 """
 
 from __future__ import annotations
 
-from django.db import connection
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from .session_state import ROLE, TENANT_ID, apply_session_settings
 
 # Tables that have an `organization_id` column pointing to multitenant_tenant
 TENANT_SCOPED_TABLES = [
@@ -65,31 +85,75 @@ def get_fk_column(table_name: str) -> str:
     return SPECIAL_FK_TABLES.get(table_name, "organization_id")
 
 
-def enable_rls_sql() -> list[str]:
-    """Generate SQL statements to enable RLS on all tenant-scoped tables."""
+def tenant_predicate(fk_col: str) -> str:
+    """Index-friendly tenant check: typed, evaluated once per query (InitPlan)."""
+    return f"{fk_col} = (SELECT NULLIF(current_setting('{TENANT_ID}', true), '')::bigint)"
+
+
+def legacy_tenant_predicate(fk_col: str) -> str:
+    """The original text comparison, kept for the EXPLAIN comparison only."""
+    return f"{fk_col}::text = current_setting('{TENANT_ID}', true)"
+
+
+def get_bypass_role() -> str:
+    return getattr(settings, "RLS_BYPASS_ROLE", "rls_bypass")
+
+
+def bypass_role_sql(role: str | None = None, member: str = "CURRENT_USER") -> list[str]:
+    """
+    Create the bypass role (if missing) and let ``member`` switch to it.
+
+    The membership is not inherited, so the bypass policy only applies after
+    ``SET ROLE``. ``INHERIT FALSE`` needs PostgreSQL 16; on older servers the
+    membership is revoked instead and the bypass is unavailable.
+    """
+    role = role or get_bypass_role()
+    return [
+        f"""DO $$ BEGIN
+                IF to_regrole('{role}') IS NULL THEN
+                    CREATE ROLE "{role}" NOLOGIN;
+                END IF;
+            END $$;""",
+        f"""DO $$ BEGIN
+                IF current_setting('server_version_num')::int >= 160000 THEN
+                    EXECUTE 'GRANT "{role}" TO {member} WITH INHERIT FALSE';
+                ELSE
+                    EXECUTE 'REVOKE "{role}" FROM {member}';
+                    RAISE WARNING 'RLS bypass role "{role}" needs PostgreSQL 16';
+                END IF;
+            END $$;""",
+        f'GRANT USAGE ON SCHEMA public TO "{role}";',
+        f'GRANT SELECT, INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA public TO "{role}";',
+        f'GRANT USAGE, SELECT, UPDATE ON ALL SEQUENCES IN SCHEMA public TO "{role}";',
+    ]
+
+
+def enable_rls_sql(tables: list[str] | None = None) -> list[str]:
+    """Generate SQL statements to enable RLS on tenant-scoped tables (default: all)."""
+    role = get_bypass_role()
     statements = []
-    for table in TENANT_SCOPED_TABLES:
-        fk_col = get_fk_column(table)
+    for table in TENANT_SCOPED_TABLES if tables is None else tables:
+        predicate = tenant_predicate(get_fk_column(table))
         statements.extend([
             f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY;",
             f"ALTER TABLE {table} FORCE ROW LEVEL SECURITY;",
             # Policy: tenant isolation
             f"DROP POLICY IF EXISTS tenant_isolation ON {table};",
             f"""CREATE POLICY tenant_isolation ON {table}
-                USING ({fk_col}::text = current_setting('app.tenant_id', true))
-                WITH CHECK ({fk_col}::text = current_setting('app.tenant_id', true));""",
-            # Policy: superuser bypass
+                USING ({predicate})
+                WITH CHECK ({predicate});""",
+            # Policy: superuser bypass, only for sessions running as the bypass role
             f"DROP POLICY IF EXISTS superuser_bypass ON {table};",
-            f"""CREATE POLICY superuser_bypass ON {table}
-                USING (current_setting('app.rls_bypass', true) = 'true');""",
+            f"""CREATE POLICY superuser_bypass ON {table} TO "{role}"
+                USING (true) WITH CHECK (true);""",
         ])
     return statements
 
 
-def disable_rls_sql() -> list[str]:
+def disable_rls_sql(tables: list[str] | None = None) -> list[str]:
     """Generate SQL statements to disable RLS (for rollback)."""
     statements = []
-    for table in TENANT_SCOPED_TABLES:
+    for table in TENANT_SCOPED_TABLES if tables is None else tables:
         statements.extend([
             f"DROP POLICY IF EXISTS tenant_isolation ON {table};",
             f"DROP POLICY IF EXISTS superuser_bypass ON {table};",
@@ -100,18 +164,110 @@ def disable_rls_sql() -> list[str]:
 
 def set_tenant_id(tenant_id: int | str) -> None:
     """Set the current tenant ID for RLS policy evaluation."""
-    if connection.vendor != "postgresql":
-        return
-    with connection.cursor() as cursor:
-        cursor.execute("SET LOCAL app.tenant_id = %s", [str(tenant_id)])
+    apply_session_settings({TENANT_ID: str(tenant_id)})
 
 
 def set_rls_bypass(enabled: bool = True) -> None:
-    """Enable/disable RLS bypass for superuser/admin operations."""
-    if connection.vendor != "postgresql":
-        return
+    """
+    Enable/disable RLS bypass for superuser/admin operations (``SET ROLE``).
+
+    Only shared mode syncs the policies and creates the role; in the other
+    modes there is nothing to lift and this is a no-op.
+    """
+    if shared_schema_mode():
+        apply_session_settings({ROLE: get_bypass_role() if enabled else "none"})
+
+
+def shared_schema_mode() -> bool:
+    return getattr(settings, "MULTITENANT_MODE", "off") == "shared"
+
+
+def existing_tenant_tables(using: str = DEFAULT_DB_ALIAS) -> list[str]:
+    """
+    Tenant-scoped tables that exist and carry their tenant column.
+
+    Optional apps may be off, and a few listed tables (permission catalogs,
+    join tables) are scoped through a parent row rather than a column.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT table_name, column_name FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = ANY(%s)
+            """,
+            [TENANT_SCOPED_TABLES],
+        )
+        columns = set(cursor.fetchall())
+    return [table for table in TENANT_SCOPED_TABLES if (table, get_fk_column(table)) in columns]
+
+
+def rls_bypass_available(using: str = DEFAULT_DB_ALIAS) -> bool:
+    """True when the bypass role exists and the current user may switch to it."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT CASE WHEN to_regrole(%s) IS NULL THEN false"
+            " ELSE pg_has_role(current_user, %s, 'MEMBER') END",
+            [get_bypass_role(), get_bypass_role()],
+        )
+        return bool(cursor.fetchone()[0])
+
+
+def sync_rls_policies(using: str = DEFAULT_DB_ALIAS, enable: bool = True) -> list[str]:
+    """Apply (or drop) the policies on every existing tenant table. Idempotent."""
+    tables = existing_tenant_tables(using)
+    statements = bypass_role_sql() + enable_rls_sql(tables) if enable else disable_rls_sql(tables)
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+    return tables
+
+
+def set_transaction_tenant(
+    tenant_id: int | str | None, bypass: bool = False, using: str = DEFAULT_DB_ALIAS
+) -> None:
+    """
+    Set the tenant (and bypass role) for the current transaction only (``is_local``).
+
+    PostgreSQL drops them at COMMIT/ROLLBACK, so nothing leaks to the next
+    user of the connection. Must run inside ``transaction.atomic``.
+    """
+    connection = connections[using]
+    if not connection.in_atomic_block:
+        raise transaction.TransactionManagementError(
+            "set_transaction_tenant() must be called inside transaction.atomic()."
+        )
     with connection.cursor() as cursor:
         cursor.execute(
-            "SET LOCAL app.rls_bypass = %s",
-            ["true" if enabled else "false"],
+            "SELECT set_config(%s, %s, true), set_config(%s, %s, true)",
+            [
+                TENANT_ID,
+                "" if tenant_id is None else str(tenant_id),
+                ROLE,
+                get_bypass_role() if bypass else "none",
+            ],
+        )
+
+
+@contextmanager
+def tenant_transaction(
+    tenant_id: int | str | None, bypass: bool = False, using: str = DEFAULT_DB_ALIAS
+):
+    """Run the block in a transaction scoped to ``tenant_id`` by the RLS policies."""
+    with transaction.atomic(using=using):
+        set_transaction_tenant(tenant_id, bypass=bypass, using=using)
+        yield
+
+
+@contextmanager
+def rls_bypass(using: str = DEFAULT_DB_ALIAS):
+    """Lift the tenant policies for the block (cross-tenant registry lookups)."""
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT current_setting(%s), set_config(%s, %s, true)",
+            [ROLE, ROLE, get_bypass_role()],
         )
+        previous = cursor.fetchone()[0]
+        try:
+            yield
+        finally:
+            cursor.execute("SELECT set_config(%s, %s, true)", [ROLE, previous])
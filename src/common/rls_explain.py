@@ -0,0 +1,119 @@
+"""
+EXPLAIN harness for the RLS tenant predicates.
+
+For each tenant-scoped table, plans a small set of representative queries
+with the tenant predicate applied, once with the legacy text comparison and
+once with the compiled, typed one, and reports which scan each plan uses.
+
+The predicate is injected as a ``WHERE`` clause instead of enabling the
+policies: it is the same qualifier Postgres adds for a policy, and it works
+for superusers (whom RLS never applies to). Sequential scans are disabled
+for the planning transaction so small development tables still reveal
+whether an index path exists at all.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from .rls import (
+    existing_tenant_tables,
+    get_fk_column,
+    legacy_tenant_predicate,
+    tenant_predicate,
+)
+from .session_state import TENANT_ID
+
+VARIANTS = {
+    "legacy": legacy_tenant_predicate,
+    "typed": tenant_predicate,
+}
+
+# name -> SQL template; {table} and {predicate} are filled in per table.
+REPRESENTATIVE_QUERIES = {
+    "list": "SELECT * FROM {table} WHERE {predicate} LIMIT 50",
+    "count": "SELECT count(*) FROM {table} WHERE {predicate}",
+    "lookup": "SELECT * FROM {table} WHERE {predicate} AND id = 1",
+}
+
+INDEX_NODES = {"Index Scan", "Index Only Scan", "Bitmap Heap Scan", "Bitmap Index Scan"}
+
+
+@dataclass(frozen=True)
+class PlanResult:
+    table: str
+    query: str
+    variant: str
+    node_type: str
+    index_name: str
+    total_cost: float
+
+    @property
+    def uses_index(self) -> bool:
+        return self.node_type in INDEX_NODES
+
+
+def _scan_node(plan: dict, table: str) -> dict | None:
+    """Return the node scanning ``table`` (depth first), or None."""
+    if plan.get("Relation Name") == table:
+        return plan
+    for child in plan.get("Plans", []):
+        found = _scan_node(child, table)
+        if found is not None:
+            return found
+    return None
+
+
+def _index_name(node: dict) -> str:
+    if node.get("Index Name"):
+        return node["Index Name"]
+    for child in node.get("Plans", []):
+        name = _index_name(child)
+        if name:
+            return name
+    return ""
+
+
+def explain_query(
+    table: str, query: str, variant: str, tenant_id: int = 1, using: str = DEFAULT_DB_ALIAS
+) -> PlanResult:
+    predicate = VARIANTS[variant](get_fk_column(table))
+    sql = REPRESENTATIVE_QUERIES[query].format(table=table, predicate=predicate)
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('enable_seqscan', 'off', true), set_config(%s, %s, true)",
+            [TENANT_ID, str(tenant_id)],
+        )
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+        raw = cursor.fetchone()[0]
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+    node = _scan_node(plan, table) or plan
+    return PlanResult(
+        table=table,
+        query=query,
+        variant=variant,
+        node_type=node["Node Type"],
+        index_name=_index_name(node),
+        total_cost=float(plan["Total Cost"]),
+    )
+
+
+def explain_tables(
+    tables: list[str] | None = None, tenant_id: int = 1, using: str = DEFAULT_DB_ALIAS
+) -> list[PlanResult]:
+    """Plan every representative query, both variants, for ``tables`` (default: all)."""
+    tables = existing_tenant_tables(using) if tables is None else tables
+    return [
+        explain_query(table, query, variant, tenant_id=tenant_id, using=using)
+        for table in tables
+        for query in REPRESENTATIVE_QUERIES
+        for variant in VARIANTS
+    ]
+
+
+def index_regressions(results: list[PlanResult]) -> list[PlanResult]:
+    """Typed-predicate plans that still scan the whole table."""
+    return [r for r in results if r.variant == "typed" and not r.uses_index]
@@ -0,0 +1,121 @@
+"""
+Per-connection tracking of session settings (search_path, RLS variables, role).
+
+Tenant switching used to issue one ``SET`` per setting, every time, even
+when the connection already had the right values. ``apply_session_settings``
+remembers what each connection has been given and only sends the settings
+that actually change, all of them in a single ``SELECT set_config(...)``.
+
+Values are applied at session level (``is_local = false``). A session-level
+setting changed inside a transaction is reverted by PostgreSQL if that
+transaction (or savepoint) rolls back, so changes made inside ``atomic``
+blocks are tracked as provisional: they are trusted while their on-commit
+marker is still queued on the connection, promoted once it runs, and
+forgotten if the block is rolled back.
+"""
+
+from __future__ import annotations
+
+from django.db import connection as default_connection
+
+SEARCH_PATH = "search_path"
+TENANT_ID = "app.tenant_id"
+ROLE = "role"  # RLS bypass in shared mode: SET ROLE to settings.RLS_BYPASS_ROLE
+
+
+class _Pending:
+    """On-commit marker for settings applied inside a transaction."""
+
+    def __init__(self, values: dict[str, str]) -> None:
+        self.values = values
+        self.committed = False
+
+    def __call__(self) -> None:
+        self.committed = True
+
+
+class _SessionState:
+    def __init__(self, raw) -> None:
+        self.raw = raw
+        self.known: dict[str, str] = {}
+        self.pending: list[_Pending] = []
+
+
+def _state(connection) -> _SessionState:
+    raw = connection.connection
+    state = getattr(connection, "_session_state", None)
+    if state is None or state.raw is not raw:
+        # New or reconnected DB session: nothing has been applied yet.
+        state = _SessionState(raw)
+        connection._session_state = state
+    return state
+
+
+def _effective(connection, state: _SessionState) -> dict[str, str]:
+    values = dict(state.known)
+    queued = {id(entry[1]) for entry in connection.run_on_commit}
+    still_pending = []
+    for marker in state.pending:
+        if marker.committed:
+            state.known.update(marker.values)
+        elif id(marker) in queued:
+            still_pending.append(marker)
+        else:
+            # Rolled back: PostgreSQL restored the earlier values.
+            continue
+        values.update(marker.values)
+    state.pending = still_pending
+    return values
+
+
+def current_session_settings(connection=None) -> dict[str, str]:
+    """Return the settings this process believes are active on ``connection``."""
+    connection = connection or default_connection
+    if connection.connection is None:
+        return {}
+    state = _state(connection)
+    return _effective(connection, state)
+
+
+def apply_session_settings(values: dict[str, str], connection=None) -> bool:
+    """
+    Bring ``connection`` to ``values`` with at most one query.
+
+    Returns True when a statement was sent, False when every setting was
+    already in place (or the backend is not PostgreSQL).
+    """
+    connection = connection or default_connection
+    if connection.vendor != "postgresql":
+        return False
+
+    connection.ensure_connection()
+    state = _state(connection)
+    current = _effective(connection, state)
+    changes = {name: value for name, value in values.items() if current.get(name) != value}
+    if not changes:
+        return False
+
+    columns = ", ".join("set_config(%s, %s, false)" for _ in changes)
+    params: list[str] = []
+    for name, value in changes.items():
+        params.extend([name, value])
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {columns}", params)
+
+    if connection.in_atomic_block:
+        marker = _Pending(changes)
+        state.pending.append(marker)
+        connection.on_commit(marker)
+    elif connection.get_autocommit():
+        state.known.update(changes)
+    else:
+        # Manual transaction management: we cannot tell when this sticks.
+        forget_session_settings(connection)
+    return True
+
+
+def forget_session_settings(connection=None) -> None:
+    """Drop tracked state, e.g. after running raw ``SET``/``RESET``/``DISCARD``."""
+    connection = connection or default_connection
+    if hasattr(connection, "_session_state"):
+        del connection._session_state
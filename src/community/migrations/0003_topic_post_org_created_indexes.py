@@ -0,0 +1,25 @@
+# Generated by Django 5.2.12 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("community", "0002_alter_forum_unique_together_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="topic",
+            index=models.Index(
+                fields=["organization", "-created_at", "id"], name="community_tpc_org_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["organization", "-created_at", "id"], name="community_post_org_created_idx"
+            ),
+        ),
+    ]
@@ -98,6 +98,9 @@ class Topic(models.Model):
         ordering = ["-is_pinned", "-last_activity_at"]
         indexes = [
             models.Index(fields=["organization", "space", "-last_activity_at"]),
+            models.Index(
+                fields=["organization", "-created_at", "id"], name="community_tpc_org_created_idx"
+            ),
         ]
 
     def save(self, *args, **kwargs):
@@ -135,6 +138,11 @@ class Post(models.Model):
 
     class Meta:
         ordering = ["-is_answer", "created_at"]
+        indexes = [
+            models.Index(
+                fields=["organization", "-created_at", "id"], name="community_post_org_created_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.topic_id}:{self.author_id}:{self.created_at:%Y-%m-%d}"
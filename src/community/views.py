@@ -9,6 +9,9 @@ from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from common.api.fieldsets import SparseFieldsetsMixin
+from common.api.pagination import CursorPaginationMixin
+
 from .models import POINTS_CONFIG, MemberProfile, Post, Reaction, Space, Topic
 from .serializers import (
     LeaderboardSerializer,
@@ -54,6 +57,8 @@ class SpaceViewSet(
 
 
 class TopicViewSet(
+    SparseFieldsetsMixin,
+    CursorPaginationMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -63,6 +68,7 @@ class TopicViewSet(
 ):
     filterset_fields = ["space", "topic_type", "is_pinned", "is_answered"]
     search_fields = ["title"]
+    sparse_fieldsets_always_load = ("view_count",)
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -98,6 +104,7 @@ class TopicViewSet(
 
 
 class PostViewSet(
+    CursorPaginationMixin,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
     mixins.UpdateModelMixin,
@@ -81,11 +81,12 @@ MIDDLEWARE = [
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
 ]
-if MULTITENANT_MODE == "schema":
+if MULTITENANT_MODE in ("schema", "database", "shared"):
     MIDDLEWARE.append("multitenant.middleware.TenantMiddleware")
 MIDDLEWARE += [
     "corsheaders.middleware.CorsMiddleware",
     "common.middleware.MetricsMiddleware",
+    "api.middleware.RateLimitHeadersMiddleware",
     "django.middleware.gzip.GZipMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -144,6 +145,31 @@ CACHES = {
     }
 }
 
+# Host → tenant resolution cache (multitenant.resolver). Seconds; 0 disables a tier.
+TENANT_CACHE_TIMEOUT = env.int("TENANT_CACHE_TIMEOUT", default=300)
+TENANT_CACHE_NEGATIVE_TIMEOUT = env.int("TENANT_CACHE_NEGATIVE_TIMEOUT", default=30)
+TENANT_CACHE_LOCAL_TTL = env.int("TENANT_CACHE_LOCAL_TTL", default=10)
+TENANT_CACHE_LOCAL_SIZE = env.int("TENANT_CACHE_LOCAL_SIZE", default=1024)
+
+# New tenant schemas: "migrate" runs every migration, "clone" copies TENANT_TEMPLATE_SCHEMA
+TENANT_PROVISIONING = env.str("TENANT_PROVISIONING", default="migrate")
+TENANT_TEMPLATE_SCHEMA = env.str("TENANT_TEMPLATE_SCHEMA", default="tenant_template")
+
+# Warm pool of pre-provisioned schemas claimed by onboarding (0 disables it)
+TENANT_SCHEMA_POOL_SIZE = env.int("TENANT_SCHEMA_POOL_SIZE", default=0)
+
+# Default worker processes for `manage.py migrate_tenants`
+TENANT_MIGRATION_PROCESSES = env.int("TENANT_MIGRATION_PROCESSES", default=4)
+
+# Database-per-tenant (MULTITENANT_MODE=database): alias → URL, e.g. "shard1=postgresql://..."
+TENANT_DATABASES = env.dict("TENANT_DATABASES", default={})
+TENANT_DATABASE_CONN_MAX_AGE = env.int("TENANT_DATABASE_CONN_MAX_AGE", default=600)
+TENANT_DATABASE_POOL = env.bool("TENANT_DATABASE_POOL", default=False)
+# Role that RLS bypass switches to (SET ROLE); its policy is the only one OR-ed with tenants'
+RLS_BYPASS_ROLE = env.str("RLS_BYPASS_ROLE", default="rls_bypass")
+if MULTITENANT_MODE == "database":
+    DATABASE_ROUTERS = ["multitenant.routers.TenantDatabaseRouter"]
+
 AUTH_USER_MODEL = "core.User"
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -244,6 +270,15 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_RENDERER_CLASSES": [
+        "common.api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "common.api.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "EXCEPTION_HANDLER": "common.api.exceptions.custom_exception_handler",
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework_simplejwt.authentication.JWTAuthentication",
@@ -252,14 +287,11 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticated"],
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.UserRateThrottle",
-        "rest_framework.throttling.AnonRateThrottle",
+        "api.throttling.TenantPlanThrottle",
         "rest_framework.throttling.ScopedRateThrottle",
     ],
-    "DEFAULT_THROTTLE_RATES": {
-        "user": env.str("API_USER_RATE", default="1000/day"),
-        "anon": env.str("API_ANON_RATE", default="100/day"),
-    },
+    # Per-view scopes for ScopedRateThrottle; global limits are TenantPlanThrottle's (below).
+    "DEFAULT_THROTTLE_RATES": {},
     "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
     "ALLOWED_VERSIONS": ["v1"],
     "DEFAULT_VERSION": "v1",
@@ -268,6 +300,42 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 50,
 }
 
+# api.v1.batch.BatchView: sub-requests allowed per /api/v1/batch call
+API_BATCH_MAX_REQUESTS = env.int("API_BATCH_MAX_REQUESTS", default=20)
+
+# mcp.views.tool_execute_view: calls per batch, and threads for concurrent read tools
+MCP_TOOL_BATCH_MAX = env.int("MCP_TOOL_BATCH_MAX", default=20)
+MCP_TOOL_WORKERS = env.int("MCP_TOOL_WORKERS", default=4)
+
+# mcp.transport: idle lifetime of a JSON-RPC session, and SSE keepalive interval (seconds)
+MCP_SESSION_TTL = env.int("MCP_SESSION_TTL", default=24 * 3600)
+MCP_SSE_KEEPALIVE = env.int("MCP_SSE_KEEPALIVE", default=15)
+
+# mcp.usage: write-behind McpUsageLog writer (queue bound, batching, enqueue wait in seconds)
+MCP_USAGE_LOG_WORKER = env.bool("MCP_USAGE_LOG_WORKER", default=True)
+MCP_USAGE_LOG_QUEUE_SIZE = env.int("MCP_USAGE_LOG_QUEUE_SIZE", default=10_000)
+MCP_USAGE_LOG_BATCH_SIZE = env.int("MCP_USAGE_LOG_BATCH_SIZE", default=500)
+MCP_USAGE_LOG_FLUSH_SECONDS = env.float("MCP_USAGE_LOG_FLUSH_SECONDS", default=1.0)
+MCP_USAGE_LOG_PUT_TIMEOUT = env.float("MCP_USAGE_LOG_PUT_TIMEOUT", default=0.0)
+# Payloads whose JSON exceeds this many bytes: "compress", "truncate" or "keep"
+MCP_USAGE_LOG_MAX_PAYLOAD_BYTES = env.int("MCP_USAGE_LOG_MAX_PAYLOAD_BYTES", default=64 * 1024)
+MCP_USAGE_LOG_OVERSIZE = env.str("MCP_USAGE_LOG_OVERSIZE", default="compress")
+
+# api.throttling.TenantPlanThrottle: defaults when the tenant's Plan sets no API limits
+API_THROTTLE_RATE_PER_MINUTE = env.int("API_THROTTLE_RATE_PER_MINUTE", default=600)
+API_THROTTLE_BURST = env.int("API_THROTTLE_BURST", default=100)
+# Authenticated requests without a tenant (MULTITENANT_MODE=off, bare API hosts): per user
+API_THROTTLE_USER_RATE_PER_MINUTE = env.int("API_THROTTLE_USER_RATE_PER_MINUTE", default=120)
+API_THROTTLE_USER_BURST = env.int("API_THROTTLE_USER_BURST", default=60)
+API_THROTTLE_ANON_RATE_PER_MINUTE = env.int("API_THROTTLE_ANON_RATE_PER_MINUTE", default=30)
+API_THROTTLE_ANON_BURST = env.int("API_THROTTLE_ANON_BURST", default=20)
+# Seconds role/permission sets are cached by common.policies; 0 disables the shared cache.
+POLICY_CACHE_TIMEOUT = env.int("POLICY_CACHE_TIMEOUT", default=300)
+# Seconds a verified API key skips the password hasher (api.key_cache); 0 disables it.
+API_KEY_CACHE_TIMEOUT = env.int("API_KEY_CACHE_TIMEOUT", default=60)
+# API key last_used_at/request_count are buffered and written every N seconds (api.usage)
+API_KEY_USAGE_FLUSH_SECONDS = env.int("API_KEY_USAGE_FLUSH_SECONDS", default=60)
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "NotionApps API",
     "DESCRIPTION": "Versioned DRF API for NotionApps.",
@@ -290,10 +358,23 @@ SIMPLE_JWT = {
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
     "TOKEN_OBTAIN_SERIALIZER": "api.serializers_auth.TenantTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "api.serializers_auth.TenantTokenRefreshSerializer",
 }
+# Tenant and role claims in access tokens (api.serializers_auth)
+JWT_AUTHZ_CLAIMS = env.bool("JWT_AUTHZ_CLAIMS", default=False)
 
 CELERY_BROKER_URL = env.str("REDIS_URL", default="redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = CELERY_BROKER_URL
+CELERY_BEAT_SCHEDULE = {
+    "refill-schema-pool": {
+        "task": "multitenant.tasks.refill_schema_pool",
+        "schedule": env.int("TENANT_SCHEMA_POOL_REFILL_SECONDS", default=300),
+    },
+    "flush-api-key-usage": {
+        "task": "api.tasks.flush_api_key_usage",
+        "schedule": API_KEY_USAGE_FLUSH_SECONDS,
+    },
+}
 
 STORAGES = {
     "default": {
@@ -4,7 +4,7 @@ from environs import Env
 
 env = Env()
 
-MULTITENANT_MODE = env.str("MULTITENANT_MODE", default="schema")  # off|schema|database
+MULTITENANT_MODE = env.str("MULTITENANT_MODE", default="schema")  # off|schema|database|shared
 ENABLE_STRIPE = env.bool("ENABLE_STRIPE", default=True)
 
 # CMS is always enabled (MDX-based, no Wagtail)
@@ -26,3 +26,8 @@ EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
 # Disable Silk profiling in tests
 SILKY_INTERCEPT_PERCENT = 0
+
+# Tests create and drop tenants freely; resolve hosts straight from the DB
+TENANT_CACHE_TIMEOUT = 0
+TENANT_CACHE_NEGATIVE_TIMEOUT = 0
+TENANT_CACHE_LOCAL_TTL = 0
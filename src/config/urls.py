@@ -11,7 +11,7 @@ from common.metrics import metrics_view
 from oauth.views import RateLimitedLoginView, RateLimitedSignupView
 
 
-def healthz(_request):
+async def healthz(_request):
     return JsonResponse({"status": "ok"})
 
 
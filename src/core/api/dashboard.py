@@ -2,9 +2,16 @@ from rest_framework import viewsets, permissions
 from rest_framework.response import Response
 from core.models import Membership, RoleAuditLog
 from billing.models import Subscription
+from common.api.conditional import ConditionalGetMixin
 
-class DashboardViewSet(viewsets.ViewSet):
+
+def dashboard_stats_cache_key(tenant_id) -> str:
+    return f"dashboard_stats:{tenant_id}"
+
+
+class DashboardViewSet(ConditionalGetMixin, viewsets.ViewSet):
     permission_classes = [permissions.IsAuthenticated]
+    etag_scopes = ("core.membership", "core.roleauditlog")
 
     def list(self, request):
         """
@@ -17,7 +24,7 @@ class DashboardViewSet(viewsets.ViewSet):
             )
 
         from django.core.cache import cache
-        cache_key = f"dashboard_stats:{tenant.id}"
+        cache_key = dashboard_stats_cache_key(tenant.id)
         stats = cache.get(cache_key)
         
         if not stats:
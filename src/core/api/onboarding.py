@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
+
 from django.contrib.auth import login
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from common.rls import rls_bypass, shared_schema_mode
 from core.models import OnboardingState
 from core.services.onboarding import (
     invite_members,
@@ -44,7 +47,10 @@ class OnboardingViewSet(viewsets.ViewSet):
         # But OnboardingState is in 'public' schema.
         
         user_email = request.user.email
-        with schema_context(PUBLIC_SCHEMA_NAME):
+        # Shared-schema mode: the state row belongs to a tenant this public-host
+        # request is not scoped to, so lift the RLS policies for the lookup.
+        bypass = rls_bypass() if shared_schema_mode() else nullcontext()
+        with schema_context(PUBLIC_SCHEMA_NAME), bypass:
             # Find in-progress state for this user's email
             state = OnboardingState.objects.filter(
                 owner_email=user_email, is_complete=False
@@ -1,25 +1,33 @@
 from __future__ import annotations
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
 from core.services.seed import seed_default_roles, seed_system_permissions
-from multitenant.models import Tenant
+from multitenant.batch import OK, list_tenants, run_for_tenants
 from multitenant.schema import PUBLIC_SCHEMA_NAME, schema_context
 
 
 class Command(BaseCommand):
     help = "Seed system permissions and default roles for all tenants."
 
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=1)
+
     def handle(self, *args, **options):
         with schema_context(PUBLIC_SCHEMA_NAME):
             seed_system_permissions()
-            tenants = list(Tenant.objects.all())
-
-        for tenant_public in tenants:
-            with schema_context(tenant_public.schema_name):
-                try:
-                    tenant_local = Tenant.objects.get(id=tenant_public.id)
-                except Tenant.DoesNotExist:
-                    continue
-                seed_default_roles(tenant_local)
-                self.stdout.write(self.style.SUCCESS(f"Seeded roles for {tenant_local.slug}"))
+
+        def progress(done, total, outcome):
+            if outcome.status == OK:
+                self.stdout.write(self.style.SUCCESS(f"Seeded roles for {outcome.slug}"))
+
+        report = run_for_tenants(
+            seed_default_roles,
+            list_tenants(include_inactive=True),
+            processes=options["processes"],
+            progress=progress,
+        )
+        for outcome in report.failures:
+            self.stderr.write(self.style.ERROR(f"{outcome.slug}:\n{outcome.error}"))
+        if report.failures:
+            raise CommandError(f"Seeding failed for {len(report.failures)} tenant(s).")
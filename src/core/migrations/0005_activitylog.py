@@ -0,0 +1,58 @@
+# Generated by Django 5.2.12 on 2026-10-16 09:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_alter_user_options_alter_user_is_active_and_more"),
+        ("multitenant", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ActivityLog",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("action", models.CharField(max_length=100)),
+                ("object_id", models.CharField(blank=True, max_length=50, null=True)),
+                ("object_repr", models.CharField(blank=True, max_length=200, null=True)),
+                ("description", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "actor",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="activity_logs",
+                        to="multitenant.tenant",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["organization", "-created_at", "id"],
+                        name="core_activity_org_created_idx",
+                    )
+                ],
+            },
+        ),
+    ]
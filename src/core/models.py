@@ -126,5 +126,7 @@ class ActivityLog(models.Model):
     class Meta:
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["organization", "-created_at"]),
+            models.Index(
+                fields=["organization", "-created_at", "id"], name="core_activity_org_created_idx"
+            ),
         ]
@@ -2,18 +2,18 @@ from __future__ import annotations
 
 import rules
 
-from common.policies import get_membership, has_permission
+from common.policies import get_member_role, has_permission
 
 
 @rules.predicate
 def is_org_member(user, organization):
-    return get_membership(user, organization) is not None
+    return get_member_role(user, organization) is not None
 
 
 @rules.predicate
 def is_org_owner(user, organization):
-    membership = get_membership(user, organization)
-    return membership is not None and membership.role.slug == "owner"
+    member_role = get_member_role(user, organization)
+    return member_role is not None and member_role.slug == "owner"
 
 
 def _perm(codename: str):
@@ -7,11 +7,14 @@ from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 
+from common.rls import set_transaction_tenant, shared_schema_mode
 from core.services.email import EmailService
 from core.models import Membership, OnboardingState, Role, User
 from core.services.seed import seed_default_roles
 from core.services.usernames import username_from_email
 from multitenant.models import Domain, Tenant, validate_subdomain
+from multitenant.pool import claim_pooled_schema
+from multitenant.provisioning import clone_template, get_provisioning_mode
 from multitenant.schema import PUBLIC_SCHEMA_NAME, create_schema, schema_context
 
 
@@ -39,6 +42,12 @@ def finish_onboarding(tenant: Tenant) -> Tenant:
     return tenant
 
 
+def _scope_transaction(tenant_id: int) -> None:
+    """Shared-schema mode: let the surrounding transaction write this tenant's rows."""
+    if shared_schema_mode():
+        set_transaction_tenant(tenant_id)
+
+
 def _ensure_local_tenant(tenant_public: Tenant) -> Tenant:
     with schema_context(tenant_public.schema_name):
         tenant_local, _ = Tenant.objects.get_or_create(
@@ -85,7 +94,19 @@ def start_onboarding(
             enabled_modules=[],
             branding={},
         )
-        create_schema(slug)
+        if shared_schema_mode():
+            # No schema to build: rows are isolated by RLS on app.tenant_id,
+            # which must match the new tenant for the inserts below.
+            set_transaction_tenant(tenant_public.id)
+            seeded = False
+        else:
+            # Pooled and cloned schemas arrive migrated, with default roles seeded.
+            seeded = claim_pooled_schema(tenant_public)
+            if not seeded and get_provisioning_mode() == "clone":
+                clone_template(tenant_public)
+                seeded = True
+            elif not seeded:
+                create_schema(slug)
         Domain.objects.create(tenant=tenant_public, domain=full_domain, is_primary=True)
         state = OnboardingState.objects.create(
             tenant=tenant_public,
@@ -112,7 +133,8 @@ def start_onboarding(
         raise ValueError("Email required")
 
     with schema_context(tenant_public.schema_name):
-        seed_default_roles(tenant_local)
+        if not seeded:
+            seed_default_roles(tenant_local)
         owner_role = Role.objects.get(organization=tenant_local, slug="owner")
         
         # Create user in tenant schema
@@ -140,6 +162,7 @@ def start_onboarding(
 
 @transaction.atomic
 def set_modules(state: OnboardingState, modules: list[str]) -> None:
+    _scope_transaction(state.tenant_id)
     tenant = state.tenant
     with schema_context(PUBLIC_SCHEMA_NAME):
         tenant.enabled_modules = modules
@@ -154,6 +177,7 @@ def set_modules(state: OnboardingState, modules: list[str]) -> None:
 
 @transaction.atomic
 def mark_stripe_connected(state: OnboardingState, connected: bool = True) -> None:
+    _scope_transaction(state.tenant_id)
     with schema_context(PUBLIC_SCHEMA_NAME):
         state.data["stripe_connected"] = connected
         state.mark_step_complete(3)
@@ -162,6 +186,7 @@ def mark_stripe_connected(state: OnboardingState, connected: bool = True) -> Non
 
 @transaction.atomic
 def set_custom_domain(state: OnboardingState, custom_domain: str | None) -> None:
+    _scope_transaction(state.tenant_id)
     tenant = state.tenant
     with schema_context(PUBLIC_SCHEMA_NAME):
         if custom_domain:
@@ -178,6 +203,7 @@ def set_custom_domain(state: OnboardingState, custom_domain: str | None) -> None
 def invite_members(
     state: OnboardingState, emails: list[str], role_slug: str = "member"
 ) -> int:
+    _scope_transaction(state.tenant_id)
     tenant = state.tenant
     invited = 0
     with schema_context(tenant.schema_name):
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from django.db.models.signals import m2m_changed
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
-from .models import Role, RoleAuditLog
+from common.api.conditional import bump_version
+from common.policies import invalidate_member, invalidate_role
+
+from .models import Membership, Role, RoleAuditLog, RolePermission, User
 
 
 def _export_role(role: Role) -> dict:
@@ -28,3 +33,59 @@ def role_permissions_changed(sender, instance: Role, action: str, **kwargs):
         after=_export_role(instance),
     )
 
+
+
+
+def _invalidate(func, *args) -> None:
+    """Invalidate now (same transaction) and again once the change is visible to others."""
+    func(*args)
+    transaction.on_commit(lambda: func(*args))
+
+
+@receiver(post_save, sender=Membership, dispatch_uid="core_membership_saved")
+@receiver(post_delete, sender=Membership, dispatch_uid="core_membership_deleted")
+def membership_changed(sender, instance: Membership, **kwargs):
+    from core.api.dashboard import dashboard_stats_cache_key
+
+    _invalidate(invalidate_member, instance.organization_id, instance.user_id)
+    _invalidate(cache.delete, dashboard_stats_cache_key(instance.organization_id))
+    bump_version("core.membership", instance.organization_id)
+
+
+@receiver(post_save, sender=RoleAuditLog, dispatch_uid="core_role_audit_log_saved")
+def role_audit_log_saved(sender, instance: RoleAuditLog, **kwargs):
+    bump_version("core.roleauditlog", instance.organization_id)
+
+
+@receiver(post_save, sender=User, dispatch_uid="core_user_saved")
+def user_saved(sender, instance: User, **kwargs):
+    bump_version("core.user", instance.pk)
+
+
+@receiver(post_save, sender=Role, dispatch_uid="core_role_saved")
+@receiver(post_delete, sender=Role, dispatch_uid="core_role_deleted")
+def role_changed(sender, instance: Role, **kwargs):
+    _invalidate(invalidate_role, instance.organization_id, instance.pk)
+
+
+@receiver(post_save, sender=RolePermission, dispatch_uid="core_role_permission_saved")
+@receiver(post_delete, sender=RolePermission, dispatch_uid="core_role_permission_deleted")
+def role_permission_changed(sender, instance: RolePermission, **kwargs):
+    organization_id = (
+        Role.objects.filter(pk=instance.role_id).values_list("organization_id", flat=True).first()
+    )
+    _invalidate(invalidate_role, organization_id, instance.role_id)
+
+
+@receiver(m2m_changed, sender=Role.permissions.through, dispatch_uid="core_role_perms_cache")
+def role_permissions_cache(sender, instance, action: str, reverse: bool, pk_set, **kwargs):
+    if not reverse:
+        if action in {"post_add", "post_remove", "post_clear"}:
+            _invalidate(invalidate_role, instance.organization_id, instance.pk)
+        return
+    # permission.roles.add/remove/clear: roles are in pk_set, or still linked before a clear.
+    if action not in {"post_add", "post_remove", "pre_clear"}:
+        return
+    roles = Role.objects.filter(pk__in=pk_set) if pk_set else instance.roles.all()
+    for role_id, organization_id in roles.values_list("id", "organization_id"):
+        _invalidate(invalidate_role, organization_id, role_id)
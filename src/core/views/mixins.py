@@ -4,7 +4,7 @@ from django.core.exceptions import PermissionDenied
 from django.http import Http404, HttpRequest
 from django.views.generic.base import ContextMixin
 
-from common.policies import get_membership, has_permission
+from common.policies import get_member_role, has_permission
 
 
 class TenantPermissionMixin(ContextMixin):
@@ -21,7 +21,7 @@ class TenantPermissionMixin(ContextMixin):
             raise Http404("Tenant required.")
 
         if self.require_membership and not request.user.is_superuser:
-            if get_membership(request.user, organization) is None:
+            if get_member_role(request.user, organization) is None:
                 raise PermissionDenied
 
         if self.permission_codename:
@@ -7,3 +7,5 @@ class LmsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "lms"
 
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,176 @@
+"""
+Bulk authoring of sections and lessons.
+
+Importing a course one section/lesson per request costs hundreds of round
+trips. These helpers take a whole list: validation runs a fixed number of
+queries regardless of its length, and the write is one ``bulk_create`` or
+``bulk_update`` inside a transaction.
+
+Both models are ``unique_together (course, order)`` and Postgres checks that
+row by row, so moving orders around (swaps, reorders) first shifts the rows
+being moved past the course's highest order, then writes the final values.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import F, Max
+from django.utils.text import slugify
+from rest_framework.exceptions import ValidationError
+
+from common.api.conditional import bump_version
+
+from .models import Course, Lesson, Section
+
+MAX_ITEMS = 500
+
+
+def _error(index: int | None, message: str):
+    if index is None:
+        return ValidationError({"items": [message]})
+    return ValidationError({"items": {index: [message]}})
+
+
+def _check_sections(organization, rows: list[dict]) -> None:
+    """Lessons may only point at sections of their own course."""
+    section_ids = {row["section"] for row in rows if row.get("section")}
+    courses = dict(
+        Section.objects.filter(organization=organization, pk__in=section_ids).values_list(
+            "pk", "course_id"
+        )
+    )
+    for index, row in enumerate(rows):
+        section = row.get("section")
+        if section and courses.get(section) != row["course"]:
+            raise _error(index, f"Section {section} does not belong to course {row['course']}.")
+
+
+def _check_orders(model, rows: list[dict], moved: set[int]) -> None:
+    """Fill missing orders and reject (course, order) pairs that would collide."""
+    course_ids = {row["course"] for row in rows}
+    taken = Counter()
+    top: dict[int, int] = {}
+    existing = model.objects.filter(course_id__in=course_ids).exclude(pk__in=moved)
+    for course_id, order in existing.values_list("course_id", "order"):
+        taken[course_id, order] += 1
+        top[course_id] = max(top.get(course_id, -1), order)
+    for row in rows:
+        if row.get("order") is not None:
+            top[row["course"]] = max(top.get(row["course"], -1), row["order"])
+    for index, row in enumerate(rows):
+        if row.get("order") is None:
+            top[row["course"]] = row["order"] = top.get(row["course"], -1) + 1
+        taken[row["course"], row["order"]] += 1
+        if taken[row["course"], row["order"]] > 1:
+            raise _error(index, f"Order {row['order']} is already used in this course.")
+
+
+def _shift(model, pks, above: int = 0) -> None:
+    """Move rows past every current and final order of their courses (one UPDATE)."""
+    if not pks:
+        return
+    rows = model.objects.filter(pk__in=pks)
+    courses = rows.values_list("course_id", flat=True).distinct()
+    top = model.objects.filter(course_id__in=courses).aggregate(top=Max("order"))["top"] or 0
+    rows.update(order=F("order") + max(top, above) + 1)
+
+
+def _check_courses(organization, rows: list[dict]) -> None:
+    course_ids = {row["course"] for row in rows}
+    found = set(
+        Course.objects.filter(organization=organization, pk__in=course_ids).values_list(
+            "pk", flat=True
+        )
+    )
+    for index, row in enumerate(rows):
+        if row["course"] not in found:
+            raise _error(index, f"Course {row['course']} not found.")
+
+
+@transaction.atomic
+def bulk_create(model, organization, rows: list[dict]) -> list:
+    """Create ``rows`` (dicts of model fields, ``course``/``section`` as ids)."""
+    _check_courses(organization, rows)
+    if model is Lesson:
+        _check_sections(organization, rows)
+    _check_orders(model, rows, moved=set())
+    objs = []
+    for row in rows:
+        row = dict(row)
+        row["course_id"] = row.pop("course")
+        if "section" in row:
+            row["section_id"] = row.pop("section")
+        obj = model(organization=organization, **row)
+        if model is Lesson and not obj.slug:
+            obj.slug = slugify(obj.title)[:255]
+        objs.append(obj)
+    created = model.objects.bulk_create(objs)
+    bump_version(model._meta.label_lower, organization.pk)
+    return created
+
+
+@transaction.atomic
+def bulk_update(model, organization, rows: list[dict]) -> list:
+    """Apply partial ``rows`` (each with an ``id``) to existing objects."""
+    ids = [row["id"] for row in rows]
+    if len(set(ids)) != len(ids):
+        raise _error(None, "Each id may only appear once.")
+    instances = model.objects.select_for_update().filter(organization=organization, pk__in=ids)
+    instances = {obj.pk: obj for obj in instances}
+    for index, row in enumerate(rows):
+        if row["id"] not in instances:
+            raise _error(index, f"{model._meta.object_name} {row['id']} not found.")
+
+    # Fill in the current values needed to validate the final state of each row.
+    merged = []
+    for row in rows:
+        obj = instances[row["id"]]
+        current = {"course": obj.course_id, "order": obj.order}
+        if model is Lesson:
+            current["section"] = obj.section_id
+        merged.append({**current, **row})
+    _check_courses(organization, merged)
+    if model is Lesson:
+        _check_sections(organization, merged)
+    moved_rows = [
+        row
+        for row in merged
+        if (row["course"], row["order"])
+        != (instances[row["id"]].course_id, instances[row["id"]].order)
+    ]
+    moved = {row["id"] for row in moved_rows}
+    _check_orders(model, moved_rows, moved)
+
+    fields = set()
+    for row in rows:
+        obj = instances[row["id"]]
+        for name, value in row.items():
+            if name == "id":
+                continue
+            attname = f"{name}_id" if name in {"course", "section"} else name
+            setattr(obj, attname, value)
+            fields.add(attname)
+    _shift(model, moved, above=max((row["order"] for row in moved_rows), default=0))
+    objs = [instances[pk] for pk in ids]
+    if fields:
+        model.objects.bulk_update(objs, sorted(fields))
+    bump_version(model._meta.label_lower, organization.pk)
+    return objs
+
+
+@transaction.atomic
+def reorder(model, organization, course_id: int, ids: list[int]) -> None:
+    """Set ``order`` to the position in ``ids``, which must list all the course's rows."""
+    rows = model.objects.select_for_update().filter(organization=organization, course_id=course_id)
+    current = dict(rows.values_list("pk", "order"))
+    if sorted(current) != sorted(ids):
+        raise ValidationError(
+            {"ids": [f"Send every {model._meta.verbose_name} of the course exactly once."]}
+        )
+    objs = [model(pk=pk, order=position) for position, pk in enumerate(ids)]
+    changed = [obj for obj in objs if current[obj.pk] != obj.order]
+    _shift(model, [obj.pk for obj in changed])
+    model.objects.bulk_update(changed, ["order"])
+    bump_version(model._meta.label_lower, organization.pk)
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.12 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lms", "0002_certificate_review_section_alter_course_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="enrollment",
+            index=models.Index(
+                fields=["organization", "-enrolled_at", "id"], name="lms_enroll_org_enrolled_idx"
+            ),
+        ),
+    ]
@@ -213,6 +213,11 @@ class Enrollment(models.Model):
     class Meta:
         ordering = ["-enrolled_at"]
         unique_together = [("user", "course")]
+        indexes = [
+            models.Index(
+                fields=["organization", "-enrolled_at", "id"], name="lms_enroll_org_enrolled_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user_id}:{self.course_id}"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from rest_framework import serializers
 
+from .bulk import MAX_ITEMS
 from .models import Certificate, Course, Enrollment, Lesson, LessonProgress, Review, Section
 
 
@@ -15,7 +16,8 @@ class SectionSerializer(serializers.ModelSerializer):
         fields = ["id", "course", "title", "description", "order", "lesson_count"]
 
     def get_lesson_count(self, obj: Section) -> int:
-        return obj.lessons.count()
+        annotated = getattr(obj, "num_lessons", None)
+        return annotated if annotated is not None else obj.lessons.count()
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -47,6 +49,60 @@ class LessonSerializer(serializers.ModelSerializer):
             self.fields["course"].queryset = Course.objects.filter(organization=tenant)
 
 
+class SectionBulkItemSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(required=False)
+    course = serializers.IntegerField()
+    order = serializers.IntegerField(min_value=0, required=False)
+
+    class Meta:
+        model = Section
+        fields = ["id", "course", "title", "description", "order"]
+        # (course, order) is checked for the whole list at once in lms.bulk.
+        validators = []
+
+
+class LessonBulkItemSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(required=False)
+    course = serializers.IntegerField()
+    section = serializers.IntegerField(required=False, allow_null=True)
+    order = serializers.IntegerField(min_value=0, required=False)
+
+    class Meta:
+        model = Lesson
+        fields = [
+            "id", "course", "section", "title", "slug", "order",
+            "content_type", "content", "video_url", "duration_minutes",
+            "is_preview", "is_published",
+        ]
+        validators = []
+
+
+class BulkItemsSerializer(serializers.Serializer):
+    """``{"items": [...]}``: each item is checked alone here, the list as a whole in lms.bulk."""
+
+    def __init__(self, *args, item_serializer=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["items"] = serializers.ListField(
+            child=item_serializer(), min_length=1, max_length=MAX_ITEMS
+        )
+
+    def validate(self, attrs):
+        items = attrs.get("items")
+        if not items:
+            raise serializers.ValidationError({"items": ["This field is required."]})
+        for index, item in enumerate(items):
+            if not self.partial:
+                item.pop("id", None)
+            elif "id" not in item:
+                raise serializers.ValidationError({"items": {index: ["id is required."]}})
+        return attrs
+
+
+class ReorderSerializer(serializers.Serializer):
+    course = serializers.IntegerField()
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+
 class LessonListSerializer(serializers.ModelSerializer):
     """Lightweight serializer without content body for listings."""
 
@@ -0,0 +1,22 @@
+"""Bump the API ETag version stamps (see ``common.api.conditional``) on changes."""
+
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from common.api.conditional import bump_version
+
+from .models import Course, Enrollment, Lesson, Section
+
+
+@receiver(post_save, sender=Course, dispatch_uid="lms_course_etag_saved")
+@receiver(post_delete, sender=Course, dispatch_uid="lms_course_etag_deleted")
+@receiver(post_save, sender=Section, dispatch_uid="lms_section_etag_saved")
+@receiver(post_delete, sender=Section, dispatch_uid="lms_section_etag_deleted")
+@receiver(post_save, sender=Lesson, dispatch_uid="lms_lesson_etag_saved")
+@receiver(post_delete, sender=Lesson, dispatch_uid="lms_lesson_etag_deleted")
+@receiver(post_save, sender=Enrollment, dispatch_uid="lms_enrollment_etag_saved")
+@receiver(post_delete, sender=Enrollment, dispatch_uid="lms_enrollment_etag_deleted")
+def lms_changed(sender, instance, **kwargs):
+    bump_version(sender._meta.label_lower, instance.organization_id)
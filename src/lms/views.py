@@ -2,23 +2,33 @@
 
 from __future__ import annotations
 
+from django.db.models import Count
 from django.utils import timezone
-from rest_framework import mixins, viewsets
+from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from common.api.conditional import ConditionalGetMixin
+from common.api.fieldsets import SparseFieldsetsMixin
+from common.api.pagination import CursorPaginationMixin
+
+from . import bulk
 from .models import Certificate, Course, Enrollment, Lesson, LessonProgress, Review, Section
 from .serializers import (
+    BulkItemsSerializer,
     CertificateSerializer,
     CourseDetailSerializer,
     CourseListSerializer,
     EnrollmentSerializer,
+    LessonBulkItemSerializer,
     LessonListSerializer,
     LessonProgressSerializer,
     LessonSerializer,
+    ReorderSerializer,
     ReviewSerializer,
+    SectionBulkItemSerializer,
     SectionSerializer,
 )
 
@@ -38,6 +48,8 @@ class TenantScopedViewSet(viewsets.GenericViewSet):
 
 
 class CourseViewSet(
+    ConditionalGetMixin,
+    SparseFieldsetsMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -47,6 +59,8 @@ class CourseViewSet(
 ):
     filterset_fields = ["status", "pricing_type", "level", "is_featured"]
     search_fields = ["title", "description"]
+    # Detail embeds sections and lesson/enrollment totals.
+    etag_scopes = ("lms.course", "lms.section", "lms.lesson", "lms.enrollment")
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -70,7 +84,42 @@ class CourseViewSet(
         serializer.save(organization=self.get_organization())
 
 
+class BulkAuthoringMixin:
+    """``POST``/``PATCH`` ``bulk/`` and ``POST`` ``reorder/`` (see ``lms.bulk``)."""
+
+    bulk_item_serializer_class = None
+
+    @action(detail=False, methods=["post", "patch"])
+    def bulk(self, request):
+        partial = request.method == "PATCH"
+        payload = BulkItemsSerializer(
+            data=request.data, item_serializer=self.bulk_item_serializer_class, partial=partial
+        )
+        payload.is_valid(raise_exception=True)
+        write = bulk.bulk_update if partial else bulk.bulk_create
+        model = self.get_queryset().model
+        objs = write(model, self.get_organization(), payload.validated_data["items"])
+        queryset = self.get_queryset().filter(pk__in=[obj.pk for obj in objs])
+        return Response(
+            self.get_serializer(queryset, many=True).data,
+            status=status.HTTP_200_OK if partial else status.HTTP_201_CREATED,
+        )
+
+    @action(detail=False, methods=["post"])
+    def reorder(self, request):
+        payload = ReorderSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        bulk.reorder(
+            self.get_queryset().model,
+            self.get_organization(),
+            payload.validated_data["course"],
+            payload.validated_data["ids"],
+        )
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 class SectionViewSet(
+    BulkAuthoringMixin,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
     mixins.UpdateModelMixin,
@@ -78,15 +127,21 @@ class SectionViewSet(
     TenantScopedViewSet,
 ):
     serializer_class = SectionSerializer
+    bulk_item_serializer_class = SectionBulkItemSerializer
 
     def get_queryset(self):
-        return Section.objects.filter(organization=self.get_organization()).select_related("course")
+        return (
+            Section.objects.filter(organization=self.get_organization())
+            .select_related("course")
+            .annotate(num_lessons=Count("lessons"))
+        )
 
     def perform_create(self, serializer):
         serializer.save(organization=self.get_organization())
 
 
 class LessonViewSet(
+    BulkAuthoringMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -94,8 +149,10 @@ class LessonViewSet(
     mixins.DestroyModelMixin,
     TenantScopedViewSet,
 ):
+    bulk_item_serializer_class = LessonBulkItemSerializer
+
     def get_serializer_class(self):
-        if self.action == "list":
+        if self.action in ("list", "bulk"):
             return LessonListSerializer
         return LessonSerializer
 
@@ -113,12 +170,14 @@ class LessonViewSet(
 
 
 class EnrollmentViewSet(
+    CursorPaginationMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
     TenantScopedViewSet,
 ):
     serializer_class = EnrollmentSerializer
+    cursor_ordering = ("-enrolled_at", "id")
 
     def get_queryset(self):
         return (
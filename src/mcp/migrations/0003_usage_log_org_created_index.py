@@ -0,0 +1,19 @@
+# Generated by Django 5.2.12 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("mcp", "0002_alter_mcpserver_api_key_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="mcpusagelog",
+            index=models.Index(
+                fields=["organization", "-created_at", "id"], name="mcp_usagelog_org_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.12 on 2026-10-16 12:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("mcp", "0003_usage_log_org_created_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="mcpusagelog",
+            name="created_at",
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
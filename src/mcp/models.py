@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 from common.encryption import EncryptedCharField
 
@@ -87,10 +88,16 @@ class McpUsageLog(models.Model):
     )
     request_data = models.JSONField(default=dict, blank=True)
     response_data = models.JSONField(blank=True, null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Set when the call happens: rows are written later, in batches (see mcp.usage).
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["organization", "-created_at", "id"], name="mcp_usagelog_org_created_idx"
+            ),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover
         return f"{self.server_id}:{self.tool_id}:{self.user_id}:{self.created_at:%Y-%m-%d %H:%M:%S}"
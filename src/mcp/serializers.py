@@ -72,3 +72,12 @@ class McpUsageLogSerializer(serializers.ModelSerializer):
         if server and tool and tool.server_id != server.id:
             raise serializers.ValidationError({"tool": "Tool must belong to the selected server."})
         return attrs
+
+    def to_representation(self, instance):
+        from .usage import expand_payload
+
+        data = super().to_representation(instance)
+        for name in ("request_data", "response_data"):
+            if name in data:
+                data[name] = expand_payload(data[name])
+        return data
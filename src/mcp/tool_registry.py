@@ -12,12 +12,22 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import dataclass
 from typing import Any
+from urllib.parse import urlencode
 
+from django.conf import settings
+from django.db import close_old_connections, connection
 from django.urls import URLPattern, URLResolver
 from rest_framework.routers import DefaultRouter
-from rest_framework.serializers import Serializer
+from rest_framework.serializers import ChoiceField, Serializer
 from rest_framework.viewsets import ViewSetMixin
 
 logger = logging.getLogger(__name__)
@@ -107,7 +117,9 @@ def serializer_to_json_schema(serializer_class: type[Serializer]) -> dict[str, A
         if hasattr(field, "max_length") and field.max_length:
             prop["maxLength"] = field.max_length
 
-        if hasattr(field, "choices") and field.choices:
+        # Related fields expose ``choices`` too, but evaluating them queries
+        # the current tenant's rows into a catalog shared by every tenant.
+        if isinstance(field, ChoiceField) and field.choices:
             prop["enum"] = [str(k) for k in field.choices.keys()]
 
         properties[field_name] = prop
@@ -252,8 +264,275 @@ def _generate_description(basename: str, action: str, viewset_class: type) -> st
     return base
 
 
+# ── Catalog Snapshot ─────────────────────────────────────────
+
+CATALOG_VERSION = "1.0"
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """The discovered tools plus the encoded catalog response and its hash."""
+
+    fingerprint: str
+    definitions: tuple[ToolDefinition, ...]
+    by_name: dict[str, ToolDefinition]
+    tools: tuple[dict[str, Any], ...]
+    body: bytes
+    etag: str
+
+
+_snapshot: CatalogSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def _api_router():
+    from api.v1.urls import router
+
+    return router
+
+
+def catalog_fingerprint(router) -> str:
+    """Identity of what discovery depends on: the router registry and the plugin set."""
+    from config.settings.plugins import optional_api_urls
+
+    registry = [
+        (prefix, f"{viewset.__module__}.{viewset.__qualname__}", basename)
+        for prefix, viewset, basename in router.registry
+    ]
+    return hashlib.sha256(repr((registry, optional_api_urls())).encode()).hexdigest()
+
+
+def build_catalog(router) -> CatalogSnapshot:
+    from common.api.renderers import dumps
+
+    definitions = tuple(discover_tools(router))
+    tools = tuple(tool.to_mcp_format() for tool in definitions)
+    body = dumps({"tools": tools, "count": len(tools), "version": CATALOG_VERSION})
+    return CatalogSnapshot(
+        fingerprint=catalog_fingerprint(router),
+        definitions=definitions,
+        by_name={tool.name: tool for tool in definitions},
+        tools=tools,
+        body=body,
+        etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+    )
+
+
+def get_catalog_snapshot() -> CatalogSnapshot | None:
+    """
+    The catalog, built once per process.
+
+    Discovery instantiates every serializer and walks every viewset, so it
+    only runs again when the router registry or the enabled plugins change.
+    """
+    global _snapshot
+    try:
+        router = _api_router()
+    except ImportError:
+        logger.warning("Could not import API v1 router")
+        return None
+    fingerprint = catalog_fingerprint(router)
+    snapshot = _snapshot
+    if snapshot is None or snapshot.fingerprint != fingerprint:
+        with _snapshot_lock:
+            if _snapshot is None or _snapshot.fingerprint != fingerprint:
+                _snapshot = build_catalog(router)
+            snapshot = _snapshot
+    return snapshot
+
+
+def get_tool_definitions() -> tuple[ToolDefinition, ...]:
+    """Cached ``discover_tools()`` for the API v1 router."""
+    snapshot = get_catalog_snapshot()
+    return snapshot.definitions if snapshot is not None else ()
+
+
 # ── Tool Listing Endpoint Helper ─────────────────────────────
 
 def get_tools_catalog() -> list[dict[str, Any]]:
     """Return all discovered tools in MCP protocol format."""
-    return [tool.to_mcp_format() for tool in discover_tools()]
+    snapshot = get_catalog_snapshot()
+    return list(snapshot.tools) if snapshot is not None else []
+
+
+# ── Tool Execution ───────────────────────────────────────────
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+DETAIL_ACTIONS = ("retrieve", "update", "partial_update", "destroy")
+
+
+@dataclass(frozen=True)
+class ToolResult:
+    name: str
+    status: int
+    data: Any
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+_views: dict[tuple, Any] = {}
+
+
+def _tool_view(tool: ToolDefinition):
+    key = (tool.viewset_class, tool.action, tool.method)
+    view = _views.get(key)
+    if view is None:
+        actions = {tool.method.lower(): tool.action}
+        view = _views[key] = tool.viewset_class.as_view(actions, detail=_is_detail(tool))
+    return view
+
+
+def _is_detail(tool: ToolDefinition) -> bool:
+    if tool.action in DETAIL_ACTIONS:
+        return True
+    return bool(getattr(getattr(tool.viewset_class, tool.action, None), "detail", False))
+
+
+def execute_tool(name: str, args: dict[str, Any] | None, request) -> ToolResult:
+    """
+    Run tool ``name`` by calling its viewset action in-process.
+
+    ``request`` is the caller's DRF request: its tenant, user and token are
+    reused (see ``common.api.subrequests``) and the view still applies its
+    permissions. ``args`` become query parameters for reads and the JSON
+    body for writes; ``id`` selects the object of detail actions. The result
+    carries the view's data as Python objects, not encoded JSON.
+    """
+    from common.api.subrequests import make_subrequest, response_data
+
+    snapshot = get_catalog_snapshot()
+    tool = snapshot.by_name.get(name) if snapshot is not None else None
+    if tool is None or tool.viewset_class is None:
+        return ToolResult(name, 404, {"detail": f"Unknown tool: {name}"})
+
+    args = dict(args or {})
+    path, kwargs = tool.endpoint, {}
+    if _is_detail(tool):
+        if "id" not in args:
+            return ToolResult(name, 400, {"id": ["This argument is required."]})
+        pk = str(args.pop("id"))
+        lookup = tool.viewset_class.lookup_url_kwarg or tool.viewset_class.lookup_field
+        kwargs[lookup] = pk
+        if tool.action in DETAIL_ACTIONS:
+            path = f"{tool.endpoint}{pk}/"
+        else:
+            path = f"{tool.endpoint[: -len(tool.action) - 1]}{pk}/{tool.action}/"
+
+    if tool.method in SAFE_METHODS:
+        sub = make_subrequest(request, tool.method, path, urlencode(args, doseq=True))
+    else:
+        sub = make_subrequest(request, tool.method, path, data=args)
+    response = _tool_view(tool)(sub, **kwargs)
+    return ToolResult(name, response.status_code, response_data(response))
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_key: tuple[int, int] | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(workers: int) -> ThreadPoolExecutor:
+    """
+    The process's pool for concurrent reads, shared by all requests.
+
+    Its threads live as long as the process and keep their database
+    connections (subject to ``CONN_MAX_AGE``), so a batch pays no connection
+    setup and a process holds at most ``MCP_TOOL_WORKERS`` extra connections.
+    Recreated after a fork or when the worker count changes.
+    """
+    global _executor, _executor_key
+    key = (os.getpid(), workers)
+    if _executor_key != key:
+        with _executor_lock:
+            if _executor_key != key:
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-tool")
+                _executor_key = key
+    return _executor
+
+
+def _execute_isolated(call: dict[str, Any], request, tenant_ref) -> ToolResult:
+    """``execute_tool`` on a pool thread, inside the caller's tenant scope."""
+    from multitenant.batch import tenant_scope
+
+    # Drop connections that expired or broke since the last call, keep the rest.
+    close_old_connections()
+    try:
+        with tenant_scope(tenant_ref) if tenant_ref is not None else nullcontext():
+            return _execute_safely(call, request)
+    finally:
+        close_old_connections()
+
+
+def _execute_safely(call: dict[str, Any], request) -> ToolResult:
+    name = call.get("name", "")
+    try:
+        return execute_tool(name, call.get("arguments"), request)
+    except Exception:
+        logger.exception("Tool %s failed", name)
+        return ToolResult(name, 500, {"detail": "Tool execution failed."})
+
+
+def iter_tool_results(
+    calls: list[dict[str, Any]],
+    request,
+    heartbeat: float | None = None,
+) -> Iterator[tuple[int, ToolResult] | None]:
+    """
+    Run ``calls`` (``{"name", "arguments"}``), yielding ``(index, result)`` as each finishes.
+
+    Consecutive read tools are independent and run concurrently, up to
+    ``MCP_TOOL_WORKERS`` threads; a write tool waits for the reads before it
+    and blocks the ones after it, so calls still observe each other's writes.
+    Inside an open transaction everything runs sequentially, since worker
+    threads would not see its uncommitted rows.
+
+    With ``heartbeat``, ``None`` is yielded whenever concurrent reads have
+    produced nothing for that many seconds, so streaming callers can keep
+    the connection alive.
+    """
+    from multitenant.batch import TenantRef
+
+    workers = getattr(settings, "MCP_TOOL_WORKERS", 4)
+    tenant = getattr(request, "tenant", None)
+    tenant_ref = TenantRef.from_tenant(tenant) if tenant is not None else None
+    concurrent = workers > 1 and not connection.in_atomic_block
+    snapshot = get_catalog_snapshot()
+    by_name = snapshot.by_name if snapshot is not None else {}
+    stage: list[int] = []
+
+    def run_stage():
+        if len(stage) > 1 and concurrent:
+            pool = _get_executor(workers)
+            pending = {
+                pool.submit(_execute_isolated, calls[index], request, tenant_ref): index
+                for index in stage
+            }
+            while pending:
+                done, _ = wait(pending, timeout=heartbeat, return_when=FIRST_COMPLETED)
+                if not done:
+                    yield None
+                for future in done:
+                    yield pending.pop(future), future.result()
+        else:
+            for index in stage:
+                yield index, _execute_safely(calls[index], request)
+        stage.clear()
+
+    for index, call in enumerate(calls):
+        tool = by_name.get(call.get("name", ""))
+        if tool is None or tool.method in SAFE_METHODS:
+            stage.append(index)
+            continue
+        yield from run_stage()
+        yield index, _execute_safely(call, request)
+    yield from run_stage()
+
+
+def execute_tools(calls: list[dict[str, Any]], request) -> list[ToolResult]:
+    """Run ``calls`` (see ``iter_tool_results``) and return their results in order."""
+    results: list[ToolResult | None] = [None] * len(calls)
+    for index, result in iter_tool_results(calls, request):
+        results[index] = result
+    return results
@@ -0,0 +1,394 @@
+"""
+MCP JSON-RPC over Streamable HTTP (``POST/DELETE /mcp/rpc/``).
+
+Implements ``initialize``, ``ping``, ``tools/list``, ``tools/call``,
+``resources/list`` and ``resources/read`` against the tool registry:
+
+- ``initialize`` opens a session: its id comes back in ``Mcp-Session-Id``
+  and is stored in the cache for ``MCP_SESSION_TTL`` seconds (renewed on
+  every use), so an agent negotiates once and then only sends calls. The
+  credentials (JWT, API key or session cookie) are still checked on every
+  request, and must belong to the user that opened the session;
+- a POST may carry one message or a JSON-RPC batch. When the client
+  accepts ``text/event-stream`` and the POST contains tool calls, the
+  answer is an SSE stream: each response is sent as soon as its call
+  finishes (independent reads run concurrently, see ``execute_tools``),
+  requests with a ``_meta.progressToken`` get ``notifications/progress``
+  as the batch advances, and comment lines keep idle connections open.
+  Otherwise the answer is plain JSON. The stream is a plain generator under
+  WSGI (gunicorn, as deployed) and is driven asynchronously under ASGI;
+- ``DELETE`` ends the session. There is no server-initiated stream, so
+  ``GET`` answers 405 as the transport allows.
+
+Tools run in-process with the caller's tenant and credentials, exactly as
+``POST /mcp/tools/execute/`` does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+from contextlib import nullcontext
+
+import orjson
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from common.api.renderers import dumps
+
+from .models import McpResource
+from .tool_registry import (
+    CATALOG_VERSION,
+    execute_tools,
+    get_catalog_snapshot,
+    iter_tool_results,
+)
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSIONS = ("2025-06-18", "2025-03-26")
+SESSION_HEADER = "Mcp-Session-Id"
+SESSION_KEY_PREFIX = "mcp:session:"
+KEEPALIVE = b": keepalive\n\n"
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+RESOURCE_NOT_FOUND = -32002
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+# ── Messages ─────────────────────────────────────────────────
+
+
+def _result(message_id, result) -> dict:
+    return {"jsonrpc": "2.0", "id": message_id, "result": result}
+
+
+def _error(message_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": message_id, "error": {"code": code, "message": message}}
+
+
+def _progress(token, progress: int, total: int) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "method": "notifications/progress",
+        "params": {"progressToken": token, "progress": progress, "total": total},
+    }
+
+
+def _sse(message: dict) -> bytes:
+    return b"event: message\ndata: " + dumps(message) + b"\n\n"
+
+
+def _is_request(message) -> bool:
+    return isinstance(message, dict) and "method" in message and "id" in message
+
+
+def _is_tool_call(message) -> bool:
+    return _is_request(message) and message["method"] == "tools/call"
+
+
+def _tool_result(result) -> dict:
+    text = result.data if isinstance(result.data, str) else dumps(result.data).decode()
+    answer = {"content": [{"type": "text", "text": text}], "isError": not result.ok}
+    if isinstance(result.data, dict):
+        answer["structuredContent"] = result.data
+    return answer
+
+
+# ── Sessions ─────────────────────────────────────────────────
+
+
+def _session_key(session_id: str) -> str:
+    return f"{SESSION_KEY_PREFIX}{session_id}"
+
+
+def _owner(request) -> dict:
+    tenant = getattr(request, "tenant", None)
+    return {"user": request.user.pk, "tenant": tenant.pk if tenant is not None else None}
+
+
+def open_session(request, params: dict) -> tuple[str, dict]:
+    requested = params.get("protocolVersion")
+    version = requested if requested in PROTOCOL_VERSIONS else PROTOCOL_VERSIONS[0]
+    session_id = secrets.token_urlsafe(24)
+    session = {**_owner(request), "protocolVersion": version}
+    cache.set(_session_key(session_id), session, settings.MCP_SESSION_TTL)
+    return session_id, session
+
+
+def get_session(request, session_id: str) -> dict | None:
+    """The session ``session_id`` if it exists and belongs to this user and tenant."""
+    key = _session_key(session_id)
+    session = cache.get(key)
+    if session is None or {k: session[k] for k in ("user", "tenant")} != _owner(request):
+        return None
+    cache.touch(key, settings.MCP_SESSION_TTL)
+    return session
+
+
+# ── Methods ──────────────────────────────────────────────────
+
+
+def _initialize(session: dict) -> dict:
+    return {
+        "protocolVersion": session["protocolVersion"],
+        "capabilities": {"tools": {"listChanged": False}, "resources": {}},
+        "serverInfo": {"name": "proyecto-semilla", "version": CATALOG_VERSION},
+    }
+
+
+def _tools_list() -> dict:
+    snapshot = get_catalog_snapshot()
+    return {"tools": list(snapshot.tools) if snapshot is not None else []}
+
+
+def _resources(request):
+    tenant = getattr(request, "tenant", None)
+    if tenant is None:
+        return McpResource.objects.none()
+    return McpResource.objects.filter(organization=tenant, server__is_active=True)
+
+
+def _resources_list(request) -> dict:
+    resources = []
+    for resource in _resources(request):
+        entry = {"uri": resource.uri, "name": resource.name, "description": resource.description}
+        if resource.mime_type:
+            entry["mimeType"] = resource.mime_type
+        resources.append(entry)
+    return {"resources": resources}
+
+
+def _resources_read(request, params: dict) -> dict:
+    """The registered resource's metadata; its content lives on the external server."""
+    uri = params.get("uri")
+    resource = _resources(request).select_related("server").filter(uri=uri).first()
+    if resource is None:
+        raise RpcError(RESOURCE_NOT_FOUND, f"Resource not found: {uri}")
+    text = {
+        "uri": resource.uri,
+        "name": resource.name,
+        "description": resource.description,
+        "mimeType": resource.mime_type,
+        "server": {"name": resource.server.name, "endpoint": resource.server.endpoint_url},
+    }
+    return {
+        "contents": [{"uri": uri, "mimeType": "application/json", "text": dumps(text).decode()}]
+    }
+
+
+def dispatch(request, message: dict, session: dict) -> dict | None:
+    """Answer one message other than ``tools/call``; ``None`` for notifications."""
+    if not _is_request(message):
+        return None
+    method, params = message["method"], message.get("params") or {}
+    try:
+        if method == "initialize":
+            return _result(message["id"], _initialize(session))
+        if method == "ping":
+            return _result(message["id"], {})
+        if method == "tools/list":
+            return _result(message["id"], _tools_list())
+        if method == "resources/list":
+            return _result(message["id"], _resources_list(request))
+        if method == "resources/read":
+            return _result(message["id"], _resources_read(request, params))
+        raise RpcError(METHOD_NOT_FOUND, f"Method not found: {method}")
+    except RpcError as exc:
+        return _error(message["id"], exc.code, exc.message)
+    except Exception:
+        logger.exception("MCP method %s failed", method)
+        return _error(message["id"], INTERNAL_ERROR, "Internal error")
+
+
+def _tool_calls(messages: list[dict]) -> tuple[list[dict], list[dict], list[dict]]:
+    """Split tool calls into runnable ones (with their ``calls``) and invalid answers."""
+    snapshot = get_catalog_snapshot()
+    by_name = snapshot.by_name if snapshot is not None else {}
+    runnable, calls, errors = [], [], []
+    for message in messages:
+        params = message.get("params") or {}
+        name, arguments = params.get("name"), params.get("arguments") or {}
+        if name not in by_name:
+            errors.append(_error(message["id"], INVALID_PARAMS, f"Unknown tool: {name}"))
+        elif not isinstance(arguments, dict):
+            errors.append(_error(message["id"], INVALID_PARAMS, "arguments must be an object"))
+        else:
+            runnable.append(message)
+            calls.append({"name": name, "arguments": arguments})
+    return runnable, calls, errors
+
+
+def _progress_token(message: dict):
+    return ((message.get("params") or {}).get("_meta") or {}).get("progressToken")
+
+
+# ── View ─────────────────────────────────────────────────────
+
+
+def _authenticate(http_request) -> Request:
+    """Run DRF's authenticators; raises ``APIException`` on bad credentials."""
+    request = Request(
+        http_request,
+        authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES],
+    )
+    request.user  # noqa: B018 - authenticates
+    return request
+
+
+def _json(payload, status: int = 200, headers: dict | None = None) -> HttpResponse:
+    return HttpResponse(
+        dumps(payload), status=status, content_type="application/json", headers=headers
+    )
+
+
+def _accepts_sse(request) -> bool:
+    return "text/event-stream" in request.headers.get("Accept", "")
+
+
+def _tenant_scope(request):
+    from multitenant.batch import TenantRef, tenant_scope
+
+    tenant = getattr(request, "tenant", None)
+    return tenant_scope(TenantRef.from_tenant(tenant)) if tenant is not None else nullcontext()
+
+
+def _events(request, answers: list[dict], runnable: list[dict], calls: list[dict]):
+    """
+    Yield the immediate answers, then each tool result as its call finishes.
+
+    Runs while the response is sent, after ``TenantMiddleware`` has left the
+    tenant's scope, so it enters the scope itself.
+    """
+    for answer in answers:
+        yield _sse(answer)
+    tokens = {index: _progress_token(message) for index, message in enumerate(runnable)}
+    done = 0
+    with _tenant_scope(request):
+        for item in iter_tool_results(calls, request, heartbeat=settings.MCP_SSE_KEEPALIVE):
+            if item is None:
+                yield KEEPALIVE
+                continue
+            index, result = item
+            done += 1
+            tokens.pop(index, None)
+            for token in tokens.values():
+                if token is not None:
+                    yield _sse(_progress(token, done, len(calls)))
+            yield _sse(_result(runnable[index]["id"], _tool_result(result)))
+
+
+async def _aevents(events):
+    """
+    ``events`` for ASGI servers, which would otherwise buffer a sync iterator.
+
+    Every step runs on the request's thread-sensitive thread (same DB
+    connection and tenant scope); keepalives go out while a step is slow.
+    """
+    step = sync_to_async(next)
+    try:
+        while True:
+            pending = asyncio.ensure_future(step(events, None))
+            while not (await asyncio.wait({pending}, timeout=settings.MCP_SSE_KEEPALIVE))[0]:
+                yield KEEPALIVE
+            chunk = pending.result()
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        await sync_to_async(events.close)()
+
+
+@csrf_exempt
+async def mcp_rpc_view(http_request):
+    if http_request.method not in ("POST", "DELETE"):
+        return HttpResponse(status=405, headers={"Allow": "POST, DELETE"})
+    try:
+        request = await sync_to_async(_authenticate)(http_request)
+    except APIException as exc:
+        return _json({"detail": exc.detail}, status=exc.status_code)
+    if not request.user.is_authenticated:
+        return _json({"detail": "Authentication credentials were not provided."}, status=401)
+
+    session_id = http_request.headers.get(SESSION_HEADER)
+    if http_request.method == "DELETE":
+        if session_id and await sync_to_async(get_session)(request, session_id) is not None:
+            await sync_to_async(cache.delete)(_session_key(session_id))
+            return HttpResponse(status=204)
+        return HttpResponse(status=404)
+
+    try:
+        payload = orjson.loads(http_request.body)
+    except orjson.JSONDecodeError:
+        return _json(_error(None, PARSE_ERROR, "Parse error"), status=400)
+    batch = isinstance(payload, list)
+    messages = payload if batch else [payload]
+    valid = all(isinstance(m, dict) and m.get("jsonrpc") == "2.0" for m in messages)
+    if not messages or not valid:
+        return _json(_error(None, INVALID_REQUEST, "Invalid request"), status=400)
+    if len(messages) > settings.MCP_TOOL_BATCH_MAX:
+        return _json(_error(None, INVALID_REQUEST, "Batch too large"), status=400)
+
+    headers = {}
+    initialize = next((m for m in messages if m.get("method") == "initialize"), None)
+    if initialize is not None:
+        session_id, session = await sync_to_async(open_session)(
+            request, initialize.get("params") or {}
+        )
+        headers[SESSION_HEADER] = session_id
+    elif not session_id:
+        return _json(_error(None, INVALID_REQUEST, f"Missing {SESSION_HEADER} header"), 400)
+    else:
+        session = await sync_to_async(get_session)(request, session_id)
+        if session is None:
+            return _json(_error(None, INVALID_REQUEST, "Unknown session"), status=404)
+
+    tool_messages = [m for m in messages if _is_tool_call(m)]
+    answers = []
+    for message in messages:
+        if not _is_tool_call(message):
+            answer = await sync_to_async(dispatch)(request, message, session)
+            if answer is not None:
+                answers.append(answer)
+    runnable, calls, errors = await sync_to_async(_tool_calls)(tool_messages)
+    answers += errors
+
+    if calls and _accepts_sse(http_request):
+        events = _events(request, answers, runnable, calls)
+        response = StreamingHttpResponse(
+            _aevents(events) if isinstance(http_request, ASGIRequest) else events,
+            content_type="text/event-stream",
+            headers=headers,
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    if calls:
+        results = await sync_to_async(execute_tools)(calls, request)
+        answers += [
+            _result(message["id"], _tool_result(result))
+            for message, result in zip(runnable, results, strict=True)
+        ]
+    if not answers:
+        # Only notifications and responses: accepted, nothing to say.
+        return HttpResponse(status=202, headers=headers)
+    return _json(answers if batch else answers[0], headers=headers)
@@ -3,7 +3,15 @@ from __future__ import annotations
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import McpResourceViewSet, McpServerViewSet, McpToolViewSet, McpUsageLogViewSet, tool_catalog_view
+from .views import (
+    McpResourceViewSet,
+    McpServerViewSet,
+    McpToolViewSet,
+    McpUsageLogViewSet,
+    tool_catalog_view,
+    tool_execute_view,
+)
+from .transport import mcp_rpc_view
 
 router = DefaultRouter()
 router.trailing_slash = "/?"
@@ -14,5 +22,8 @@ router.register("usage-logs", McpUsageLogViewSet, basename="usage-logs")
 
 urlpatterns = [
     path("catalog/", tool_catalog_view, name="tool-catalog"),
+    # Before the router: "tools/<pk>/" would otherwise match.
+    path("tools/execute/", tool_execute_view, name="tool-execute"),
+    path("rpc/", mcp_rpc_view, name="rpc"),
     path("", include(router.urls)),
 ]
@@ -0,0 +1,226 @@
+"""
+Write-behind logger for ``McpUsageLog``.
+
+Audit rows carry the full ``request_data``/``response_data`` of a tool call,
+so inserting them inside the caller's request costs a large INSERT (and its
+transaction) on every call. Entries are queued instead and written in
+batches:
+
+- ``record_usage`` builds the row in memory and puts it on a bounded
+  in-process queue; no database access, no JSON encoding;
+- a daemon thread (started on first use, again after a fork) takes up to
+  ``MCP_USAGE_LOG_BATCH_SIZE`` entries or whatever arrived within
+  ``MCP_USAGE_LOG_FLUSH_SECONDS`` and writes them with one ``bulk_create``
+  per tenant;
+- when the queue is full (``MCP_USAGE_LOG_QUEUE_SIZE``) the caller waits at
+  most ``MCP_USAGE_LOG_PUT_TIMEOUT`` seconds, then the entry is dropped and
+  counted in ``mcp_usage_log_dropped_total``: auditing sheds load, it never
+  slows tool calls down;
+- payloads whose JSON exceeds ``MCP_USAGE_LOG_MAX_PAYLOAD_BYTES`` are
+  compressed or truncated (``MCP_USAGE_LOG_OVERSIZE``) by the writer thread;
+  ``expand_payload`` restores compressed ones.
+
+``flush_usage_logs`` drains the queue in the calling thread; it also runs at
+interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import base64
+import logging
+import os
+import queue
+import threading
+import time
+import zlib
+from collections import defaultdict
+
+import orjson
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from prometheus_client import Counter, Gauge
+
+from common.api.renderers import dumps
+from multitenant.batch import list_tenants, tenant_scope
+
+from .models import McpUsageLog
+
+logger = logging.getLogger(__name__)
+
+COMPRESSED = "zlib+base64"
+
+USAGE_LOG_WRITTEN = Counter("mcp_usage_log_written_total", "MCP usage log rows written")
+USAGE_LOG_DROPPED = Counter(
+    "mcp_usage_log_dropped_total",
+    "MCP usage log entries dropped",
+    ["reason"],
+)
+USAGE_LOG_QUEUE_DEPTH = Gauge("mcp_usage_log_queue_depth", "MCP usage log entries waiting")
+
+_lock = threading.Lock()
+_queue: queue.Queue | None = None
+_worker: threading.Thread | None = None
+_pid: int | None = None
+
+
+def _get_queue() -> queue.Queue:
+    """The process's queue, started with its writer thread (recreated after a fork)."""
+    global _queue, _worker, _pid
+    if _queue is not None and _pid == os.getpid():
+        return _queue
+    with _lock:
+        if _queue is None or _pid != os.getpid():
+            _queue = queue.Queue(maxsize=settings.MCP_USAGE_LOG_QUEUE_SIZE)
+            _pid = os.getpid()
+            _worker = None
+            USAGE_LOG_QUEUE_DEPTH.set_function(_queue.qsize)
+        if _worker is None and settings.MCP_USAGE_LOG_WORKER:
+            _worker = threading.Thread(
+                target=_run, args=(_queue,), name="mcp-usage-log", daemon=True
+            )
+            _worker.start()
+    return _queue
+
+
+def record_usage(
+    *,
+    organization_id: int,
+    server_id: int,
+    tool_id: int,
+    user_id: int,
+    request_data: dict | None = None,
+    response_data=None,
+) -> bool:
+    """
+    Queue one audit row. Returns False when it was dropped.
+
+    The payloads are encoded later by the writer thread: don't mutate them
+    after the call.
+    """
+    entry = McpUsageLog(
+        organization_id=organization_id,
+        server_id=server_id,
+        tool_id=tool_id,
+        user_id=user_id,
+        request_data=request_data or {},
+        response_data=response_data,
+        created_at=timezone.now(),
+    )
+    timeout = settings.MCP_USAGE_LOG_PUT_TIMEOUT
+    try:
+        if timeout > 0:
+            _get_queue().put(entry, timeout=timeout)
+        else:
+            _get_queue().put_nowait(entry)
+    except queue.Full:
+        USAGE_LOG_DROPPED.labels("queue_full").inc()
+        logger.debug("MCP usage log queue full, dropping entry")
+        return False
+    return True
+
+
+# ── Payloads ─────────────────────────────────────────────────
+
+
+def shrink_payload(data):
+    """``data``, or a compressed/truncated stand-in when its JSON is too large."""
+    limit = settings.MCP_USAGE_LOG_MAX_PAYLOAD_BYTES
+    mode = settings.MCP_USAGE_LOG_OVERSIZE
+    if data is None or not limit or mode == "keep":
+        return data
+    encoded = dumps(data)
+    if len(encoded) <= limit:
+        return data
+    if mode == "compress":
+        packed = base64.b64encode(zlib.compress(encoded, 6)).decode()
+        if len(packed) <= limit:
+            return {"_encoding": COMPRESSED, "size": len(encoded), "data": packed}
+    return {
+        "_truncated": True,
+        "size": len(encoded),
+        "preview": encoded[:limit].decode(errors="ignore"),
+    }
+
+
+def expand_payload(value):
+    """Inverse of ``shrink_payload`` for compressed payloads; others are returned as-is."""
+    if isinstance(value, dict) and value.get("_encoding") == COMPRESSED:
+        return orjson.loads(zlib.decompress(base64.b64decode(value["data"])))
+    return value
+
+
+# ── Writer ───────────────────────────────────────────────────
+
+
+def _write(entries: list[McpUsageLog]) -> int:
+    by_tenant: dict[int, list[McpUsageLog]] = defaultdict(list)
+    for entry in entries:
+        entry.request_data = shrink_payload(entry.request_data)
+        entry.response_data = shrink_payload(entry.response_data)
+        by_tenant[entry.organization_id].append(entry)
+
+    written = 0
+    refs = {ref.id: ref for ref in list_tenants(include_inactive=True, ids=by_tenant)}
+    for tenant_id, rows in by_tenant.items():
+        ref = refs.get(tenant_id)
+        if ref is None:
+            USAGE_LOG_DROPPED.labels("no_tenant").inc(len(rows))
+            continue
+        try:
+            with tenant_scope(ref):
+                McpUsageLog.objects.bulk_create(rows)
+        except Exception:
+            USAGE_LOG_DROPPED.labels("error").inc(len(rows))
+            logger.exception("Could not write %d MCP usage logs for %s", len(rows), ref.slug)
+            continue
+        written += len(rows)
+    USAGE_LOG_WRITTEN.inc(written)
+    return written
+
+
+def _take(source: queue.Queue, first: McpUsageLog, wait: float) -> list[McpUsageLog]:
+    """``first`` plus what arrives within ``wait`` seconds, up to a batch."""
+    entries = [first]
+    deadline = time.monotonic() + wait
+    while len(entries) < settings.MCP_USAGE_LOG_BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        try:
+            entries.append(source.get(timeout=remaining) if remaining > 0 else source.get_nowait())
+        except queue.Empty:
+            break
+    return entries
+
+
+def _run(source: queue.Queue) -> None:
+    atexit.register(flush_usage_logs)
+    while True:
+        entries = _take(source, source.get(), settings.MCP_USAGE_LOG_FLUSH_SECONDS)
+        try:
+            close_old_connections()
+            _write(entries)
+        except Exception:
+            USAGE_LOG_DROPPED.labels("error").inc(len(entries))
+            logger.exception("MCP usage log writer failed")
+        finally:
+            for _ in entries:
+                source.task_done()
+
+
+def flush_usage_logs() -> int:
+    """Write everything queued so far from this thread. Returns the rows written."""
+    if _queue is None or _pid != os.getpid():
+        return 0
+    written = 0
+    while True:
+        try:
+            first = _queue.get_nowait()
+        except queue.Empty:
+            return written
+        entries = _take(_queue, first, 0)
+        try:
+            written += _write(entries)
+        finally:
+            for _ in entries:
+                _queue.task_done()
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from rest_framework import mixins, viewsets
-from rest_framework.exceptions import NotFound
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from rest_framework import mixins, serializers, status, viewsets
+from rest_framework.exceptions import NotFound, Throttled
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from common.api.pagination import CursorPaginationMixin
 
 from .models import McpResource, McpServer, McpTool, McpUsageLog
 from .serializers import (
@@ -11,6 +17,7 @@ from .serializers import (
     McpToolSerializer,
     McpUsageLogSerializer,
 )
+from .usage import record_usage
 
 
 def request_tenant(request):
@@ -96,6 +103,7 @@ class McpResourceViewSet(
 
 
 class McpUsageLogViewSet(
+    CursorPaginationMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -112,16 +120,29 @@ class McpUsageLogViewSet(
             "server", "tool", "user"
         )
 
-    def perform_create(self, serializer):
-        serializer.save(organization=self.get_organization())
+    def create(self, request, *args, **kwargs):
+        """Queue the entry for the write-behind logger (``mcp.usage``): 202, no id yet."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        queued = record_usage(
+            organization_id=self.get_organization().pk,
+            server_id=data["server"].pk,
+            tool_id=data["tool"].pk,
+            user_id=data["user"].pk,
+            request_data=data.get("request_data"),
+            response_data=data.get("response_data"),
+        )
+        if not queued:
+            raise Throttled(wait=1, detail="Usage log queue is full.")
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
 
 
 # ── MCP Protocol Endpoint ────────────────────────────────────
 
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.response import Response
 
-from .tool_registry import get_tools_catalog
+from .tool_registry import CATALOG_VERSION, execute_tools, get_catalog_snapshot
 
 
 @api_view(["GET"])
@@ -144,10 +165,54 @@ def tool_catalog_view(request):
             ...
         ]
     }
+
+    The encoded body is built once per process (see ``get_catalog_snapshot``)
+    and carries an ETag, so polling agents get a 304 with no work done.
+    """
+    snapshot = get_catalog_snapshot()
+    if snapshot is None:
+        return Response({"tools": [], "count": 0, "version": CATALOG_VERSION})
+    response = get_conditional_response(request._request, etag=snapshot.etag) or HttpResponse(
+        snapshot.body, content_type="application/json"
+    )
+    response["ETag"] = snapshot.etag
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+class ToolCallSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=200)
+    arguments = serializers.DictField(required=False, default=dict)
+
+
+class ToolBatchSerializer(serializers.Serializer):
+    calls = serializers.ListField(child=ToolCallSerializer(), allow_empty=False)
+
+    def validate_calls(self, value):
+        limit = settings.MCP_TOOL_BATCH_MAX
+        if len(value) > limit:
+            raise serializers.ValidationError(f"At most {limit} calls per batch.")
+        return value
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def tool_execute_view(request):
+    """
+    Execute one or more tools in-process with the caller's tenant and credentials.
+
+    Body: ``{"calls": [{"name": "courses_list", "arguments": {"page": 1}}, ...]}``.
+    Response: ``{"results": [{"name", "status", "data"}, ...]}`` in call order.
+    Consecutive read tools run concurrently (see ``execute_tools``).
     """
-    tools = get_tools_catalog()
-    return Response({
-        "tools": tools,
-        "count": len(tools),
-        "version": "1.0",
-    })
+    payload = ToolBatchSerializer(data=request.data)
+    payload.is_valid(raise_exception=True)
+    results = execute_tools(payload.validated_data["calls"], request)
+    return Response(
+        {
+            "results": [
+                {"name": result.name, "status": result.status, "data": result.data}
+                for result in results
+            ]
+        }
+    )
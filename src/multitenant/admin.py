@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from django.contrib import admin
 
-from .models import Domain, Tenant
+from .models import Domain, PooledSchema, Tenant
 
 
 @admin.register(Tenant)
@@ -17,3 +17,8 @@ class DomainAdmin(admin.ModelAdmin):
     search_fields = ("domain",)
     list_filter = ("is_primary",)
 
+
+
+@admin.register(PooledSchema)
+class PooledSchemaAdmin(admin.ModelAdmin):
+    list_display = ("schema_name", "created_at")
@@ -1,9 +1,33 @@
 from __future__ import annotations
 
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def _sync_rls_policies(sender, using, **kwargs):
+    from django.db import connections
+
+    from common.rls import sync_rls_policies
+
+    if connections[using].vendor == "postgresql":
+        sync_rls_policies(using)
 
 
 class MultitenantConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "multitenant"
 
+    def ready(self):
+        from django.conf import settings
+
+        from . import signals  # noqa: F401
+
+        mode = getattr(settings, "MULTITENANT_MODE", "off")
+        if mode == "database":
+            from . import task_context  # noqa: F401
+        elif mode == "shared":
+            # RLS is the only isolation: (re)apply the policies after every
+            # migrate run so tables created by any app are covered.
+            post_migrate.connect(
+                _sync_rls_policies, sender=self, dispatch_uid="multitenant_sync_rls_policies"
+            )
@@ -0,0 +1,228 @@
+"""
+Run a maintenance callable once per tenant.
+
+Billing resets, RLS changes, reseeding and data fixes all iterate tenants.
+``run_for_tenants`` does the iteration once, for every tenancy mode:
+
+- each call runs inside the tenant's scope (schema, database or RLS
+  transaction) and, by default, in its own transaction;
+- tenants are spread over up to ``processes`` forked workers;
+- failures are retried, then reported without stopping the batch;
+- finished tenants are appended to a JSON-lines checkpoint, so a rerun with
+  the same checkpoint resumes where the previous one stopped.
+
+The callable receives the tenant row as seen from inside its scope and
+must be importable (a module-level function or its dotted path) so it can
+be sent to worker processes.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import time
+import traceback
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, nullcontext
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils.module_loading import import_string
+
+from common.rls import tenant_transaction
+
+from .databases import get_current_database, tenant_database
+from .models import Tenant
+from .schema import PUBLIC_SCHEMA_NAME, schema_context
+
+OK, FAILED, SKIPPED = "ok", "failed", "skipped"
+
+
+@dataclass(frozen=True)
+class TenantRef:
+    """What a worker needs to enter a tenant's scope (picklable)."""
+
+    id: int
+    slug: str
+    schema_name: str
+    database: str = ""
+
+    @classmethod
+    def from_tenant(cls, tenant: Tenant) -> TenantRef:
+        return cls(tenant.id, tenant.slug, tenant.schema_name, tenant.database)
+
+
+@dataclass(frozen=True)
+class TenantOutcome:
+    slug: str
+    status: str
+    seconds: float
+    attempts: int = 1
+    error: str = ""
+
+
+@dataclass
+class BatchReport:
+    outcomes: list[TenantOutcome] = field(default_factory=list)
+    resumed: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def count(self, status: str) -> int:
+        return sum(1 for outcome in self.outcomes if outcome.status == status)
+
+    @property
+    def failures(self) -> list[TenantOutcome]:
+        return [outcome for outcome in self.outcomes if outcome.status == FAILED]
+
+
+def list_tenants(
+    slugs: Iterable[str] | None = None,
+    include_inactive: bool = False,
+    ids: Iterable[int] | None = None,
+):
+    """Tenant refs from the registry (public schema / default database)."""
+    with schema_context(PUBLIC_SCHEMA_NAME):
+        tenants = Tenant.objects.using(DEFAULT_DB_ALIAS).order_by("slug")
+        if not include_inactive:
+            tenants = tenants.filter(is_active=True)
+        if slugs:
+            tenants = tenants.filter(slug__in=list(slugs))
+        if ids is not None:
+            tenants = tenants.filter(id__in=list(ids))
+        return [TenantRef.from_tenant(tenant) for tenant in tenants]
+
+
+def tenant_scope(ref: TenantRef):
+    """Context manager entering ``ref``'s scope for the current tenancy mode."""
+    mode = getattr(settings, "MULTITENANT_MODE", "off")
+    if mode == "schema":
+        return schema_context(ref.schema_name)
+    if mode == "database":
+        return tenant_database(ref.database or DEFAULT_DB_ALIAS)
+    if mode == "shared":
+        return tenant_transaction(ref.id)
+    return nullcontext()
+
+
+def run_tenant(func, ref: TenantRef, atomic: bool = True, attempt: int = 1) -> TenantOutcome:
+    """Run ``func`` for one tenant. Never raises; runs inside pool workers."""
+    started = time.monotonic()
+    try:
+        if isinstance(func, str):
+            func = import_string(func)
+        with ExitStack() as stack:
+            stack.enter_context(tenant_scope(ref))
+            if atomic:
+                # On the connection the scope routes to (the tenant's alias in database mode).
+                using = get_current_database() or DEFAULT_DB_ALIAS
+                stack.enter_context(transaction.atomic(using=using))
+            try:
+                tenant = Tenant.objects.get(id=ref.id)
+            except Tenant.DoesNotExist:
+                return TenantOutcome(ref.slug, SKIPPED, time.monotonic() - started, attempt)
+            func(tenant)
+        return TenantOutcome(ref.slug, OK, time.monotonic() - started, attempt)
+    except Exception:
+        return TenantOutcome(
+            ref.slug, FAILED, time.monotonic() - started, attempt, traceback.format_exc(limit=5)
+        )
+
+
+def _read_checkpoint(path: Path) -> set[str]:
+    if not path.exists():
+        return set()
+    done = set()
+    for line in path.read_text().splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue  # partially written last line
+        if entry.get("status") in (OK, SKIPPED):
+            done.add(entry["slug"])
+    return done
+
+
+def run_for_tenants(
+    func: Callable | str,
+    tenants: list[TenantRef] | None = None,
+    *,
+    processes: int = 1,
+    atomic: bool = True,
+    retries: int = 0,
+    checkpoint: str | Path | None = None,
+    progress: Callable[[int, int, TenantOutcome], None] | None = None,
+) -> BatchReport:
+    """
+    Call ``func(tenant)`` for every tenant (default: all active tenants).
+
+    ``progress(done, total, outcome)`` is called as each tenant finishes.
+    Tenants already recorded as done in ``checkpoint`` are not run again.
+    """
+    started = time.monotonic()
+    tenants = list_tenants() if tenants is None else tenants
+    report = BatchReport()
+
+    checkpoint_path = Path(checkpoint) if checkpoint else None
+    if checkpoint_path is not None:
+        done = _read_checkpoint(checkpoint_path)
+        report.resumed = [ref.slug for ref in tenants if ref.slug in done]
+        tenants = [ref for ref in tenants if ref.slug not in done]
+
+    total = len(tenants)
+    finished = 0
+    log = checkpoint_path.open("a") if checkpoint_path is not None else None
+
+    def record(outcome: TenantOutcome) -> None:
+        nonlocal finished
+        finished += 1
+        report.outcomes.append(outcome)
+        if log is not None:
+            log.write(json.dumps(asdict(outcome)) + "\n")
+            log.flush()
+        if progress is not None:
+            progress(finished, total, outcome)
+
+    try:
+        pending = tenants
+        for attempt in range(1, retries + 2):
+            last_try = attempt == retries + 1
+            failed = []
+            for ref, outcome in _execute(func, pending, processes, atomic, attempt):
+                if outcome.status == FAILED and not last_try:
+                    failed.append(ref)
+                else:
+                    record(outcome)
+            pending = failed
+            if not pending:
+                break
+    finally:
+        if log is not None:
+            log.close()
+
+    report.seconds = time.monotonic() - started
+    return report
+
+
+def _execute(func, refs: list[TenantRef], processes: int, atomic: bool, attempt: int):
+    """Yield ``(ref, outcome)`` as tenants finish."""
+    processes = max(1, min(processes, len(refs)))
+    if processes == 1:
+        for ref in refs:
+            yield ref, run_tenant(func, ref, atomic, attempt)
+        return
+
+    # Forked workers must not share the parent's DB sockets.
+    connections.close_all()
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+        futures = {pool.submit(run_tenant, func, ref, atomic, attempt): ref for ref in refs}
+        for future in as_completed(futures):
+            ref = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as exc:  # worker crashed
+                outcome = TenantOutcome(ref.slug, FAILED, 0.0, attempt, repr(exc))
+            yield ref, outcome
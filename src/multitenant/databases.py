@@ -0,0 +1,90 @@
+"""
+Database-per-tenant support (``MULTITENANT_MODE = "database"``).
+
+Each ``Tenant`` names the connection alias holding its data in
+``Tenant.database`` (empty = ``default``). Aliases are declared in
+``TENANT_DATABASES`` (alias → URL) and registered with Django's connection
+handler the first time they are used, so a process only configures the
+shards it actually touches. Connections themselves are opened lazily by
+Django and kept alive with ``CONN_MAX_AGE`` (or a psycopg pool on Django
+5.1+ when ``TENANT_DATABASE_POOL`` is on).
+
+The active alias lives in a context variable: ``TenantMiddleware`` sets it
+per request, Celery tasks inherit it from the publisher (see
+``multitenant.task_context``) and commands use ``tenant_database()``.
+``multitenant.routers.TenantDatabaseRouter`` sends ORM queries there.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+
+import dj_database_url
+import django
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections
+
+_current_database: ContextVar[str | None] = ContextVar("tenant_database", default=None)
+_register_lock = threading.Lock()
+
+
+def get_tenant_databases() -> dict[str, str]:
+    return dict(getattr(settings, "TENANT_DATABASES", {}) or {})
+
+
+def ensure_database(alias: str) -> str:
+    """Make ``alias`` usable through ``django.db.connections``. Returns it."""
+    if not alias or alias in connections.settings:
+        return alias or DEFAULT_DB_ALIAS
+    with _register_lock:
+        if alias in connections.settings:
+            return alias
+        url = get_tenant_databases().get(alias)
+        if not url:
+            raise ImproperlyConfigured(
+                f"Unknown tenant database alias {alias!r} (see TENANT_DATABASES)."
+            )
+        config = dj_database_url.parse(
+            url, conn_max_age=getattr(settings, "TENANT_DATABASE_CONN_MAX_AGE", 600)
+        )
+        if getattr(settings, "TENANT_DATABASE_POOL", False) and django.VERSION >= (5, 1):
+            config["CONN_MAX_AGE"] = 0  # pooling and persistent connections are exclusive
+            config.setdefault("OPTIONS", {})["pool"] = True
+        configured = connections.configure_settings(
+            {DEFAULT_DB_ALIAS: connections.settings[DEFAULT_DB_ALIAS], alias: config}
+        )
+        connections.settings[alias] = configured[alias]
+    return alias
+
+
+def database_for_tenant(tenant) -> str:
+    return getattr(tenant, "database", "") or DEFAULT_DB_ALIAS
+
+
+def get_current_database() -> str | None:
+    return _current_database.get()
+
+
+def activate_database(alias: str) -> Token:
+    return _current_database.set(ensure_database(alias))
+
+
+def deactivate_database(token: Token) -> None:
+    _current_database.reset(token)
+
+
+@contextmanager
+def tenant_database(alias_or_tenant):
+    """Route ORM queries to a tenant's database for the duration of the block."""
+    if isinstance(alias_or_tenant, str):
+        alias = alias_or_tenant
+    else:
+        alias = database_for_tenant(alias_or_tenant)
+    token = activate_database(alias)
+    try:
+        yield alias
+    finally:
+        deactivate_database(token)
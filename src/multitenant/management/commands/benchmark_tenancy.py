@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from common.rls import tenant_predicate, tenant_transaction
+from multitenant.schema import PUBLIC_SCHEMA_NAME, set_schema
+
+SCHEMA_PREFIX = "bench_t"
+SHARED_SCHEMA = "bench_shared"
+CATALOGS = ("pg_class", "pg_attribute", "pg_index", "pg_depend", "pg_type", "pg_constraint")
+BATCH = 200
+
+TABLE_DDL = """
+CREATE TABLE {table} (
+    id bigserial PRIMARY KEY,
+    organization_id bigint NOT NULL,
+    name text NOT NULL,
+    created_at timestamptz NOT NULL DEFAULT now()
+)
+"""
+QUERY = "SELECT id, name FROM {table} {where} ORDER BY created_at DESC LIMIT 20"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare schema-per-tenant and shared-schema (RLS) tenancy at N tenants: "
+        "catalog growth, build time and per-request query latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tenants", type=int, default=10_000)
+        parser.add_argument("--rows-per-tenant", type=int, default=20)
+        parser.add_argument("--queries", type=int, default=2_000)
+        parser.add_argument("--mode", choices=("both", "schema", "shared"), default="both")
+        parser.add_argument(
+            "--keep", action="store_true", help="Keep the benchmark schemas afterwards."
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("The tenancy benchmark needs PostgreSQL.")
+        tenants = options["tenants"]
+        if tenants <= 0:
+            raise CommandError("--tenants must be positive.")
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT rolsuper OR rolbypassrls FROM pg_roles WHERE rolname = current_user"
+            )
+            if cursor.fetchone()[0]:
+                self.stdout.write(
+                    self.style.WARNING(
+                        "Current role bypasses RLS: shared-mode latency excludes policy cost."
+                    )
+                )
+
+        modes = ("schema", "shared") if options["mode"] == "both" else (options["mode"],)
+        results = {}
+        try:
+            for mode in modes:
+                self.stdout.write(f"Building {mode} mode with {tenants} tenant(s)...")
+                before = self._catalog()
+                started = time.monotonic()
+                getattr(self, f"_build_{mode}")(tenants, options["rows_per_tenant"])
+                build = time.monotonic() - started
+                after = self._catalog()
+                latencies = getattr(self, f"_query_{mode}")(tenants, options["queries"])
+                results[mode] = (build, after[0] - before[0], after[1] - before[1], latencies)
+        finally:
+            set_schema(PUBLIC_SCHEMA_NAME)
+            if not options["keep"]:
+                self._cleanup(tenants)
+
+        self.stdout.write("")
+        self.stdout.write(
+            f"{'mode':<8}{'build s':>10}{'relations':>12}{'catalog MB':>12}"
+            f"{'p50 ms':>9}{'p95 ms':>9}{'mean ms':>9}"
+        )
+        for mode, (build, relations, size, latencies) in results.items():
+            p50 = statistics.median(latencies)
+            p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else p50
+            self.stdout.write(
+                f"{mode:<8}{build:>10.1f}{relations:>12}{size / 1_048_576:>12.1f}"
+                f"{p50:>9.3f}{p95:>9.3f}{statistics.fmean(latencies):>9.3f}"
+            )
+
+    def _catalog(self) -> tuple[int, int]:
+        sizes = " + ".join(f"pg_total_relation_size('pg_catalog.{name}')" for name in CATALOGS)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT (SELECT count(*) FROM pg_class), {sizes}")  # noqa: S608
+            relations, size = cursor.fetchone()
+        return int(relations), int(size)
+
+    def _build_schema(self, tenants: int, rows: int) -> None:
+        for start in range(0, tenants, BATCH):
+            statements = []
+            for i in range(start, min(start + BATCH, tenants)):
+                table = f"{SCHEMA_PREFIX}{i}.items"
+                statements += [
+                    f"CREATE SCHEMA {SCHEMA_PREFIX}{i}",
+                    TABLE_DDL.format(table=table),
+                    f"CREATE INDEX ON {table} (created_at)",
+                    f"INSERT INTO {table} (organization_id, name) "  # noqa: S608
+                    f"SELECT {i}, 'item ' || g FROM generate_series(1, {rows}) g",
+                ]
+            with connection.cursor() as cursor:
+                cursor.execute(";".join(statements))
+            self.stdout.write(f"  {min(start + BATCH, tenants)}/{tenants}")
+
+    def _build_shared(self, tenants: int, rows: int) -> None:
+        table = f"{SHARED_SCHEMA}.items"
+        with connection.cursor() as cursor:
+            cursor.execute(f"CREATE SCHEMA {SHARED_SCHEMA}")
+            cursor.execute(TABLE_DDL.format(table=table))
+            cursor.execute(
+                f"INSERT INTO {table} (organization_id, name) "  # noqa: S608
+                "SELECT t, 'item ' || g FROM generate_series(0, %s) t, generate_series(1, %s) g",
+                [tenants - 1, rows],
+            )
+            cursor.execute(f"CREATE INDEX ON {table} (organization_id, created_at)")
+            cursor.execute(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY")
+            cursor.execute(f"ALTER TABLE {table} FORCE ROW LEVEL SECURITY")
+            cursor.execute(
+                f"CREATE POLICY tenant_isolation ON {table} "
+                f"USING ({tenant_predicate('organization_id')})"
+            )
+            cursor.execute(f"ANALYZE {table}")
+
+    def _query_schema(self, tenants: int, queries: int) -> list[float]:
+        latencies = []
+        sql = QUERY.format(table="items", where="")
+        for _ in range(queries):
+            tenant = random.randrange(tenants)  # noqa: S311
+            started = time.perf_counter()
+            set_schema(f"{SCHEMA_PREFIX}{tenant}", include_public=False)
+            with connection.cursor() as cursor:
+                cursor.execute(sql)
+                cursor.fetchall()
+            latencies.append((time.perf_counter() - started) * 1000)
+        return latencies
+
+    def _query_shared(self, tenants: int, queries: int) -> list[float]:
+        latencies = []
+        sql = QUERY.format(table=f"{SHARED_SCHEMA}.items", where="WHERE organization_id = %s")
+        for _ in range(queries):
+            tenant = random.randrange(tenants)  # noqa: S311
+            started = time.perf_counter()
+            with tenant_transaction(tenant), connection.cursor() as cursor:
+                cursor.execute(sql, [tenant])
+                cursor.fetchall()
+            latencies.append((time.perf_counter() - started) * 1000)
+        return latencies
+
+    def _cleanup(self, tenants: int) -> None:
+        self.stdout.write("Dropping benchmark schemas...")
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA IF EXISTS {SHARED_SCHEMA} CASCADE")
+            for start in range(0, tenants, BATCH):
+                cursor.execute(
+                    ";".join(
+                        f"DROP SCHEMA IF EXISTS {SCHEMA_PREFIX}{i} CASCADE"
+                        for i in range(start, min(start + BATCH, tenants))
+                    )
+                )
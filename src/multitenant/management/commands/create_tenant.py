@@ -3,9 +3,13 @@ from __future__ import annotations
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 from django.core.management import call_command
-from django.db import transaction, connection
+from django.db import DEFAULT_DB_ALIAS, transaction
 
+from common.rls import set_transaction_tenant
+from core.services.seed import seed_default_roles
+from multitenant.databases import ensure_database, get_tenant_databases
 from multitenant.models import Domain, Tenant
+from multitenant.provisioning import PROVISIONING_MODES, clone_template, get_provisioning_mode
 from multitenant.schema import PUBLIC_SCHEMA_NAME, create_schema, drop_schema, schema_context
 
 
@@ -19,10 +23,24 @@ class Command(BaseCommand):
         parser.add_argument("--domain", dest="domain", help="Primary full domain override.")
         parser.add_argument("--plan", dest="plan_code", default="")
         parser.add_argument("--inactive", action="store_true")
+        parser.add_argument(
+            "--provisioning",
+            choices=PROVISIONING_MODES,
+            help="Override TENANT_PROVISIONING (migrate the schema or clone the template).",
+        )
+        parser.add_argument(
+            "--database",
+            dest="database",
+            default="",
+            help="TENANT_DATABASES alias holding the tenant's data (database mode only).",
+        )
 
     def handle(self, *args, **options):
-        if getattr(settings, "MULTITENANT_MODE", "off") != "schema":
-            raise CommandError("MULTITENANT_MODE must be 'schema' to create tenants.")
+        mode = getattr(settings, "MULTITENANT_MODE", "off")
+        if mode not in ("schema", "database", "shared"):
+            raise CommandError(
+                "MULTITENANT_MODE must be 'schema', 'database' or 'shared' to create tenants."
+            )
 
         slug = options["slug"].lower()
         schema_name = (options.get("schema_name") or slug).lower()
@@ -37,6 +55,13 @@ class Command(BaseCommand):
         )
         tenant.full_clean()
 
+        if mode == "database":
+            self._create_in_database(tenant, domain, options["database"])
+            return
+        if mode == "shared":
+            self._create_shared(tenant, domain)
+            return
+
         # Phase 1: Create tenant, schema, and domain in public (atomic DML)
         with transaction.atomic():
             with schema_context(PUBLIC_SCHEMA_NAME):
@@ -44,43 +69,103 @@ class Command(BaseCommand):
                 create_schema(schema_name)
                 Domain.objects.create(tenant=tenant, domain=domain, is_primary=True)
 
-        # Phase 2: Run migrations in new schema (DDL - must be outside transaction)
+        # Phase 2: Build the schema (DDL - must be outside transaction)
         # PostgreSQL cannot run ALTER TABLE with pending trigger events in same transaction
+        provisioning = options.get("provisioning") or get_provisioning_mode()
         try:
-            with schema_context(schema_name):
-                # Force search path to strictly tenant schema
-                with connection.cursor() as cursor:
-                    cursor.execute(f'SET search_path TO "{schema_name}"')
-                call_command("migrate", interactive=False, verbosity=0)
+            if provisioning == "clone":
+                clone_template(tenant)
+            else:
+                # Strict search path (tenant schema only) so tables land in the new schema
+                with schema_context(schema_name, include_public=False):
+                    call_command("migrate", interactive=False, verbosity=0)
         except Exception as e:
-            # Rollback phase 1 if migrations fail
-            self.stderr.write(self.style.ERROR(f"Migration failed: {e}"))
+            # Rollback phase 1 if provisioning fails
+            self.stderr.write(self.style.ERROR(f"Provisioning failed: {e}"))
             with schema_context(PUBLIC_SCHEMA_NAME):
                 Domain.objects.filter(tenant=tenant).delete()
                 tenant.delete()
             drop_schema(schema_name)
-            raise CommandError(f"Migration failed, tenant rolled back: {e}") from e
+            raise CommandError(f"Provisioning failed, tenant rolled back: {e}") from e
 
-        # Phase 3: Create tenant copy in new schema (atomic DML)
+        # Phase 3: Create tenant copy in new schema (atomic DML);
+        # a cloned schema already has it, re-pointed from the template's placeholder.
         with transaction.atomic():
             with schema_context(schema_name):
-                # Restore search path to include public
-                with connection.cursor() as cursor:
-                    cursor.execute(f'SET search_path TO "{schema_name}", {PUBLIC_SCHEMA_NAME}')
-                Tenant.objects.create(
+                Tenant.objects.update_or_create(
+                    id=tenant.id,
+                    defaults={
+                        "name": tenant.name,
+                        "slug": tenant.slug,
+                        "schema_name": tenant.schema_name,
+                        "is_active": tenant.is_active,
+                        "plan_code": tenant.plan_code,
+                        "trial_ends_at": tenant.trial_ends_at,
+                        "enabled_modules": tenant.enabled_modules,
+                        "branding": getattr(tenant, "branding", {}) or {},
+                    },
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created tenant '{tenant.slug}' with schema '{tenant.schema_name}' "
+                f"and domain '{domain}'."
+            )
+        )
+
+    def _create_shared(self, tenant: Tenant, domain: str) -> None:
+        """Shared-schema mode: no schema to build, only rows isolated by RLS."""
+        with transaction.atomic():
+            tenant.save()
+            Domain.objects.create(tenant=tenant, domain=domain, is_primary=True)
+            set_transaction_tenant(tenant.id)
+            seed_default_roles(tenant)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created tenant '{tenant.slug}' (shared schema) and domain '{domain}'."
+            )
+        )
+
+    def _create_in_database(self, tenant: Tenant, domain: str, alias: str) -> None:
+        """Database mode: registry rows in ``default``, data in the tenant's database."""
+        alias = alias or DEFAULT_DB_ALIAS
+        if alias != DEFAULT_DB_ALIAS and alias not in get_tenant_databases():
+            raise CommandError(f"Unknown database alias '{alias}' (see TENANT_DATABASES).")
+        tenant.database = "" if alias == DEFAULT_DB_ALIAS else alias
+
+        with transaction.atomic(using=DEFAULT_DB_ALIAS):
+            tenant.save(using=DEFAULT_DB_ALIAS)
+            Domain.objects.using(DEFAULT_DB_ALIAS).create(
+                tenant=tenant, domain=domain, is_primary=True
+            )
+
+        if alias != DEFAULT_DB_ALIAS:
+            try:
+                ensure_database(alias)
+                call_command("migrate", database=alias, interactive=False, verbosity=0)
+                Tenant.objects.using(alias).update_or_create(
                     id=tenant.id,
-                    name=tenant.name,
-                    slug=tenant.slug,
-                    schema_name=tenant.schema_name,
-                    is_active=tenant.is_active,
-                    plan_code=tenant.plan_code,
-                    trial_ends_at=tenant.trial_ends_at,
-                    enabled_modules=tenant.enabled_modules,
-                    branding=getattr(tenant, "branding", {}) or {},
+                    defaults={
+                        "name": tenant.name,
+                        "slug": tenant.slug,
+                        "schema_name": tenant.schema_name,
+                        "is_active": tenant.is_active,
+                        "plan_code": tenant.plan_code,
+                        "trial_ends_at": tenant.trial_ends_at,
+                        "enabled_modules": tenant.enabled_modules,
+                        "branding": getattr(tenant, "branding", {}) or {},
+                        "database": tenant.database,
+                    },
                 )
+            except Exception as e:
+                self.stderr.write(self.style.ERROR(f"Provisioning failed: {e}"))
+                Domain.objects.using(DEFAULT_DB_ALIAS).filter(tenant=tenant).delete()
+                tenant.delete(using=DEFAULT_DB_ALIAS)
+                raise CommandError(f"Provisioning failed, tenant rolled back: {e}") from e
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"Created tenant '{tenant.slug}' with schema '{tenant.schema_name}' and domain '{domain}'."
+                f"Created tenant '{tenant.slug}' in database '{alias}' and domain '{domain}'."
             )
         )
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from multitenant.pool import fill_schema_pool, get_pool_size, pool_depth
+
+
+class Command(BaseCommand):
+    help = "Pre-provision unassigned tenant schemas up to the warm pool target size."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=None,
+            help="Target pool size (defaults to TENANT_SCHEMA_POOL_SIZE).",
+        )
+
+    def handle(self, *args, **options):
+        if getattr(settings, "MULTITENANT_MODE", "off") != "schema":
+            raise CommandError("MULTITENANT_MODE must be 'schema' to fill the schema pool.")
+
+        target = options["size"] if options["size"] is not None else get_pool_size()
+        created = fill_schema_pool(target)
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {created} schema(s); pool depth {pool_depth()}/{target}.")
+        )
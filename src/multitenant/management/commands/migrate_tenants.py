@@ -1,38 +1,221 @@
 from __future__ import annotations
 
+import multiprocessing
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from io import StringIO
+
 from django.conf import settings
 from django.core.management import call_command
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from multitenant.databases import ensure_database, get_tenant_databases
+from multitenant.models import PooledSchema, Tenant
+from multitenant.provisioning import build_template_schema, get_provisioning_mode
+from multitenant.schema import (
+    PUBLIC_SCHEMA_NAME,
+    schema_context,
+    schema_exists,
+    schema_has_migrations,
+)
+
+
+def migrate_schema(schema_name: str) -> tuple[str, bool, float, str]:
+    """
+    Migrate one schema with a strict search_path. Runs inside pool workers.
+
+    Returns ``(schema_name, ok, seconds, error)``.
+    """
+    started = time.monotonic()
+    try:
+        with schema_context(schema_name, include_public=False):
+            call_command("migrate", interactive=False, verbosity=0, stdout=StringIO())
+        return schema_name, True, time.monotonic() - started, ""
+    except Exception:
+        return schema_name, False, time.monotonic() - started, traceback.format_exc(limit=5)
+
 
-from multitenant.models import Tenant
-from multitenant.schema import PUBLIC_SCHEMA_NAME, schema_context
+def migrate_database(alias: str) -> tuple[str, bool, float, str]:
+    """Migrate one tenant database (database mode). Same result shape as ``migrate_schema``."""
+    started = time.monotonic()
+    try:
+        ensure_database(alias)
+        call_command(
+            "migrate", database=alias, interactive=False, verbosity=0, stdout=StringIO()
+        )
+        return alias, True, time.monotonic() - started, ""
+    except Exception:
+        return alias, False, time.monotonic() - started, traceback.format_exc(limit=5)
 
 
 class Command(BaseCommand):
-    help = "Run migrations on all tenant schemas."
+    help = "Run migrations on public and every tenant schema (or database) in parallel."
 
     def add_arguments(self, parser):
-        parser.add_argument("--schema", dest="schema_name", help="Only migrate a given schema.")
-        parser.add_argument("--skip-public", action="store_true", help="Skip migrating public schema.")
-        parser.add_argument("--noinput", action="store_true")
+        parser.add_argument(
+            "--schema",
+            dest="schemas",
+            action="append",
+            default=[],
+            help="Only migrate the given schema (repeatable).",
+        )
+        parser.add_argument(
+            "--skip-public", action="store_true", help="Skip migrating public schema."
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=getattr(settings, "TENANT_MIGRATION_PROCESSES", 4),
+            help="Number of worker processes (1 = run in this process).",
+        )
+        parser.add_argument(
+            "--retries", type=int, default=1, help="Extra attempts for schemas that failed."
+        )
+        parser.add_argument(
+            "--include-unprovisioned",
+            action="store_true",
+            help="Also migrate schemas that have no django_migrations table yet.",
+        )
+        parser.add_argument(
+            "--database",
+            dest="databases",
+            action="append",
+            default=[],
+            help="Database mode: only migrate the given TENANT_DATABASES alias (repeatable).",
+        )
+        parser.add_argument("--noinput", "--no-input", action="store_true")
 
     def handle(self, *args, **options):
-        interactive = not options["noinput"]
+        mode = getattr(settings, "MULTITENANT_MODE", "off")
+        if mode == "database":
+            self._handle_databases(options)
+            return
+        if mode != "schema":
+            call_command("migrate", interactive=not options["noinput"])
+            return
+
+        started = time.monotonic()
+        if not options["skip_public"]:
+            self.stdout.write(f"Migrating schema '{PUBLIC_SCHEMA_NAME}'")
+            call_command(
+                "migrate", interactive=not options["noinput"], verbosity=options["verbosity"]
+            )
+
+        if get_provisioning_mode() == "clone" and not options["schemas"]:
+            # New tenants are cloned from the template: keep it at the latest migration.
+            self.stdout.write("Refreshing template schema")
+            build_template_schema()
 
-        if getattr(settings, "MULTITENANT_MODE", "off") != "schema":
-            call_command("migrate", interactive=interactive)
+        schemas, skipped = self._collect_schemas(options)
+        if not schemas:
+            self.stdout.write("No tenant schemas to migrate.")
             return
 
+        self._migrate_all(schemas, skipped, options, started, migrate_schema, "schema")
+
+    def _handle_databases(self, options) -> None:
+        started = time.monotonic()
         if not options["skip_public"]:
-            call_command("migrate", interactive=interactive)
+            self.stdout.write("Migrating database 'default'")
+            call_command(
+                "migrate", interactive=not options["noinput"], verbosity=options["verbosity"]
+            )
+
+        aliases = sorted(get_tenant_databases())
+        if options["databases"]:
+            unknown = set(options["databases"]) - set(aliases)
+            if unknown:
+                raise CommandError(f"Unknown database alias(es): {', '.join(sorted(unknown))}")
+            aliases = [alias for alias in aliases if alias in options["databases"]]
+        if not aliases:
+            self.stdout.write("No tenant databases to migrate.")
+            return
+        self._migrate_all(aliases, [], options, started, migrate_database, "database")
+
+    def _migrate_all(self, targets, skipped, options, started, worker, kind: str) -> None:
+        processes = max(1, min(options["processes"], len(targets)))
+        self.stdout.write(
+            f"Migrating {len(targets)} {kind}(s) with {processes} process(es)"
+            + (f", {len(skipped)} skipped" if skipped else "")
+        )
+
+        failures: dict[str, str] = {}
+        pending = targets
+        for attempt in range(options["retries"] + 1):
+            if attempt:
+                self.stdout.write(
+                    f"Retrying {len(pending)} failed {kind}(s) (attempt {attempt + 1})"
+                )
+            failures = self._run(pending, processes, worker)
+            pending = list(failures)
+            if not pending:
+                break
+
+        elapsed = time.monotonic() - started
+        ok_count = len(targets) - len(failures)
+        self.stdout.write(
+            f"Summary: {ok_count} migrated, {len(failures)} failed, "
+            f"{len(skipped)} skipped in {elapsed:.1f}s"
+        )
+        for name in skipped:
+            self.stdout.write(f"  skipped {name} (not provisioned)")
+        for name, error in failures.items():
+            last_line = error.strip().splitlines()[-1] if error.strip() else "unknown error"
+            self.stderr.write(self.style.ERROR(f"  {name}: {last_line}"))
+        if failures:
+            raise CommandError(f"Migrations failed for {len(failures)} {kind}(s).")
+        self.stdout.write(self.style.SUCCESS(f"All {kind}s migrated."))
 
+    def _collect_schemas(self, options) -> tuple[list[str], list[str]]:
         with schema_context(PUBLIC_SCHEMA_NAME):
             tenants = Tenant.objects.filter(is_active=True)
-            if options.get("schema_name"):
-                tenants = tenants.filter(schema_name=options["schema_name"])
-            tenants = list(tenants)
-
-        for tenant in tenants:
-            self.stdout.write(f"Migrating schema '{tenant.schema_name}'")
-            with schema_context(tenant.schema_name):
-                call_command("migrate", interactive=interactive)
+            if options["schemas"]:
+                tenants = tenants.filter(schema_name__in=options["schemas"])
+            names = list(tenants.order_by("schema_name").values_list("schema_name", flat=True))
+            if not options["schemas"]:
+                # Warm-pool schemas get claimed later and must already be current.
+                names += PooledSchema.objects.values_list("schema_name", flat=True)
+
+        schemas, skipped = [], []
+        for schema_name in names:
+            if schema_name == PUBLIC_SCHEMA_NAME or not schema_exists(schema_name):
+                continue
+            # Schemas created empty (onboarding) still read their tables from
+            # public; migrating them would shadow that data with empty tables.
+            if options["include_unprovisioned"] or schema_has_migrations(schema_name):
+                schemas.append(schema_name)
+            else:
+                skipped.append(schema_name)
+        return schemas, skipped
+
+    def _run(self, schemas: list[str], processes: int, worker=None) -> dict[str, str]:
+        worker = worker or migrate_schema
+        failures: dict[str, str] = {}
+        total = len(schemas)
+
+        def report(index: int, result: tuple[str, bool, float, str]) -> None:
+            schema_name, ok, seconds, error = result
+            status = self.style.SUCCESS("OK") if ok else self.style.ERROR("FAILED")
+            self.stdout.write(f"[{index}/{total}] {schema_name} {status} ({seconds:.1f}s)")
+            if not ok:
+                failures[schema_name] = error
+
+        if processes == 1:
+            for index, schema_name in enumerate(schemas, start=1):
+                report(index, worker(schema_name))
+            return failures
+
+        # Forked workers must not share the parent's DB sockets.
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+            futures = {pool.submit(worker, name): name for name in schemas}
+            for index, future in enumerate(as_completed(futures), start=1):
+                try:
+                    result = future.result()
+                except Exception as exc:  # worker crashed
+                    result = (futures[future], False, 0.0, repr(exc))
+                report(index, result)
+        return failures
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from multitenant.provisioning import build_template_schema
+
+
+class Command(BaseCommand):
+    help = "Create or refresh the template schema cloned by TENANT_PROVISIONING='clone'."
+
+    def handle(self, *args, **options):
+        if getattr(settings, "MULTITENANT_MODE", "off") != "schema":
+            raise CommandError("MULTITENANT_MODE must be 'schema' to prepare a template schema.")
+
+        template = build_template_schema()
+        self.stdout.write(self.style.SUCCESS(f"Template schema '{template}' is up to date."))
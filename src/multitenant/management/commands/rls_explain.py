@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from common.rls_explain import REPRESENTATIVE_QUERIES, explain_tables, index_regressions
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN representative queries on every tenant-scoped table with the legacy "
+        "and the typed RLS predicate, and report index usage before and after."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--table", dest="tables", action="append", default=None, help="Repeatable."
+        )
+        parser.add_argument("--tenant-id", type=int, default=1)
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail when a typed-predicate plan does not use an index.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("The RLS EXPLAIN harness needs PostgreSQL.")
+
+        results = explain_tables(options["tables"], tenant_id=options["tenant_id"])
+        by_key = {(r.table, r.query, r.variant): r for r in results}
+        tables = sorted({r.table for r in results})
+
+        self.stdout.write(
+            f"{'table':<28}{'query':<8}{'legacy':<22}{'typed':<22}{'cost before':>14}"
+            f"{'cost after':>14}"
+        )
+        improved = 0
+        for table in tables:
+            for query in REPRESENTATIVE_QUERIES:
+                legacy = by_key[(table, query, "legacy")]
+                typed = by_key[(table, query, "typed")]
+                improved += typed.uses_index and not legacy.uses_index
+                self.stdout.write(
+                    f"{table:<28}{query:<8}{legacy.node_type:<22}{typed.node_type:<22}"
+                    f"{legacy.total_cost:>14.1f}{typed.total_cost:>14.1f}"
+                )
+
+        regressions = index_regressions(results)
+        self.stdout.write(
+            f"\n{len(tables)} table(s): {improved} plan(s) moved from a sequential scan "
+            f"to an index, {len(regressions)} typed plan(s) without an index."
+        )
+        for result in regressions:
+            self.stderr.write(self.style.WARNING(f"  {result.table} ({result.query})"))
+        if options["check"] and regressions:
+            raise CommandError("Some tenant predicates cannot use an index.")
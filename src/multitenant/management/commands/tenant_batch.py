@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+from multitenant.batch import FAILED, list_tenants, run_for_tenants
+
+
+class Command(BaseCommand):
+    help = "Run a callable once per tenant, in parallel, with checkpoints and retries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "callable", help="Dotted path to a function taking the tenant, e.g. app.jobs.fix."
+        )
+        parser.add_argument(
+            "--tenant",
+            dest="tenants",
+            action="append",
+            default=[],
+            help="Only run for the given tenant slug (repeatable).",
+        )
+        parser.add_argument("--include-inactive", action="store_true")
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=getattr(settings, "TENANT_MIGRATION_PROCESSES", 4),
+            help="Number of worker processes (1 = run in this process).",
+        )
+        parser.add_argument(
+            "--retries", type=int, default=0, help="Extra attempts for tenants that failed."
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="JSON-lines file of finished tenants; rerun with it to resume.",
+        )
+        parser.add_argument(
+            "--no-atomic",
+            dest="atomic",
+            action="store_false",
+            help="Do not wrap each tenant in its own transaction.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            import_string(options["callable"])
+        except ImportError as e:
+            raise CommandError(f"Cannot import {options['callable']}: {e}") from e
+
+        tenants = list_tenants(options["tenants"], include_inactive=options["include_inactive"])
+        if not tenants:
+            self.stdout.write("No tenants to process.")
+            return
+
+        def progress(done: int, total: int, outcome) -> None:
+            status = (
+                self.style.ERROR(outcome.status.upper())
+                if outcome.status == FAILED
+                else self.style.SUCCESS(outcome.status.upper())
+            )
+            self.stdout.write(f"[{done}/{total}] {outcome.slug} {status} ({outcome.seconds:.1f}s)")
+
+        report = run_for_tenants(
+            options["callable"],
+            tenants,
+            processes=options["processes"],
+            atomic=options["atomic"],
+            retries=options["retries"],
+            checkpoint=options["checkpoint"],
+            progress=progress,
+        )
+
+        self.stdout.write(
+            f"Summary: {report.count('ok')} ok, {report.count('failed')} failed, "
+            f"{report.count('skipped')} skipped, {len(report.resumed)} already done "
+            f"in {report.seconds:.1f}s"
+        )
+        for outcome in report.failures:
+            last_line = outcome.error.strip().splitlines()[-1] if outcome.error else "error"
+            self.stderr.write(self.style.ERROR(f"  {outcome.slug}: {last_line}"))
+        if report.failures:
+            raise CommandError(f"Failed for {len(report.failures)} tenant(s).")
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import argparse
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.management import call_command, get_commands, load_command_class
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from common.rls import tenant_transaction
+from multitenant.databases import tenant_database
+from multitenant.models import Tenant
+from multitenant.schema import PUBLIC_SCHEMA_NAME, schema_context
+
+
+def _accepts_database(command_name: str) -> bool:
+    app_name = get_commands()[command_name]
+    command = load_command_class(app_name, command_name)
+    parser = command.create_parser("manage.py", command_name)
+    return any(action.dest == "database" for action in parser._actions)
+
+
+class Command(BaseCommand):
+    help = "Run a management command in a tenant's schema, database or RLS scope."
+
+    def add_arguments(self, parser):
+        parser.add_argument("slug", help="Tenant slug.")
+        parser.add_argument("command_name", help="Management command to run.")
+        parser.add_argument("command_args", nargs=argparse.REMAINDER)
+
+    def handle(self, *args, **options):
+        mode = getattr(settings, "MULTITENANT_MODE", "off")
+        if mode not in ("schema", "database", "shared"):
+            raise CommandError("MULTITENANT_MODE must be 'schema', 'database' or 'shared'.")
+
+        name = options["command_name"]
+        if name not in get_commands():
+            raise CommandError(f"Unknown command: {name}")
+        try:
+            if mode == "database":
+                tenant = Tenant.objects.using(DEFAULT_DB_ALIAS).get(slug=options["slug"])
+            else:
+                with schema_context(PUBLIC_SCHEMA_NAME):
+                    tenant = Tenant.objects.get(slug=options["slug"])
+        except Tenant.DoesNotExist as e:
+            raise CommandError(f"Tenant '{options['slug']}' does not exist.") from e
+
+        command_args = list(options["command_args"])
+        with ExitStack() as stack:
+            if mode == "database":
+                alias = stack.enter_context(tenant_database(tenant))
+                # Commands with --database (migrate, dumpdata, ...) bypass the router.
+                explicit = any(arg.startswith("--database") for arg in command_args)
+                if not explicit and _accepts_database(name):
+                    command_args.append(f"--database={alias}")
+            elif mode == "shared":
+                stack.enter_context(tenant_transaction(tenant.id))
+            else:
+                stack.enter_context(schema_context(tenant.schema_name))
+            call_command(name, *command_args)
@@ -1,63 +1,143 @@
 from __future__ import annotations
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.db import OperationalError, ProgrammingError
+from django.db import DEFAULT_DB_ALIAS, transaction
 from django.utils.deprecation import MiddlewareMixin
 
-from .models import Domain, Tenant
-from .schema import PUBLIC_SCHEMA_NAME, schema_context, set_schema
+from common.rls import set_tenant_id, tenant_transaction
 
-from common.rls import set_rls_bypass, set_tenant_id
+from .databases import activate_database, database_for_tenant, deactivate_database
+from .resolver import aresolve_host, resolve_host, resolve_tenant_id
+from .schema import PUBLIC_SCHEMA_NAME, set_tenant_session
+
+TENANT_MODES = ("schema", "database", "shared")
+
+
+def _mode() -> str:
+    return getattr(settings, "MULTITENANT_MODE", "off")
+
+
+def _host(request) -> str:
+    return request.get_host().split(":")[0].lower()
+
+
+def _bearer_token(request) -> str | None:
+    if not getattr(settings, "JWT_AUTHZ_CLAIMS", False):
+        return None
+    parts = request.headers.get("Authorization", "").split()
+    if len(parts) != 2 or parts[0] not in settings.SIMPLE_JWT.get("AUTH_HEADER_TYPES", ()):
+        return None
+    return parts[1]
+
+
+def _tenant_from_token(raw: str):
+    """Tenant named by the ``tid``/``tsc`` claims of a valid access token."""
+    from rest_framework_simplejwt.exceptions import TokenError
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    try:
+        token = AccessToken(raw)
+    except TokenError:
+        return None
+    tenant_id = token.get("tid")
+    tenant = resolve_tenant_id(tenant_id) if tenant_id is not None else None
+    if tenant is None or tenant.schema_name != token.get("tsc"):
+        return None
+    return tenant
 
 
 class TenantMiddleware(MiddlewareMixin):
-    def process_request(self, request):
-        if getattr(settings, "MULTITENANT_MODE", "off") != "schema":
+    """
+    Resolve ``request.tenant`` from the host and scope the database to it.
+
+    Hosts that serve no tenant (a bare API host) fall back to the tenant in
+    the bearer token's claims when ``JWT_AUTHZ_CLAIMS`` is on.
+
+    Works natively under ASGI: ``__acall__`` resolves through the async
+    cache tiers and only hops to a thread for the database session itself
+    (schema/shared modes); database mode needs no hop at all.
+    """
+
+    def __call__(self, request):
+        if getattr(self, "async_mode", False) or _mode() != "shared":
+            return super().__call__(request)
+
+        # Shared schema: RLS is the only isolation, so the tenant id is set
+        # per transaction and the whole request runs inside it.
+        tenant = self._resolve(request)
+        with tenant_transaction(tenant.id if tenant else None):
+            response = self.get_response(request)
+            if response.status_code >= 500:
+                transaction.set_rollback(True)
+        return response
+
+    async def __acall__(self, request):
+        mode = _mode()
+        if mode not in TENANT_MODES:
             request.tenant = None
-            return
+            return await self.get_response(request)
 
-        host = request.get_host().split(":")[0].lower()
-        tenant_public = None
-        try:
-            with schema_context(PUBLIC_SCHEMA_NAME):
-                domain = Domain.objects.select_related("tenant").get(
-                    domain=host, tenant__is_active=True
-                )
-                tenant_public = domain.tenant
-        except Domain.DoesNotExist:
-            tenant_public = None
-        except (OperationalError, ProgrammingError):
-            tenant_public = None
-
-        if tenant_public:
-            set_schema(tenant_public.schema_name)
+        request.tenant = await aresolve_host(_host(request))
+        if request.tenant is None and (raw := _bearer_token(request)):
+            request.tenant = await sync_to_async(_tenant_from_token)(raw)
+        if mode == "database":
+            self._enter(mode, request)
             try:
-                tenant_local = Tenant.objects.get(schema_name=tenant_public.schema_name)
-            except Tenant.DoesNotExist:
-                tenant_local = Tenant.objects.create(
-                    id=tenant_public.id,
-                    name=tenant_public.name,
-                    slug=tenant_public.slug,
-                    schema_name=tenant_public.schema_name,
-                    is_active=tenant_public.is_active,
-                    plan_code=tenant_public.plan_code,
-                    trial_ends_at=tenant_public.trial_ends_at,
-                    enabled_modules=tenant_public.enabled_modules,
-                    branding=getattr(tenant_public, "branding", {}) or {},
-                )
-            request.tenant = tenant_local
-
-            # RLS: Set tenant_id for Row-Level Security policies
-            set_tenant_id(tenant_local.id)
-
-            # RLS bypass for superusers
-            if hasattr(request, "user") and getattr(request.user, "is_superuser", False):
-                set_rls_bypass(True)
+                return await self.get_response(request)
+            finally:
+                self._exit(mode, request)
+
+        await sync_to_async(self._enter)(mode, request)
+        try:
+            return await self.get_response(request)
+        finally:
+            await sync_to_async(self._exit)(mode, request)
+
+    def _resolve(self, request):
+        request.tenant = resolve_host(_host(request))
+        if request.tenant is None and (raw := _bearer_token(request)):
+            request.tenant = _tenant_from_token(raw)
+        return request.tenant
+
+    def _enter(self, mode: str, request) -> None:
+        tenant = request.tenant
+        if mode == "database":
+            # Route this request's ORM queries to the tenant's database.
+            alias = database_for_tenant(tenant) if tenant else DEFAULT_DB_ALIAS
+            request._tenant_db_token = activate_database(alias)
+        elif mode == "shared":
+            # No request-wide transaction here (async, or MiddlewareMixin
+            # fallback): use the session-level variable, reset on the way out.
+            set_tenant_id(tenant.id if tenant else "")
+        elif tenant:
+            # search_path plus the RLS tenant variable in a single round trip,
+            # skipped entirely when already in place.
+            set_tenant_session(tenant.schema_name, tenant_id=tenant.id)
         else:
-            set_schema(PUBLIC_SCHEMA_NAME)
+            set_tenant_session(PUBLIC_SCHEMA_NAME)
+
+    def _exit(self, mode: str, request) -> None:
+        if mode == "schema":
+            set_tenant_session(PUBLIC_SCHEMA_NAME)
+        elif mode == "shared":
+            set_tenant_id("")
+        elif mode == "database":
+            token = getattr(request, "_tenant_db_token", None)
+            if token is not None:
+                deactivate_database(token)
+                del request._tenant_db_token
+
+    def process_request(self, request):
+        mode = _mode()
+        if mode not in TENANT_MODES:
             request.tenant = None
+            return
+        self._resolve(request)
+        self._enter(mode, request)
 
     def process_response(self, request, response):
-        if getattr(settings, "MULTITENANT_MODE", "off") == "schema":
-            set_schema(PUBLIC_SCHEMA_NAME)
+        mode = _mode()
+        if mode in TENANT_MODES:
+            self._exit(mode, request)
         return response
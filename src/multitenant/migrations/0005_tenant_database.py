@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("multitenant", "0004_pooledschema"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tenant",
+            name="database",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Connection alias holding this tenant's data (database mode). Empty = default.",
+                max_length=63,
+            ),
+        ),
+    ]
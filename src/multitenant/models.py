@@ -34,6 +34,12 @@ class Tenant(models.Model):
     trial_ends_at = models.DateTimeField(blank=True, null=True)
     enabled_modules = models.JSONField(default=list, blank=True)
     branding = models.JSONField(default=dict, blank=True)
+    database = models.CharField(
+        max_length=63,
+        blank=True,
+        default="",
+        help_text="Connection alias holding this tenant's data (database mode). Empty = default.",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -57,3 +63,16 @@ class Domain(models.Model):
 
     def __str__(self) -> str:  # pragma: no cover
         return self.domain
+
+
+class PooledSchema(models.Model):
+    """A migrated, seeded schema waiting to be claimed by a new tenant (warm pool)."""
+
+    schema_name = models.CharField(max_length=63, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["created_at"]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return self.schema_name
@@ -0,0 +1,153 @@
+"""
+Warm pool of pre-provisioned tenant schemas.
+
+Building a schema (migrations or a template clone, plus seeding) is the
+slow part of signup. The pool keeps ``TENANT_SCHEMA_POOL_SIZE`` schemas
+ready in the background, each named ``pool_<hex>`` and seeded for the
+template placeholder tenant. Onboarding claims one with
+``SELECT ... FOR UPDATE SKIP LOCKED``, renames it to the tenant's schema
+and re-points the placeholder row — a handful of metadata statements.
+
+The pool is refilled by ``manage.py fill_schema_pool`` and the
+``multitenant.tasks.refill_schema_pool`` Celery task (periodic, and queued
+after every claim).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+
+from django.conf import settings
+from django.db import connection, transaction
+from prometheus_client import Counter, Gauge, Histogram
+
+from .models import PooledSchema, Tenant
+from .provisioning import (
+    assign_schema,
+    clone_schema,
+    get_provisioning_mode,
+    get_template_schema,
+    migrate_and_seed_schema,
+)
+from .schema import PUBLIC_SCHEMA_NAME, _quote, drop_schema, schema_context
+
+logger = logging.getLogger(__name__)
+
+POOL_PREFIX = "pool_"
+# Arbitrary constant for pg_try_advisory_lock: one pool filler at a time.
+_FILL_LOCK_KEY = 7_310_420_551
+
+POOL_CLAIMS = Counter(
+    "tenant_schema_pool_claims_total",
+    "Schema pool claim attempts",
+    ["result"],
+)
+POOL_CLAIM_LATENCY = Histogram(
+    "tenant_schema_pool_claim_seconds",
+    "Time to claim and assign a pooled schema",
+)
+# Set when this process fills or claims from the pool, not on scrape: a
+# scrape must not cost a query.
+POOL_DEPTH = Gauge("tenant_schema_pool_depth", "Ready, unassigned tenant schemas")
+
+
+def get_pool_size() -> int:
+    return int(getattr(settings, "TENANT_SCHEMA_POOL_SIZE", 0))
+
+
+def pool_depth() -> int:
+    with schema_context(PUBLIC_SCHEMA_NAME):
+        return PooledSchema.objects.count()
+
+
+def _build_pooled_schema() -> str:
+    schema_name = f"{POOL_PREFIX}{uuid.uuid4().hex[:16]}"
+    try:
+        if get_provisioning_mode() == "clone":
+            clone_schema(get_template_schema(), schema_name)
+        else:
+            migrate_and_seed_schema(schema_name)
+        with schema_context(PUBLIC_SCHEMA_NAME):
+            PooledSchema.objects.create(schema_name=schema_name)
+    except Exception:
+        drop_schema(schema_name)
+        raise
+    return schema_name
+
+
+def fill_schema_pool(target: int | None = None) -> int:
+    """
+    Top the pool up to ``target`` (default ``TENANT_SCHEMA_POOL_SIZE``).
+
+    Returns the number of schemas created. Returns 0 without doing anything
+    when another process is already filling the pool.
+    """
+    target = get_pool_size() if target is None else target
+    if target <= 0 or connection.vendor != "postgresql":
+        return 0
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(%s)", [_FILL_LOCK_KEY])
+        if not cursor.fetchone()[0]:
+            return 0
+    created = 0
+    try:
+        depth = pool_depth()
+        POOL_DEPTH.set(depth)
+        for _ in range(max(target - depth, 0)):
+            schema_name = _build_pooled_schema()
+            created += 1
+            POOL_DEPTH.set(depth + created)
+            logger.info("Added %s to the schema pool", schema_name)
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [_FILL_LOCK_KEY])
+    return created
+
+
+def claim_pooled_schema(tenant: Tenant) -> bool:
+    """
+    Give ``tenant`` a ready schema from the pool.
+
+    Renames a pooled schema to ``tenant.schema_name`` and assigns its
+    placeholder rows to ``tenant``. Returns False when the pool is disabled
+    or empty; the caller then provisions the schema itself.
+    """
+    if get_pool_size() <= 0 or connection.vendor != "postgresql":
+        return False
+
+    started = time.monotonic()
+    with transaction.atomic():
+        with schema_context(PUBLIC_SCHEMA_NAME):
+            entry = (
+                PooledSchema.objects.select_for_update(skip_locked=True)
+                .order_by("created_at")
+                .first()
+            )
+            if entry is None:
+                POOL_CLAIMS.labels(result="miss").inc()
+                POOL_DEPTH.set(0)
+                return False
+            source, target = _quote(entry.schema_name), _quote(tenant.schema_name)
+            with connection.cursor() as cursor:
+                cursor.execute(f"ALTER SCHEMA {source} RENAME TO {target}")
+            entry.delete()
+            depth = PooledSchema.objects.count()
+        assign_schema(tenant.schema_name, tenant)
+
+    POOL_CLAIM_LATENCY.observe(time.monotonic() - started)
+    POOL_CLAIMS.labels(result="hit").inc()
+    POOL_DEPTH.set(depth)
+    transaction.on_commit(_queue_refill)
+    return True
+
+
+def _queue_refill() -> None:
+    from .tasks import refill_schema_pool
+
+    try:
+        refill_schema_pool.delay()
+    except Exception:  # broker down: the periodic task will catch up
+        logger.warning("Could not queue schema pool refill", exc_info=True)
@@ -0,0 +1,314 @@
+"""
+Tenant schema provisioning.
+
+Two strategies, selected with ``TENANT_PROVISIONING``:
+
+``migrate``
+    Run the full migration history inside the new schema (the original
+    behaviour). Cost grows with every migration added to the project.
+
+``clone``
+    Keep one fully migrated and seeded *template* schema
+    (``TENANT_TEMPLATE_SCHEMA``) and copy it with plain DDL: tables, data
+    (django_migrations, content types, permissions, default roles…),
+    constraints, indexes and sequences. The template's placeholder tenant
+    row is then re-pointed at the real tenant. Cost stays flat as the
+    migration count grows.
+
+The template is (re)built by ``manage.py prepare_tenant_template`` and
+refreshed by ``migrate_tenants`` on every deploy.
+"""
+
+from __future__ import annotations
+
+import re
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection, transaction
+from psycopg import sql
+
+from .models import Tenant
+from .schema import create_schema, schema_context, schema_has_migrations
+
+# Tenant row seeded into template schemas; rewritten to the real tenant on clone.
+TEMPLATE_TENANT_ID = 0
+TEMPLATE_TENANT_SLUG = "template"
+
+PROVISIONING_MODES = ("migrate", "clone")
+
+
+class ProvisioningError(RuntimeError):
+    pass
+
+
+def get_provisioning_mode() -> str:
+    mode = getattr(settings, "TENANT_PROVISIONING", "migrate")
+    if mode not in PROVISIONING_MODES:
+        raise ProvisioningError(f"Unknown TENANT_PROVISIONING mode: {mode!r}")
+    return mode
+
+
+def get_template_schema() -> str:
+    return getattr(settings, "TENANT_TEMPLATE_SCHEMA", "tenant_template")
+
+
+def migrate_and_seed_schema(schema_name: str) -> None:
+    """
+    Migrate ``schema_name`` (strict search_path) and seed it for the placeholder tenant.
+
+    Idempotent: running it on an existing schema applies new migrations and
+    refreshes system permissions and default roles. Must run outside a
+    transaction, like any ``migrate``.
+    """
+    from core.services.seed import seed_default_roles
+
+    create_schema(schema_name)
+    with schema_context(schema_name, include_public=False):
+        call_command("migrate", interactive=False, verbosity=0, stdout=StringIO())
+        with transaction.atomic():
+            placeholder, _ = Tenant.objects.get_or_create(
+                id=TEMPLATE_TENANT_ID,
+                defaults={
+                    "name": "Template",
+                    "slug": TEMPLATE_TENANT_SLUG,
+                    "schema_name": schema_name,
+                },
+            )
+            seed_default_roles(placeholder)
+
+
+def build_template_schema() -> str:
+    """Create or refresh the template schema. Returns its name."""
+    template = get_template_schema()
+    migrate_and_seed_schema(template)
+    return template
+
+
+def _qualified(schema_name: str, name: str) -> str:
+    qn = connection.ops.quote_name
+    return f"{qn(schema_name)}.{qn(name)}"
+
+
+def _execute(cursor, query: str, *identifiers, params=None) -> None:
+    """Run ``query`` with its ``{}`` slots filled by quoted identifiers (``sql.Identifier``)."""
+    cursor.execute(sql.SQL(query).format(*identifiers), params)
+
+
+def _schema_pattern(schema_name: str) -> str:
+    return rf'(?:"{re.escape(schema_name)}"|{re.escape(schema_name)})\.'
+
+
+def clone_schema(source: str, target: str) -> None:
+    """
+    Copy every table of ``source`` (structure and rows) into ``target``.
+
+    Constraints and indexes keep their original names, so later migrations
+    that reference them by name keep working on cloned schemas.
+    """
+    qn = connection.ops.quote_name
+    ident = sql.Identifier
+    source_prefix = re.compile(rf"\bON (ONLY )?{_schema_pattern(source)}")
+    nextval_re = re.compile(r"nextval\('(?:[^']*\.)?\"?([^'\"]+)\"?'::regclass\)")
+
+    with transaction.atomic():
+        # Catalog reads with only the source on the path: definitions come
+        # back unqualified and resolve against ``target`` when replayed.
+        with schema_context(source, include_public=False), connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT c.relname
+                FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relkind = 'r'
+                ORDER BY c.relname
+                """,
+                [source],
+            )
+            tables = [row[0] for row in cursor.fetchall()]
+            cursor.execute(
+                """
+                SELECT cl.relname, con.conname, con.contype, pg_get_constraintdef(con.oid)
+                FROM pg_constraint con
+                JOIN pg_class cl ON cl.oid = con.conrelid
+                JOIN pg_namespace n ON n.oid = cl.relnamespace
+                WHERE n.nspname = %s AND con.contype IN ('p', 'u', 'c', 'x', 'f')
+                ORDER BY con.contype = 'f', cl.relname, con.conname
+                """,
+                [source],
+            )
+            constraints = cursor.fetchall()
+            cursor.execute(
+                """
+                SELECT pg_get_indexdef(i.indexrelid)
+                FROM pg_index i
+                JOIN pg_class t ON t.oid = i.indrelid
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                WHERE n.nspname = %s AND t.relkind = 'r'
+                  AND NOT EXISTS (
+                    SELECT 1 FROM pg_constraint c
+                    WHERE c.conindid = i.indexrelid AND c.contype IN ('p', 'u', 'x')
+                  )
+                """,
+                [source],
+            )
+            indexes = [row[0] for row in cursor.fetchall()]
+            cursor.execute(
+                """
+                SELECT c.relname, a.attname, pg_get_expr(d.adbin, d.adrelid)
+                FROM pg_attrdef d
+                JOIN pg_class c ON c.oid = d.adrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                JOIN pg_attribute a ON a.attrelid = d.adrelid AND a.attnum = d.adnum
+                WHERE n.nspname = %s AND pg_get_expr(d.adbin, d.adrelid) LIKE 'nextval(%%'
+                """,
+                [source],
+            )
+            serial_defaults = cursor.fetchall()
+
+        create_schema(target)
+        with schema_context(target, include_public=False), connection.cursor() as cursor:
+            for table in tables:
+                _execute(
+                    cursor,
+                    "CREATE TABLE {} (LIKE {} INCLUDING DEFAULTS INCLUDING IDENTITY "
+                    "INCLUDING GENERATED INCLUDING STORAGE INCLUDING COMMENTS)",
+                    ident(target, table),
+                    ident(source, table),
+                )
+                _execute(
+                    cursor,
+                    "INSERT INTO {} OVERRIDING SYSTEM VALUE SELECT * FROM {}",
+                    ident(target, table),
+                    ident(source, table),
+                )
+
+            # Serial (non-identity) columns still point at the source's
+            # sequences after LIKE ... INCLUDING DEFAULTS; give them their own.
+            for table, column, default in serial_defaults:
+                match = nextval_re.search(default)
+                if not match:
+                    continue
+                sequence = ident(target, match.group(1))
+                _execute(cursor, "CREATE SEQUENCE IF NOT EXISTS {}", sequence)
+                _execute(
+                    cursor,
+                    "ALTER TABLE {} ALTER COLUMN {} SET DEFAULT nextval({}::regclass)",
+                    ident(target, table),
+                    ident(column),
+                    sql.Literal(_qualified(target, match.group(1))),
+                )
+                _execute(
+                    cursor,
+                    "ALTER SEQUENCE {} OWNED BY {}",
+                    sequence,
+                    ident(target, table, column),
+                )
+
+            for table, name, _contype, definition in constraints:
+                # ``definition`` comes verbatim from pg_get_constraintdef.
+                _execute(
+                    cursor,
+                    "ALTER TABLE {} ADD CONSTRAINT {} {}",
+                    ident(target, table),
+                    ident(name),
+                    sql.SQL(definition),
+                )
+            for definition in indexes:
+                cursor.execute(
+                    source_prefix.sub(lambda m: f"ON {m.group(1) or ''}{qn(target)}.", definition)
+                )
+
+            cursor.execute(
+                """
+                SELECT c.relname, a.attname
+                FROM pg_attribute a
+                JOIN pg_class c ON c.oid = a.attrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relkind = 'r' AND a.attnum > 0
+                  AND NOT a.attisdropped
+                  AND pg_get_serial_sequence(format('%%I.%%I', n.nspname, c.relname), a.attname)
+                      IS NOT NULL
+                """,
+                [target],
+            )
+            for table, column in cursor.fetchall():
+                _execute(
+                    cursor,
+                    "SELECT setval(pg_get_serial_sequence(%s, %s), "
+                    "COALESCE(MAX({}), 0) + 1, false) FROM {}",
+                    ident(column),
+                    ident(target, table),
+                    params=[_qualified(target, table), column],
+                )
+
+
+def _json_param(field_name: str, value):
+    return Tenant._meta.get_field(field_name).get_db_prep_value(value, connection)
+
+
+def assign_schema(schema_name: str, tenant: Tenant) -> None:
+    """
+    Re-point the placeholder tenant row of a cloned/pooled schema at ``tenant``.
+
+    Every column with a foreign key to ``multitenant_tenant`` is rewritten, so
+    seeded roles (and anything else seeded for the placeholder) now belong to
+    the real tenant.
+    """
+    tenant_table = _qualified(schema_name, Tenant._meta.db_table)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT cl.relname, a.attname
+            FROM pg_constraint con
+            JOIN pg_class cl ON cl.oid = con.conrelid
+            JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = con.conkey[1]
+            WHERE con.contype = 'f' AND con.confrelid = %s::regclass
+            """,
+            [tenant_table],
+        )
+        references = cursor.fetchall()
+        # FKs are DEFERRABLE INITIALLY DEFERRED: checked when the block commits.
+        _execute(
+            cursor,
+            "UPDATE {} SET id = %s, name = %s, slug = %s, schema_name = %s, "
+            "is_active = %s, plan_code = %s, trial_ends_at = %s, enabled_modules = %s, "
+            "branding = %s, created_at = now(), updated_at = now() WHERE id = %s",
+            sql.Identifier(schema_name, Tenant._meta.db_table),
+            params=[
+                tenant.id,
+                tenant.name,
+                tenant.slug,
+                tenant.schema_name,
+                tenant.is_active,
+                tenant.plan_code,
+                tenant.trial_ends_at,
+                _json_param("enabled_modules", tenant.enabled_modules),
+                _json_param("branding", getattr(tenant, "branding", {}) or {}),
+                TEMPLATE_TENANT_ID,
+            ],
+        )
+        if cursor.rowcount != 1:
+            raise ProvisioningError(f"Schema {schema_name!r} has no placeholder tenant row.")
+        for table, column in references:
+            _execute(
+                cursor,
+                "UPDATE {} SET {} = %s WHERE {} = %s",
+                sql.Identifier(schema_name, table),
+                sql.Identifier(column),
+                sql.Identifier(column),
+                params=[tenant.id, TEMPLATE_TENANT_ID],
+            )
+
+
+def clone_template(tenant: Tenant) -> None:
+    """Provision ``tenant.schema_name`` as a copy of the template schema."""
+    template = get_template_schema()
+    if not schema_has_migrations(template):
+        raise ProvisioningError(
+            f"Template schema {template!r} is missing. "
+            "Run `manage.py prepare_tenant_template` (or `migrate_tenants`)."
+        )
+    with transaction.atomic():
+        clone_schema(template, tenant.schema_name)
+        assign_schema(tenant.schema_name, tenant)
@@ -0,0 +1,270 @@
+"""
+Host → tenant resolution with a two-tier cache.
+
+TenantMiddleware used to run a ``Domain`` join on public plus a lookup of
+the tenant's local copy on every request. Resolution is now served from:
+
+1. A small in-process LRU (per worker, short TTL) — no I/O at all.
+2. The shared Django cache (Redis) — one round trip, shared by all workers.
+3. The database, only on a cold miss.
+
+Unknown hosts are cached too (negative entries, shorter TTL) so scanners
+probing random subdomains cannot hammer the database. Entries are
+invalidated by the signal handlers in ``multitenant.signals`` whenever a
+Tenant or Domain changes.
+
+Cached values are plain dicts of the tenant's concrete fields; each call
+rebuilds a fresh ``Tenant`` instance so requests never share objects.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, OperationalError, ProgrammingError
+
+from .databases import database_for_tenant, ensure_database
+from .models import Domain, Tenant
+from .schema import PUBLIC_SCHEMA_NAME, schema_context
+
+CACHE_KEY_PREFIX = "multitenant:host:"
+TENANT_ID_CACHE_KEY_PREFIX = "multitenant:id:"
+_MISSING = "__missing__"
+
+
+def _setting(name: str, default: int) -> int:
+    return int(getattr(settings, name, default))
+
+
+def cache_key(host: str) -> str:
+    return f"{CACHE_KEY_PREFIX}{host}"
+
+
+def tenant_id_cache_key(tenant_id) -> str:
+    return f"{TENANT_ID_CACHE_KEY_PREFIX}{tenant_id}"
+
+
+class _LocalCache:
+    """Thread-safe LRU with per-entry expiry."""
+
+    def __init__(self) -> None:
+        self._data: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, ttl: int, max_size: int) -> None:
+        if ttl <= 0 or max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_local = _LocalCache()
+
+
+def snapshot_tenant(tenant: Tenant) -> dict:
+    return {f.attname: getattr(tenant, f.attname) for f in Tenant._meta.concrete_fields}
+
+
+def tenant_from_snapshot(data: dict) -> Tenant:
+    names = list(data)
+    values = [copy.deepcopy(data[name]) for name in names]
+    return Tenant.from_db(data.get("database") or DEFAULT_DB_ALIAS, names, values)
+
+
+def _local_tenant_fields(tenant_public: Tenant) -> dict:
+    return {
+        "name": tenant_public.name,
+        "slug": tenant_public.slug,
+        "schema_name": tenant_public.schema_name,
+        "is_active": tenant_public.is_active,
+        "plan_code": tenant_public.plan_code,
+        "trial_ends_at": tenant_public.trial_ends_at,
+        "enabled_modules": tenant_public.enabled_modules,
+        "branding": getattr(tenant_public, "branding", {}) or {},
+        "database": tenant_public.database,
+    }
+
+
+def _localize(tenant_public: Tenant) -> Tenant:
+    """The tenant row as seen from inside its own schema or database."""
+    mode = getattr(settings, "MULTITENANT_MODE", "off")
+    if mode == "database":
+        alias = ensure_database(database_for_tenant(tenant_public))
+        if alias == DEFAULT_DB_ALIAS:
+            return tenant_public
+        # Tenant databases keep a local copy, like tenant schemas do.
+        tenant_local, _ = Tenant.objects.using(alias).get_or_create(
+            id=tenant_public.id, defaults=_local_tenant_fields(tenant_public)
+        )
+        return tenant_local
+    if mode == "shared":
+        return tenant_public  # one schema for everyone: no local copy
+
+    with schema_context(tenant_public.schema_name):
+        try:
+            return Tenant.objects.get(schema_name=tenant_public.schema_name)
+        except Tenant.DoesNotExist:
+            return Tenant.objects.create(id=tenant_public.id, **_local_tenant_fields(tenant_public))
+
+
+def _load_tenant(host: str) -> Tenant | None:
+    """Resolve ``host`` against the database. Raises on DB errors."""
+    with schema_context(PUBLIC_SCHEMA_NAME):
+        try:
+            domain = (
+                Domain.objects.using(DEFAULT_DB_ALIAS)
+                .select_related("tenant")
+                .get(domain=host, tenant__is_active=True)
+            )
+        except Domain.DoesNotExist:
+            return None
+    return _localize(domain.tenant)
+
+
+def _load_tenant_by_id(tenant_id: int) -> Tenant | None:
+    with schema_context(PUBLIC_SCHEMA_NAME):
+        tenant_public = (
+            Tenant.objects.using(DEFAULT_DB_ALIAS).filter(id=tenant_id, is_active=True).first()
+        )
+    return _localize(tenant_public) if tenant_public is not None else None
+
+
+def _cache_settings() -> tuple[int, int, int, int]:
+    return (
+        _setting("TENANT_CACHE_LOCAL_TTL", 10),
+        _setting("TENANT_CACHE_LOCAL_SIZE", 1024),
+        _setting("TENANT_CACHE_TIMEOUT", 300),
+        _setting("TENANT_CACHE_NEGATIVE_TIMEOUT", 30),
+    )
+
+
+def _promote(key: str, cached) -> None:
+    """Copy an entry found in the shared cache into the local tier."""
+    local_ttl, local_size, _, negative_timeout = _cache_settings()
+    ttl = local_ttl if cached != _MISSING else min(local_ttl, negative_timeout)
+    _local.set(key, cached, ttl, local_size)
+
+
+def _load_and_cache_key(key: str, load) -> Tenant | None:
+    local_ttl, local_size, timeout, negative_timeout = _cache_settings()
+    try:
+        tenant = load()
+    except (OperationalError, ProgrammingError, ImproperlyConfigured):
+        # Database unavailable, not migrated or unknown alias: never cache the failure.
+        return None
+
+    if tenant is None:
+        if negative_timeout > 0:
+            cache.set(key, _MISSING, negative_timeout)
+            _local.set(key, _MISSING, min(local_ttl, negative_timeout), local_size)
+        return None
+
+    data = snapshot_tenant(tenant)
+    if timeout > 0:
+        cache.set(key, data, timeout)
+    _local.set(key, data, local_ttl, local_size)
+    return tenant
+
+
+def _load_and_cache(host: str) -> Tenant | None:
+    return _load_and_cache_key(cache_key(host), lambda: _load_tenant(host))
+
+
+def _cached(key: str):
+    """Entry for ``key`` from the local tier, then the shared cache; None on a miss."""
+    cached = _local.get(key)
+    if cached is None and _setting("TENANT_CACHE_TIMEOUT", 300) > 0:
+        cached = cache.get(key)
+        if cached is not None:
+            _promote(key, cached)
+    return cached
+
+
+def resolve_host(host: str) -> Tenant | None:
+    """Return the active tenant serving ``host`` (already lower-cased, no port)."""
+    cached = _cached(cache_key(host))
+    if cached == _MISSING:
+        return None
+    if cached is not None:
+        return tenant_from_snapshot(cached)
+    return _load_and_cache(host)
+
+
+async def aresolve_host(host: str) -> Tenant | None:
+    """
+    Async ``resolve_host``. A local hit does no I/O and no thread handoff;
+    only a full miss runs the database lookup, in a single sync hop.
+    """
+    key = cache_key(host)
+    cached = _local.get(key)
+    if cached is None and _setting("TENANT_CACHE_TIMEOUT", 300) > 0:
+        cached = await cache.aget(key)
+        if cached is not None:
+            _promote(key, cached)
+    if cached == _MISSING:
+        return None
+    if cached is not None:
+        return tenant_from_snapshot(cached)
+    return await sync_to_async(_load_and_cache)(host)
+
+
+def resolve_tenant_id(tenant_id: int) -> Tenant | None:
+    """Active tenant by id (e.g. from a token claim), through the same cache tiers."""
+    key = tenant_id_cache_key(tenant_id)
+    cached = _cached(key)
+    if cached == _MISSING:
+        return None
+    if cached is not None:
+        return tenant_from_snapshot(cached)
+    return _load_and_cache_key(key, lambda: _load_tenant_by_id(tenant_id))
+
+
+def invalidate_tenant_ids(tenant_ids) -> None:
+    keys = [tenant_id_cache_key(tenant_id) for tenant_id in tenant_ids]
+    for key in keys:
+        _local.delete(key)
+    cache.delete_many(keys)
+
+
+def invalidate_hosts(hosts) -> None:
+    """Drop cached resolution for ``hosts`` from both tiers."""
+    keys = [cache_key(host.lower()) for host in hosts if host]
+    if not keys:
+        return
+    for key in keys:
+        _local.delete(key)
+    cache.delete_many(keys)
+
+
+def clear_local_cache() -> None:
+    _local.clear()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from .databases import get_current_database
+
+
+class TenantDatabaseRouter:
+    """
+    Route ORM queries to the active tenant database (``MULTITENANT_MODE="database"``).
+
+    Related-object lookups stay on the database their instance came from; with
+    no active tenant, queries fall through to ``default``. Every app migrates on
+    every alias, so tenant databases carry their own local ``Tenant`` copy like
+    tenant schemas do.
+    """
+
+    def _route(self, model, **hints):
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return get_current_database()
+
+    def db_for_read(self, model, **hints):
+        return self._route(model, **hints)
+
+    def db_for_write(self, model, **hints):
+        return self._route(model, **hints)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
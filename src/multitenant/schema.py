@@ -4,6 +4,8 @@ from contextlib import contextmanager
 
 from django.db import connection
 
+from common.session_state import SEARCH_PATH, TENANT_ID, apply_session_settings
+
 PUBLIC_SCHEMA_NAME = "public"
 
 
@@ -11,12 +13,41 @@ def _quote(name: str) -> str:
     return f'"{name}"'
 
 
-def set_schema(schema_name: str) -> None:
+def _search_path(schema_name: str, include_public: bool = True) -> str:
+    if include_public and schema_name != PUBLIC_SCHEMA_NAME:
+        return f"{_quote(schema_name)}, {PUBLIC_SCHEMA_NAME}"
+    if schema_name == PUBLIC_SCHEMA_NAME:
+        return PUBLIC_SCHEMA_NAME
+    return _quote(schema_name)
+
+
+def set_schema(schema_name: str, include_public: bool = True) -> None:
+    """
+    Point the connection's search_path at ``schema_name``.
+
+    ``include_public=False`` makes the path strict (tenant schema only), which
+    is what ``migrate`` needs so django_migrations lands in the tenant schema.
+    No query is sent when the connection already uses that path.
+    """
     if connection.vendor != "postgresql":  # pragma: no cover
         return
-    with connection.cursor() as cursor:
-        cursor.execute(f"SET search_path TO {_quote(schema_name)}, {PUBLIC_SCHEMA_NAME}")
+    apply_session_settings({SEARCH_PATH: _search_path(schema_name, include_public)})
+    connection.schema_name = schema_name  # type: ignore[attr-defined]
+    connection.schema_include_public = include_public  # type: ignore[attr-defined]
+
+
+def set_tenant_session(schema_name: str, tenant_id: int | str | None = None) -> None:
+    """Set search_path and the RLS tenant variable together, in at most one query."""
+    if connection.vendor != "postgresql":  # pragma: no cover
+        return
+    apply_session_settings(
+        {
+            SEARCH_PATH: _search_path(schema_name),
+            TENANT_ID: "" if tenant_id is None else str(tenant_id),
+        }
+    )
     connection.schema_name = schema_name  # type: ignore[attr-defined]
+    connection.schema_include_public = True  # type: ignore[attr-defined]
 
 
 def get_current_schema() -> str:
@@ -38,11 +69,31 @@ def drop_schema(schema_name: str) -> None:
         cursor.execute(f"DROP SCHEMA IF EXISTS {_quote(schema_name)} CASCADE")
 
 
+def schema_exists(schema_name: str) -> bool:
+    if connection.vendor != "postgresql":  # pragma: no cover
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_namespace WHERE nspname = %s", [schema_name])
+        return cursor.fetchone() is not None
+
+
+def schema_has_migrations(schema_name: str) -> bool:
+    """True when the schema has its own django_migrations table (i.e. was migrated)."""
+    if connection.vendor != "postgresql":  # pragma: no cover
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT to_regclass(%s) IS NOT NULL", [f"{_quote(schema_name)}.django_migrations"]
+        )
+        return bool(cursor.fetchone()[0])
+
+
 @contextmanager
-def schema_context(schema_name: str):
+def schema_context(schema_name: str, include_public: bool = True):
     previous = get_current_schema()
-    set_schema(schema_name)
+    previous_include_public = getattr(connection, "schema_include_public", True)
+    set_schema(schema_name, include_public)
     try:
         yield
     finally:
-        set_schema(previous)
+        set_schema(previous, previous_include_public)
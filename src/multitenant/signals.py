@@ -0,0 +1,62 @@
+"""Keep the host → tenant cache (see ``multitenant.resolver``) coherent."""
+
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from common.api.conditional import bump_version
+
+from .models import Domain, Tenant
+from .resolver import invalidate_hosts, invalidate_tenant_ids
+from .schema import PUBLIC_SCHEMA_NAME, schema_context
+
+
+def _invalidate_on_commit(hosts) -> None:
+    hosts = set(hosts)
+    if hosts:
+        transaction.on_commit(lambda: invalidate_hosts(hosts))
+
+
+def _invalidate_id_on_commit(tenant_id) -> None:
+    transaction.on_commit(lambda: invalidate_tenant_ids([tenant_id]))
+
+
+def _tenant_hosts(tenant: Tenant) -> list[str]:
+    with schema_context(PUBLIC_SCHEMA_NAME):
+        return list(Domain.objects.filter(tenant_id=tenant.pk).values_list("domain", flat=True))
+
+
+@receiver(post_save, sender=Tenant, dispatch_uid="multitenant_tenant_saved")
+def tenant_saved(sender, instance: Tenant, created: bool, **kwargs) -> None:
+    if created:
+        return
+    bump_version("multitenant.tenant", instance.pk)
+    _invalidate_on_commit(_tenant_hosts(instance))
+    _invalidate_id_on_commit(instance.pk)
+
+
+@receiver(pre_delete, sender=Tenant, dispatch_uid="multitenant_tenant_deleted")
+def tenant_deleted(sender, instance: Tenant, **kwargs) -> None:
+    _invalidate_on_commit(_tenant_hosts(instance))
+    _invalidate_id_on_commit(instance.pk)
+
+
+@receiver(pre_save, sender=Domain, dispatch_uid="multitenant_domain_pre_save")
+def domain_pre_save(sender, instance: Domain, **kwargs) -> None:
+    instance._previous_domain = None
+    if instance.pk:
+        instance._previous_domain = (
+            Domain.objects.filter(pk=instance.pk).values_list("domain", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Domain, dispatch_uid="multitenant_domain_saved")
+def domain_saved(sender, instance: Domain, **kwargs) -> None:
+    _invalidate_on_commit([instance.domain, getattr(instance, "_previous_domain", None)])
+
+
+@receiver(post_delete, sender=Domain, dispatch_uid="multitenant_domain_deleted")
+def domain_deleted(sender, instance: Domain, **kwargs) -> None:
+    _invalidate_on_commit([instance.domain])
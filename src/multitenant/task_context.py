@@ -0,0 +1,45 @@
+"""
+Carry the active tenant database into Celery tasks.
+
+The publishing side stamps the current alias into the message headers;
+the worker activates it around the task, so ``task.delay()`` from inside a
+tenant request runs against that tenant's database.
+"""
+
+from __future__ import annotations
+
+from celery.signals import before_task_publish, task_postrun, task_prerun
+
+from .databases import activate_database, deactivate_database, get_current_database
+
+HEADER = "tenant_database"
+
+
+def _task_alias(task) -> str | None:
+    request = task.request
+    alias = getattr(request, HEADER, None)
+    if alias is None:
+        alias = (getattr(request, "headers", None) or {}).get(HEADER)
+    return alias
+
+
+@before_task_publish.connect(dispatch_uid="multitenant_stamp_database")
+def stamp_database(headers=None, **kwargs):
+    alias = get_current_database()
+    if alias and headers is not None:
+        headers.setdefault(HEADER, alias)
+
+
+@task_prerun.connect(dispatch_uid="multitenant_activate_database")
+def activate_task_database(task=None, **kwargs):
+    alias = _task_alias(task) if task is not None else None
+    if alias:
+        task.request._tenant_database_token = activate_database(alias)
+
+
+@task_postrun.connect(dispatch_uid="multitenant_deactivate_database")
+def deactivate_task_database(task=None, **kwargs):
+    token = getattr(task.request, "_tenant_database_token", None) if task is not None else None
+    if token is not None:
+        deactivate_database(token)
+        task.request._tenant_database_token = None
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from celery import shared_task
+
+from .pool import fill_schema_pool
+
+
+@shared_task(ignore_result=True)
+def refill_schema_pool() -> int:
+    """Keep the warm schema pool at TENANT_SCHEMA_POOL_SIZE."""
+    return fill_schema_pool()
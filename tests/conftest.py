@@ -29,6 +29,17 @@ def api_client() -> APIClient:
     return APIClient()
 
 
+@pytest.fixture
+def locmem_cache(settings):
+    """Point the default cache at an empty local-memory backend."""
+    from django.core.cache import cache
+
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
 @pytest.fixture
 def user(db) -> User:
     """Create and return a basic test user."""
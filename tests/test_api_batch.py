@@ -0,0 +1,65 @@
+"""Tests for the /api/v1/batch endpoint."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from api.v1.batch import BatchView
+from core.models import User
+from multitenant.models import Tenant
+
+
+@pytest.fixture(autouse=True)
+def _batch_settings(locmem_cache, settings):
+    settings.API_BATCH_MAX_REQUESTS = 3
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(
+        username=f"batch-{uuid.uuid4().hex[:6]}", email="batch@example.com", password="x"
+    )
+
+
+def _batch(user, requests, tenant=None):
+    request = APIRequestFactory().post("/api/v1/batch", {"requests": requests}, format="json")
+    request.tenant = tenant
+    force_authenticate(request, user=user)
+    return BatchView.as_view()(request)
+
+
+@pytest.mark.django_db
+class TestBatch:
+    def test_runs_sub_requests_in_order(self, user):
+        response = _batch(user, [{"id": "me", "path": "/me"}, {"path": "/api/v1/nope"}])
+        assert response.status_code == 200
+        me, missing = response.data["responses"]
+        assert me["id"] == "me"
+        assert me["status"] == 200
+        assert me["body"]["user"]["email"] == "batch@example.com"
+        assert missing["status"] == 404
+
+    def test_sub_requests_share_the_tenant(self, user):
+        slug = f"batch-{uuid.uuid4().hex[:8]}"
+        tenant = Tenant.objects.create(name="Batch", slug=slug, schema_name=slug)
+        (dashboard,) = _batch(user, [{"path": "/dashboard"}], tenant=tenant).data["responses"]
+        assert dashboard["status"] == 200
+        assert "stats" in dashboard["body"]
+
+    def test_conditional_headers_pass_through(self, user):
+        (first,) = _batch(user, [{"path": "/me"}]).data["responses"]
+        etag = first["headers"]["ETag"]
+        (second,) = _batch(
+            user, [{"path": "/me", "headers": {"If-None-Match": etag}}]
+        ).data["responses"]
+        assert second["status"] == 304
+        assert second["body"] is None
+
+    def test_limits(self, user):
+        assert _batch(user, [{"path": "/me"}] * 4).status_code == 400
+        assert _batch(user, [{"path": "/me", "method": "POST"}]).status_code == 400
+        (nested,) = _batch(user, [{"path": "/batch"}]).data["responses"]
+        assert nested["status"] == 400
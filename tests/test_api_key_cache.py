@@ -0,0 +1,80 @@
+"""Tests for the verified API key cache used by ApiKeyAuthentication."""
+
+from __future__ import annotations
+
+import uuid
+from unittest import mock
+
+import pytest
+from django.test import RequestFactory
+from rest_framework import exceptions
+
+from api import key_cache
+from api.authentication import ApiKeyAuthentication
+from api.models import ApiKey
+from core.models import User
+from multitenant.models import Tenant
+
+
+@pytest.fixture(autouse=True)
+def _cached(locmem_cache, settings):
+    settings.API_KEY_CACHE_TIMEOUT = 60
+
+
+@pytest.fixture
+def api_key(db):
+    slug = f"keys-{uuid.uuid4().hex[:8]}"
+    tenant = Tenant.objects.create(name="Keys", slug=slug, schema_name=slug)
+    user = User.objects.create_user(username=slug, email=f"{slug}@example.com", password="x")
+    key, plain = ApiKey.generate(organization=tenant, user=user, name="default")
+    return tenant, key, plain
+
+
+def _authenticate(tenant, plain):
+    request = RequestFactory().get("/api/v1/tenant/", HTTP_X_API_KEY=plain)
+    request.tenant = tenant
+    return ApiKeyAuthentication().authenticate(request)
+
+
+@pytest.mark.django_db
+class TestApiKeyCache:
+    def test_hasher_runs_once_per_key(self, api_key):
+        tenant, key, plain = api_key
+        with mock.patch.object(ApiKey, "check_secret", autospec=True, return_value=True) as check:
+            for _ in range(3):
+                _user, authenticated = _authenticate(tenant, plain)
+                assert authenticated.pk == key.pk
+        assert check.call_count == 1
+
+    def test_cached_lookup_loads_key_tenant_and_user_in_one_query(
+        self, api_key, django_assert_num_queries
+    ):
+        tenant, key, plain = api_key
+        _authenticate(tenant, plain)
+        with mock.patch.object(ApiKey, "mark_used"), django_assert_num_queries(1):
+            user, authenticated = _authenticate(tenant, plain)
+            assert authenticated.organization.slug == tenant.slug
+            assert user.pk == key.user_id
+
+    def test_wrong_secret_is_not_cached(self, api_key):
+        tenant, _key, plain = api_key
+        with pytest.raises(exceptions.AuthenticationFailed):
+            _authenticate(tenant, plain + "x")
+        assert key_cache.get_verified(tenant.id, plain + "x") is None
+
+    def test_revoke_invalidates_immediately(self, api_key):
+        tenant, key, plain = api_key
+        _authenticate(tenant, plain)
+        assert key_cache.get_verified(tenant.id, plain) == key.pk
+
+        key.revoke()
+
+        assert key_cache.get_verified(tenant.id, plain) is None
+        with pytest.raises(exceptions.AuthenticationFailed):
+            _authenticate(tenant, plain)
+
+    def test_digest_does_not_contain_the_key(self, api_key):
+        _tenant, _key, plain = api_key
+        digest = key_cache.key_digest(plain)
+        assert plain not in digest
+        assert len(digest) == 64
@@ -0,0 +1,90 @@
+"""Tests for the write-behind API key usage buffer."""
+
+from __future__ import annotations
+
+import os
+import uuid
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api import usage
+from api.models import ApiKey
+from multitenant.models import Tenant
+
+
+@pytest.fixture(autouse=True)
+def _local_buffer(locmem_cache, settings, monkeypatch):
+    settings.API_KEY_USAGE_FLUSH_SECONDS = 3600
+    # Tests flush explicitly; the flusher thread is covered on its own.
+    monkeypatch.setattr(usage, "_flusher_pid", os.getpid())
+
+
+@pytest.fixture
+def api_key(db):
+    slug = f"usage-{uuid.uuid4().hex[:8]}"
+    tenant = Tenant.objects.create(name="Usage", slug=slug, schema_name=slug)
+    key, _plain = ApiKey.generate(organization=tenant, user=None, name="default")
+    usage.flush_usage()  # start from an empty buffer
+    return key
+
+
+@pytest.mark.django_db
+class TestApiKeyUsage:
+    def test_mark_used_does_not_write(self, api_key, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            for _ in range(5):
+                api_key.mark_used()
+        api_key.refresh_from_db()
+        assert api_key.request_count == 0
+        assert api_key.last_used_at is None
+
+    def test_flush_applies_counts_in_one_update(self, api_key):
+        for _ in range(3):
+            api_key.mark_used()
+        with CaptureQueriesContext(connection) as queries:
+            assert usage.flush_usage() == 1
+        updates = [q for q in queries.captured_queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        api_key.refresh_from_db()
+        assert api_key.request_count == 3
+        assert api_key.last_used_at is not None
+
+    def test_flushes_accumulate(self, api_key):
+        api_key.mark_used()
+        usage.flush_usage()
+        api_key.mark_used()
+        api_key.mark_used()
+        usage.flush_usage()
+        api_key.refresh_from_db()
+        assert api_key.request_count == 3
+
+    def test_empty_flush_is_free(self, api_key, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert usage.flush_usage() == 0
+
+    def test_local_hits_start_one_flusher_per_process(self, api_key, monkeypatch):
+        monkeypatch.setattr(usage, "_flusher_pid", None)
+        with mock.patch.object(usage.threading, "Thread") as thread:
+            api_key.mark_used()
+            api_key.mark_used()
+        thread.assert_called_once()
+        thread.return_value.start.assert_called_once()
+
+    def test_flusher_writes_the_process_buffer(self, api_key):
+        api_key.mark_used()
+        api_key.mark_used()
+        assert usage.flush_local_usage() == 1
+        api_key.refresh_from_db()
+        assert api_key.request_count == 2
+
+    def test_failed_flush_keeps_the_counts(self, api_key):
+        api_key.mark_used()
+        with mock.patch.object(usage, "tenant_scope", side_effect=RuntimeError("db down")):
+            assert usage.flush_usage() == 0
+        api_key.mark_used()
+        assert usage.flush_usage() == 1
+        api_key.refresh_from_db()
+        assert api_key.request_count == 2
@@ -0,0 +1,89 @@
+"""Tests for the native async paths of TenantMiddleware and MetricsMiddleware."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from common.middleware import MetricsMiddleware
+from multitenant import resolver
+from multitenant.databases import get_current_database
+from multitenant.middleware import TenantMiddleware
+from multitenant.models import Tenant
+
+
+def _async_view(seen: dict):
+    async def view(request):
+        seen["tenant"] = request.tenant
+        seen["database"] = get_current_database()
+        return HttpResponse("ok")
+
+    return view
+
+
+@pytest.fixture(autouse=True)
+def _clear_local():
+    resolver.clear_local_cache()
+    yield
+    resolver.clear_local_cache()
+
+
+def test_metrics_middleware_stays_async():
+    async def view(request):
+        return HttpResponse("ok")
+
+    middleware = MetricsMiddleware(view)
+    request = RequestFactory().get("/healthz")
+    with mock.patch("common.middleware.REQUEST_COUNT") as count:
+        response = async_to_sync(middleware)(request)
+    assert response.status_code == 200
+    count.labels.assert_called_once_with("GET", "/healthz", "200")
+
+
+@override_settings(MULTITENANT_MODE="off")
+def test_off_mode_skips_resolution():
+    seen: dict = {}
+    with mock.patch("multitenant.middleware.aresolve_host") as aresolve:
+        async_to_sync(TenantMiddleware(_async_view(seen)))(RequestFactory().get("/"))
+    aresolve.assert_not_called()
+    assert seen["tenant"] is None
+
+
+@override_settings(MULTITENANT_MODE="database", ALLOWED_HOSTS=["*"])
+def test_database_mode_needs_no_thread_hop():
+    tenant = Tenant(id=3, slug="acme", schema_name="acme", database="")
+    seen: dict = {}
+
+    async def aresolve(host):
+        return tenant
+
+    with mock.patch("multitenant.middleware.aresolve_host", aresolve), mock.patch(
+        "multitenant.middleware.sync_to_async"
+    ) as hop:
+        request = RequestFactory().get("/", HTTP_HOST="acme.test.com")
+        async_to_sync(TenantMiddleware(_async_view(seen)))(request)
+
+    hop.assert_not_called()
+    assert seen == {"tenant": tenant, "database": "default"}
+    assert get_current_database() is None
+
+
+def test_aresolve_host_serves_local_hits_without_io(locmem_cache, settings):
+    settings.TENANT_CACHE_TIMEOUT = 300
+    settings.TENANT_CACHE_LOCAL_TTL = 10
+    tenant = Tenant(id=5, name="Acme", slug="acme", schema_name="acme")
+    resolver._local.set(
+        resolver.cache_key("acme.test.com"), resolver.snapshot_tenant(tenant), 10, 16
+    )
+    with mock.patch.object(resolver, "cache") as cache, mock.patch.object(
+        resolver, "_load_and_cache"
+    ) as load:
+        resolved = async_to_sync(resolver.aresolve_host)("acme.test.com")
+
+    cache.aget.assert_not_called()
+    load.assert_not_called()
+    assert resolved.pk == 5 and resolved.slug == "acme"
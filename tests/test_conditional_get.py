@@ -0,0 +1,89 @@
+"""Tests for ETag / Last-Modified conditional GETs."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from rest_framework import viewsets
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from api.v1.viewsets import ProfileViewSet
+from common.api.conditional import ConditionalGetMixin, bump_version, get_versions
+from core.models import User
+
+pytestmark = pytest.mark.usefixtures("locmem_cache")
+
+
+class _CountingViewSet(ConditionalGetMixin, viewsets.ViewSet):
+    permission_classes = ()
+    authentication_classes = ()
+    etag_scopes = ("lms.course",)
+    calls = 0
+
+    def get_etag_owner(self):
+        return 7
+
+    def list(self, request):
+        type(self).calls += 1
+        return Response({"ok": True})
+
+
+def _get(view, headers=None, user=None):
+    request = APIRequestFactory().get("/resource/", **(headers or {}))
+    if user is not None:
+        force_authenticate(request, user=user)
+    return view(request)
+
+
+class TestVersionStamps:
+    def test_bump_changes_only_the_owner_stamp(self):
+        before = get_versions(["lms.course", "cms.contentpage"], 1)
+        other = get_versions(["lms.course"], 2)
+        assert get_versions(["lms.course", "cms.contentpage"], 1) == before
+        bump_version("lms.course", 1)
+        after = get_versions(["lms.course", "cms.contentpage"], 1)
+        assert after[0] != before[0]
+        assert after[1] == before[1]
+        assert get_versions(["lms.course"], 2) == other
+
+
+class TestConditionalGetMixin:
+    def test_304_skips_the_handler(self):
+        view = _CountingViewSet.as_view({"get": "list"})
+        _CountingViewSet.calls = 0
+        first = _get(view)
+        assert first.status_code == 200
+        etag = first["ETag"]
+        assert etag.startswith('W/"')
+        assert "Last-Modified" in first
+
+        second = _get(view, {"HTTP_IF_NONE_MATCH": etag})
+        assert second.status_code == 304
+        assert second["ETag"] == etag
+        assert _CountingViewSet.calls == 1
+
+    def test_version_bump_invalidates_the_etag(self):
+        view = _CountingViewSet.as_view({"get": "list"})
+        etag = _get(view)["ETag"]
+        bump_version("lms.course", 7)
+        response = _get(view, {"HTTP_IF_NONE_MATCH": etag})
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_profile_etag_follows_user_changes():
+    user = User.objects.create_user(
+        username=f"etag-{uuid.uuid4().hex[:6]}", email="etag@example.com", password="x"
+    )
+    view = ProfileViewSet.as_view({"get": "retrieve"})
+    etag = _get(view, user=user)["ETag"]
+    assert _get(view, {"HTTP_IF_NONE_MATCH": etag}, user=user).status_code == 304
+
+    user.first_name = "Changed"
+    user.save()
+    response = _get(view, {"HTTP_IF_NONE_MATCH": etag}, user=user)
+    assert response.status_code == 200
+    assert response.data["user"]["first_name"] == "Changed"
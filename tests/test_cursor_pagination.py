@@ -0,0 +1,65 @@
+"""Tests for opt-in keyset pagination on tenant-scoped lists."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from rest_framework import mixins, serializers, viewsets
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.test import APIRequestFactory
+
+from common.api.pagination import CursorPaginationMixin
+from core.models import ActivityLog
+from multitenant.models import Tenant
+
+
+class _LogSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ActivityLog
+        fields = ["id", "action"]
+
+
+class _LogViewSet(CursorPaginationMixin, mixins.ListModelMixin, viewsets.GenericViewSet):
+    serializer_class = _LogSerializer
+    permission_classes = []
+    authentication_classes = []
+
+    def get_queryset(self):
+        return ActivityLog.objects.filter(organization=self.request.tenant)
+
+
+@pytest.fixture
+def tenant(db):
+    slug = f"cursor-{uuid.uuid4().hex[:8]}"
+    tenant = Tenant.objects.create(name="Cursor", slug=slug, schema_name=slug)
+    ActivityLog.objects.bulk_create(
+        ActivityLog(organization=tenant, action=f"a{i}") for i in range(5)
+    )
+    return tenant
+
+
+def _list(tenant, path):
+    request = APIRequestFactory().get(path)
+    request.tenant = tenant
+    return _LogViewSet.as_view({"get": "list"})(request)
+
+
+@pytest.mark.django_db
+class TestCursorPagination:
+    def test_page_numbers_stay_the_default(self, tenant):
+        response = _list(tenant, "/logs/")
+        assert response.data["count"] == 5
+        view = _LogViewSet()
+        view.request = None
+        assert isinstance(view.paginator, PageNumberPagination)
+
+    def test_cursor_walks_every_row_once(self, tenant):
+        response = _list(tenant, "/logs/?cursor=&page_size=2")
+        assert "count" not in response.data
+        seen = [row["id"] for row in response.data["results"]]
+        while response.data["next"]:
+            response = _list(tenant, response.data["next"])
+            seen += [row["id"] for row in response.data["results"]]
+        expected = ActivityLog.objects.filter(organization=tenant).order_by("-created_at", "id")
+        assert seen == list(expected.values_list("id", flat=True))
@@ -172,3 +172,90 @@ class TestDRFAuthConfig:
         from django.conf import settings
         auth_classes = settings.REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"]
         assert "api.authentication.ApiKeyAuthentication" in auth_classes
+
+
+# ── Authorization claims (JWT_AUTHZ_CLAIMS) ──────────────────
+
+
+@pytest.fixture
+def claims_member(db, settings):
+    from django.core.cache import cache
+
+    from core.models import Membership, Role, User
+    from core.services.seed import seed_default_roles
+    from multitenant.models import Tenant
+
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    settings.JWT_AUTHZ_CLAIMS = True
+    cache.clear()
+    tenant = Tenant.objects.create(name="Claims", slug="claims", schema_name="claims")
+    seed_default_roles(tenant)
+    role = Role.objects.get(organization=tenant, slug="editor")
+    user = User.objects.create_user(username="claims", email="claims@example.com", password="x")
+    Membership.objects.create(user=user, organization=tenant, role=role)
+    yield tenant, user, role
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestAuthzClaims:
+    def _access(self, tenant, user):
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        from api.serializers_auth import stamp_access_token
+
+        access = RefreshToken.for_user(user).access_token
+        stamp_access_token(access, user, tenant)
+        return access
+
+    def test_claims_describe_tenant_and_role(self, claims_member):
+        tenant, user, role = claims_member
+        access = self._access(tenant, user)
+        assert access["tid"] == tenant.id
+        assert access["tsc"] == tenant.schema_name
+        assert access["rol"] == "editor"
+        assert access["rid"] == role.id
+        assert "rv" in access
+
+    def test_current_claims_are_trusted_without_queries(
+        self, claims_member, django_assert_num_queries
+    ):
+        from common.policies import has_permission, member_role_from_claims
+        from core.models import User
+
+        tenant, user, _role = claims_member
+        access = self._access(tenant, user)
+        fresh_user = User.objects.get(pk=user.pk)
+        with django_assert_num_queries(0):
+            member_role_from_claims(fresh_user, tenant, access)
+            assert has_permission(fresh_user, tenant, "core.invite_members") is True
+            assert has_permission(fresh_user, tenant, "core.manage_roles") is False
+
+    def test_permission_change_makes_claims_stale(self, claims_member):
+        from common.policies import StaleAuthorization, member_role_from_claims
+        from core.models import Permission, User
+
+        tenant, user, role = claims_member
+        access = self._access(tenant, user)
+        role.permissions.add(Permission.objects.get(codename="core.manage_roles"))
+        with pytest.raises(StaleAuthorization):
+            member_role_from_claims(User.objects.get(pk=user.pk), tenant, access)
+
+    def test_role_reassignment_makes_claims_stale(self, claims_member):
+        from common.policies import StaleAuthorization, member_role_from_claims
+        from core.models import Membership, Role, User
+
+        tenant, user, _role = claims_member
+        access = self._access(tenant, user)
+        membership = Membership.objects.get(user=user, organization=tenant)
+        membership.role = Role.objects.get(organization=tenant, slug="viewer")
+        membership.save()
+        with pytest.raises(StaleAuthorization):
+            member_role_from_claims(User.objects.get(pk=user.pk), tenant, access)
+
+    def test_middleware_uses_token_tenant_on_api_host(self, claims_member):
+        from multitenant.middleware import _tenant_from_token
+
+        tenant, user, _role = claims_member
+        assert _tenant_from_token(str(self._access(tenant, user))).id == tenant.id
+        assert _tenant_from_token("not-a-token") is None
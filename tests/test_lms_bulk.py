@@ -0,0 +1,93 @@
+"""Tests for bulk section/lesson authoring."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import User
+from lms import bulk
+from lms.models import Course, Lesson, Section
+from lms.views import LessonViewSet
+from multitenant.models import Tenant
+
+
+@pytest.fixture
+def course(db):
+    slug = f"bulk-{uuid.uuid4().hex[:8]}"
+    tenant = Tenant.objects.create(name="Bulk", slug=slug, schema_name=slug)
+    return Course.objects.create(organization=tenant, title="Course", slug="course")
+
+
+def _orders(model, course):
+    return list(model.objects.filter(course=course).order_by("order").values_list("title", "order"))
+
+
+@pytest.mark.django_db
+class TestBulkAuthoring:
+    def test_create_fills_missing_orders(self, course, django_assert_max_num_queries):
+        rows = [{"course": course.pk, "title": f"L{i}"} for i in range(200)]
+        with django_assert_max_num_queries(6):
+            created = bulk.bulk_create(Lesson, course.organization, rows)
+        assert len(created) == 200
+        assert _orders(Lesson, course)[:2] == [("L0", 0), ("L1", 1)]
+        assert Lesson.objects.get(course=course, order=0).slug == "l0"
+
+    def test_create_rejects_taken_orders(self, course):
+        bulk.bulk_create(Section, course.organization, [{"course": course.pk, "title": "A"}])
+        with pytest.raises(ValidationError):
+            bulk.bulk_create(
+                Section, course.organization, [{"course": course.pk, "title": "B", "order": 0}]
+            )
+
+    def test_lesson_section_must_match_course(self, course):
+        other = Course.objects.create(organization=course.organization, title="O", slug="o")
+        (section,) = bulk.bulk_create(
+            Section, course.organization, [{"course": other.pk, "title": "S"}]
+        )
+        with pytest.raises(ValidationError):
+            bulk.bulk_create(
+                Lesson,
+                course.organization,
+                [{"course": course.pk, "section": section.pk, "title": "L"}],
+            )
+
+    def test_update_can_swap_orders(self, course):
+        a, b = bulk.bulk_create(
+            Section,
+            course.organization,
+            [{"course": course.pk, "title": "A"}, {"course": course.pk, "title": "B"}],
+        )
+        bulk.bulk_update(
+            Section,
+            course.organization,
+            [{"id": a.pk, "order": 1, "title": "A2"}, {"id": b.pk, "order": 0}],
+        )
+        assert _orders(Section, course) == [("B", 0), ("A2", 1)]
+
+    def test_reorder(self, course):
+        sections = bulk.bulk_create(
+            Section, course.organization, [{"course": course.pk, "title": t} for t in "ABC"]
+        )
+        ids = [sections[2].pk, sections[0].pk, sections[1].pk]
+        bulk.reorder(Section, course.organization, course.pk, ids)
+        assert _orders(Section, course) == [("C", 0), ("A", 1), ("B", 2)]
+        with pytest.raises(ValidationError):
+            bulk.reorder(Section, course.organization, course.pk, ids[:2])
+
+    def test_bulk_endpoint(self, course):
+        user = User.objects.create_user(
+            username=f"bulk-{uuid.uuid4().hex[:6]}", email="bulk@example.com", password="x"
+        )
+        items = [{"course": course.pk, "title": "One"}, {"course": course.pk, "title": "Two"}]
+        request = APIRequestFactory().post(
+            "/api/v1/lms/lessons/bulk/", {"items": items}, format="json"
+        )
+        request.tenant = course.organization
+        force_authenticate(request, user=user)
+        response = LessonViewSet.as_view({"post": "bulk"})(request)
+        assert response.status_code == 201
+        assert [item["order"] for item in response.data] == [0, 1]
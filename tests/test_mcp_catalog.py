@@ -0,0 +1,72 @@
+"""Tests for the precomputed MCP tool catalog."""
+
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+from rest_framework import serializers
+from rest_framework.routers import DefaultRouter
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import User
+from mcp import tool_registry
+from mcp.views import McpServerViewSet, tool_catalog_view
+
+
+@pytest.fixture(autouse=True)
+def _fresh_snapshot():
+    tool_registry._snapshot = None
+    yield
+    tool_registry._snapshot = None
+
+
+def test_catalog_is_built_once():
+    with mock.patch.object(
+        tool_registry, "discover_tools", wraps=tool_registry.discover_tools
+    ) as discover:
+        first = tool_registry.get_catalog_snapshot()
+        second = tool_registry.get_catalog_snapshot()
+    assert first is second
+    assert discover.call_count == 1
+    assert json.loads(first.body)["count"] == len(first.tools)
+
+
+def test_related_fields_do_not_list_their_choices():
+    class _Serializer(serializers.Serializer):
+        owner = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
+        status = serializers.ChoiceField(choices=["draft", "published"])
+
+    # No django_db mark: any query for the related rows would fail the test.
+    schema = tool_registry.serializer_to_json_schema(_Serializer)
+    assert "enum" not in schema["properties"]["owner"]
+    assert schema["properties"]["status"]["enum"] == ["draft", "published"]
+
+
+def test_router_change_rebuilds_the_catalog():
+    router = DefaultRouter()
+    router.register("servers", McpServerViewSet, basename="servers")
+    with mock.patch.object(tool_registry, "_api_router", return_value=router):
+        before = tool_registry.get_catalog_snapshot()
+        router.register("servers-again", McpServerViewSet, basename="servers-again")
+        after = tool_registry.get_catalog_snapshot()
+    assert after is not before
+    assert after.etag != before.etag
+    assert len(after.tools) > len(before.tools)
+
+
+@pytest.mark.django_db
+def test_catalog_view_answers_304():
+    user = User.objects.create_user(username="catalog", email="c@example.com", password="x")
+
+    def get(**headers):
+        request = APIRequestFactory().get("/api/v1/mcp/catalog/", **headers)
+        force_authenticate(request, user=user)
+        return tool_catalog_view(request)
+
+    response = get()
+    assert response.status_code == 200
+    etag = response["ETag"]
+    assert json.loads(response.content)["version"] == tool_registry.CATALOG_VERSION
+    assert get(HTTP_IF_NONE_MATCH=etag).status_code == 304
@@ -0,0 +1,130 @@
+"""Tests for in-process MCP tool execution."""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+from rest_framework.routers import DefaultRouter
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import User
+from mcp import tool_registry
+from mcp.views import McpServerViewSet, tool_execute_view
+from multitenant.models import Tenant
+
+
+@pytest.fixture(autouse=True)
+def _servers_router():
+    router = DefaultRouter()
+    router.register("servers", McpServerViewSet, basename="servers")
+    tool_registry._snapshot = None
+    with mock.patch.object(tool_registry, "_api_router", return_value=router):
+        yield
+    tool_registry._snapshot = None
+
+
+@pytest.fixture
+def caller(db):
+    slug = f"exec-{uuid.uuid4().hex[:8]}"
+    tenant = Tenant.objects.create(name="Exec", slug=slug, schema_name=slug)
+    user = User.objects.create_user(
+        username=f"exec-{uuid.uuid4().hex[:6]}", email="exec@example.com", password="x"
+    )
+    return tenant, user
+
+
+def _execute(caller, calls):
+    tenant, user = caller
+    request = APIRequestFactory().post(
+        "/api/v1/mcp/tools/execute/", {"calls": calls}, format="json"
+    )
+    request.tenant = tenant
+    force_authenticate(request, user=user)
+    return tool_execute_view(request)
+
+
+@pytest.mark.django_db
+class TestToolExecuteView:
+    @pytest.fixture(autouse=True)
+    def _batch_max(self, settings):
+        settings.MCP_TOOL_BATCH_MAX = 3
+
+    def test_calls_see_each_others_writes(self, caller):
+        server = {"name": "Docs", "endpoint_url": "https://mcp.example.com"}
+        response = _execute(
+            caller,
+            [
+                {"name": "servers_create", "arguments": server},
+                {"name": "servers_list"},
+            ],
+        )
+        assert response.status_code == 200
+        created, listed = response.data["results"]
+        assert created["status"] == 201
+        assert listed["status"] == 200
+        assert [row["name"] for row in listed["data"]["results"]] == ["Docs"]
+
+        (retrieved,) = _execute(
+            caller, [{"name": "servers_retrieve", "arguments": {"id": created["data"]["id"]}}]
+        ).data["results"]
+        assert retrieved["status"] == 200
+        assert retrieved["data"]["endpoint_url"] == "https://mcp.example.com"
+
+    def test_errors_are_per_call(self, caller):
+        unknown, no_id = _execute(
+            caller, [{"name": "nope_list"}, {"name": "servers_retrieve"}]
+        ).data["results"]
+        assert unknown["status"] == 404
+        assert no_id["status"] == 400
+
+    def test_batch_limit(self, caller):
+        assert _execute(caller, [{"name": "servers_list"}] * 4).status_code == 400
+
+
+def test_reads_run_concurrently_and_writes_are_barriers():
+    threads = {}
+
+    def fake_execute(name, args, request):
+        threads[name] = threading.current_thread()
+        return tool_registry.ToolResult(name, 200, name)
+
+    calls = [
+        {"name": "servers_list"},
+        {"name": "servers_retrieve", "arguments": {"id": 1}},
+        {"name": "servers_create"},
+        {"name": "servers_list"},
+    ]
+    request = mock.Mock(tenant=None)
+    with (
+        mock.patch.object(tool_registry, "execute_tool", side_effect=fake_execute),
+        override_settings(MCP_TOOL_WORKERS=2),
+    ):
+        results = tool_registry.execute_tools(calls, request)
+
+    assert [result.name for result in results] == [call["name"] for call in calls]
+    assert threads["servers_retrieve"] is not threading.current_thread()
+    assert threads["servers_create"] is threading.current_thread()
+
+
+def test_concurrent_reads_reuse_the_process_pool():
+    threads = set()
+
+    def fake_execute(name, args, request):
+        threads.add(threading.current_thread())
+        return tool_registry.ToolResult(name, 200, name)
+
+    calls = [{"name": "servers_list"}] * 4
+    with (
+        mock.patch.object(tool_registry, "execute_tool", side_effect=fake_execute),
+        override_settings(MCP_TOOL_WORKERS=2),
+    ):
+        tool_registry.execute_tools(calls, mock.Mock(tenant=None))
+        pool = tool_registry._executor
+        tool_registry.execute_tools(calls, mock.Mock(tenant=None))
+
+    assert tool_registry._executor is pool
+    assert len(threads) <= 2
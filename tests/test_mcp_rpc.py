@@ -0,0 +1,179 @@
+"""Tests for the MCP JSON-RPC (Streamable HTTP) transport."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework.routers import DefaultRouter
+from rest_framework.test import APIRequestFactory
+
+from core.models import User
+from mcp import tool_registry
+from mcp.models import McpResource, McpServer
+from mcp.transport import SESSION_HEADER, mcp_rpc_view
+from mcp.views import McpServerViewSet
+from multitenant.models import Tenant
+
+
+@pytest.fixture(autouse=True)
+def _rpc_settings(locmem_cache, settings):
+    settings.MCP_TOOL_WORKERS = 1
+
+
+@pytest.fixture(autouse=True)
+def _servers_router():
+    router = DefaultRouter()
+    router.register("servers", McpServerViewSet, basename="servers")
+    tool_registry._snapshot = None
+    with mock.patch.object(tool_registry, "_api_router", return_value=router):
+        yield
+    tool_registry._snapshot = None
+
+
+@pytest.fixture
+def tenant(db):
+    slug = f"rpc-{uuid.uuid4().hex[:8]}"
+    return Tenant.objects.create(name="Rpc", slug=slug, schema_name=slug)
+
+
+def _user():
+    name = f"rpc-{uuid.uuid4().hex[:6]}"
+    return User.objects.create_user(username=name, email=f"{name}@example.com", password="x")
+
+
+def _post(user, tenant, payload, session=None, accept="application/json"):
+    headers = {"HTTP_ACCEPT": accept}
+    if session:
+        headers[f"HTTP_{SESSION_HEADER.upper().replace('-', '_')}"] = session
+    request = APIRequestFactory().post(
+        "/api/v1/mcp/rpc/", json.dumps(payload), content_type="application/json", **headers
+    )
+    request.user = user
+    request.tenant = tenant
+    return async_to_sync(mcp_rpc_view)(request)
+
+
+def _call(message_id, name, arguments=None, token=None):
+    params = {"name": name, "arguments": arguments or {}}
+    if token is not None:
+        params["_meta"] = {"progressToken": token}
+    return {"jsonrpc": "2.0", "id": message_id, "method": "tools/call", "params": params}
+
+
+def _initialize(user, tenant) -> str:
+    response = _post(
+        user,
+        tenant,
+        {"jsonrpc": "2.0", "id": 0, "method": "initialize", "params": {"protocolVersion": "x"}},
+    )
+    assert response.status_code == 200
+    assert json.loads(response.content)["result"]["capabilities"]["tools"]
+    return response[SESSION_HEADER]
+
+
+def _events(response) -> list[dict]:
+    # A WSGI request (the test factory's) gets the plain generator.
+    assert not response.is_async
+    body = b"".join(response.streaming_content).decode()
+    return [
+        json.loads(line[len("data: ") :]) for line in body.splitlines() if line.startswith("data: ")
+    ]
+
+
+@pytest.mark.django_db
+class TestRpc:
+    def test_session_is_required_and_bound_to_the_user(self, tenant):
+        user = _user()
+        session = _initialize(user, tenant)
+        ping = {"jsonrpc": "2.0", "id": 1, "method": "ping"}
+        assert _post(user, tenant, ping).status_code == 400
+        assert _post(_user(), tenant, ping, session=session).status_code == 404
+        response = _post(user, tenant, ping, session=session)
+        assert json.loads(response.content) == {"jsonrpc": "2.0", "id": 1, "result": {}}
+
+    def test_tools_list_and_call(self, tenant):
+        user = _user()
+        session = _initialize(user, tenant)
+        McpServer.objects.create(organization=tenant, name="Docs", endpoint_url="https://a.io")
+        listed, called, unknown = json.loads(
+            _post(
+                user,
+                tenant,
+                [
+                    {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+                    _call(2, "servers_list"),
+                    _call(3, "nope"),
+                ],
+                session=session,
+            ).content
+        )
+        assert "servers_list" in {tool["name"] for tool in listed["result"]["tools"]}
+        assert called["id"] == 2
+        assert not called["result"]["isError"]
+        assert called["result"]["structuredContent"]["results"][0]["name"] == "Docs"
+        assert unknown["error"]["code"] == -32602
+
+    def test_tool_calls_stream_over_sse(self, tenant):
+        user = _user()
+        session = _initialize(user, tenant)
+        response = _post(
+            user,
+            tenant,
+            [_call(1, "servers_list", token="a"), _call(2, "servers_list", token="b")],
+            session=session,
+            accept="application/json, text/event-stream",
+        )
+        assert response["Content-Type"] == "text/event-stream"
+        events = _events(response)
+        results = [event for event in events if "result" in event]
+        progress = [event for event in events if event.get("method") == "notifications/progress"]
+        assert sorted(event["id"] for event in results) == [1, 2]
+        assert progress[0]["params"] == {"progressToken": "b", "progress": 1, "total": 2}
+
+    def test_resources_read(self, tenant):
+        user = _user()
+        session = _initialize(user, tenant)
+        server = McpServer.objects.create(
+            organization=tenant, name="Files", endpoint_url="https://files.io"
+        )
+        McpResource.objects.create(
+            organization=tenant, server=server, uri="file:///readme", name="Readme"
+        )
+        read, missing = json.loads(
+            _post(
+                user,
+                tenant,
+                [
+                    {
+                        "jsonrpc": "2.0",
+                        "id": 1,
+                        "method": "resources/read",
+                        "params": {"uri": "file:///readme"},
+                    },
+                    {
+                        "jsonrpc": "2.0",
+                        "id": 2,
+                        "method": "resources/read",
+                        "params": {"uri": "file:///nope"},
+                    },
+                ],
+                session=session,
+            ).content
+        )
+        (content,) = read["result"]["contents"]
+        assert json.loads(content["text"])["server"]["endpoint"] == "https://files.io"
+        assert missing["error"]["code"] == -32002
+
+    def test_delete_ends_the_session(self, tenant):
+        user = _user()
+        session = _initialize(user, tenant)
+        request = APIRequestFactory().delete("/api/v1/mcp/rpc/", HTTP_MCP_SESSION_ID=session)
+        request.user = user
+        request.tenant = tenant
+        assert async_to_sync(mcp_rpc_view)(request).status_code == 204
+        ping = {"jsonrpc": "2.0", "id": 1, "method": "ping"}
+        assert _post(user, tenant, ping, session=session).status_code == 404
@@ -0,0 +1,77 @@
+"""Tests for the write-behind McpUsageLog writer."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.models import User
+from mcp import usage
+from mcp.models import McpServer, McpTool, McpUsageLog
+from multitenant.models import Tenant
+
+
+@pytest.fixture(autouse=True)
+def _buffered(settings):
+    settings.MCP_USAGE_LOG_WORKER = False
+    settings.MCP_USAGE_LOG_QUEUE_SIZE = 3
+    settings.MCP_USAGE_LOG_MAX_PAYLOAD_BYTES = 200
+    settings.MCP_USAGE_LOG_OVERSIZE = "compress"
+
+
+@pytest.fixture
+def entry(db):
+    usage._queue = None  # fresh queue sized by the test settings
+    slug = f"ulog-{uuid.uuid4().hex[:8]}"
+    tenant = Tenant.objects.create(name="Usage log", slug=slug, schema_name=slug)
+    server = McpServer.objects.create(organization=tenant, name="S", endpoint_url="https://s.io")
+    tool = McpTool.objects.create(organization=tenant, server=server, name="search")
+    user = User.objects.create_user(username=slug, email=f"{slug}@example.com", password="x")
+    yield {
+        "organization_id": tenant.pk,
+        "server_id": server.pk,
+        "tool_id": tool.pk,
+        "user_id": user.pk,
+    }
+    usage._queue = None
+
+
+@pytest.mark.django_db
+class TestUsageLogWriter:
+    def test_record_does_not_write(self, entry, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert usage.record_usage(**entry, request_data={"q": "a"})
+        assert not McpUsageLog.objects.filter(tool_id=entry["tool_id"]).exists()
+
+    def test_flush_writes_in_one_insert(self, entry):
+        for index in range(3):
+            usage.record_usage(**entry, request_data={"q": index})
+        with CaptureQueriesContext(connection) as queries:
+            assert usage.flush_usage_logs() == 3
+        inserts = [q for q in queries.captured_queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 1
+        rows = McpUsageLog.objects.filter(tool_id=entry["tool_id"])
+        assert sorted(row.request_data["q"] for row in rows) == [0, 1, 2]
+
+    def test_full_queue_drops_and_counts(self, entry):
+        before = usage.USAGE_LOG_DROPPED.labels("queue_full")._value.get()
+        results = [usage.record_usage(**entry) for _ in range(4)]
+        assert results == [True, True, True, False]
+        assert usage.USAGE_LOG_DROPPED.labels("queue_full")._value.get() == before + 1
+
+    def test_large_payloads_are_compressed_or_truncated(self, entry):
+        big = {"text": "abc " * 500}
+        usage.record_usage(**entry, request_data=big)
+        usage.flush_usage_logs()
+        row = McpUsageLog.objects.get(tool_id=entry["tool_id"])
+        assert row.request_data["_encoding"] == usage.COMPRESSED
+        assert usage.expand_payload(row.request_data) == big
+
+        with override_settings(MCP_USAGE_LOG_OVERSIZE="truncate"):
+            shrunk = usage.shrink_payload(big)
+        assert shrunk["_truncated"] is True
+        assert len(shrunk["preview"]) == 200
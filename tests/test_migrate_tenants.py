@@ -0,0 +1,93 @@
+"""Tests for the parallel migrate_tenants command."""
+
+from __future__ import annotations
+
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from multitenant.models import Tenant
+from multitenant.schema import PUBLIC_SCHEMA_NAME, create_schema, schema_context
+
+COMMAND = "multitenant.management.commands.migrate_tenants"
+
+
+@pytest.fixture
+def empty_schemas(db, settings):
+    settings.MULTITENANT_MODE = "schema"
+    names = ["mig-a", "mig-b"]
+    with schema_context(PUBLIC_SCHEMA_NAME):
+        for name in names:
+            Tenant.objects.create(name=name, slug=name, schema_name=name)
+            create_schema(name)
+    return names
+
+
+@pytest.mark.django_db
+class TestMigrateTenants:
+    def test_unprovisioned_schemas_are_skipped(self, empty_schemas):
+        out = StringIO()
+        with mock.patch(f"{COMMAND}.migrate_schema") as worker:
+            call_command("migrate_tenants", "--skip-public", "--processes=1", stdout=out)
+        worker.assert_not_called()
+        assert "No tenant schemas to migrate" in out.getvalue()
+
+    def test_reports_progress_and_summary(self, empty_schemas):
+        out = StringIO()
+        with mock.patch(
+            f"{COMMAND}.migrate_schema", side_effect=lambda name: (name, True, 0.1, "")
+        ) as worker:
+            call_command(
+                "migrate_tenants",
+                "--skip-public",
+                "--processes=1",
+                "--include-unprovisioned",
+                stdout=out,
+            )
+        assert worker.call_count == 2
+        output = out.getvalue()
+        assert "[1/2] mig-a" in output
+        assert "[2/2] mig-b" in output
+        assert "Summary: 2 migrated, 0 failed" in output
+
+    def test_failed_schema_is_retried(self, empty_schemas):
+        attempts: dict[str, int] = {}
+
+        def flaky(name):
+            attempts[name] = attempts.get(name, 0) + 1
+            ok = name != "mig-b" or attempts[name] > 1
+            return name, ok, 0.1, "" if ok else "Traceback\nOperationalError: lock timeout"
+
+        out = StringIO()
+        with mock.patch(f"{COMMAND}.migrate_schema", side_effect=flaky):
+            call_command(
+                "migrate_tenants",
+                "--skip-public",
+                "--processes=1",
+                "--include-unprovisioned",
+                "--retries=1",
+                stdout=out,
+            )
+        assert attempts == {"mig-a": 1, "mig-b": 2}
+        assert "Summary: 2 migrated, 0 failed" in out.getvalue()
+
+    def test_persistent_failure_raises(self, empty_schemas):
+        with (
+            mock.patch(
+                f"{COMMAND}.migrate_schema",
+                side_effect=lambda name: (name, False, 0.1, "RuntimeError: boom"),
+            ),
+            pytest.raises(CommandError, match="2 schema"),
+        ):
+            call_command(
+                "migrate_tenants",
+                "--skip-public",
+                "--processes=1",
+                "--include-unprovisioned",
+                "--retries=0",
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
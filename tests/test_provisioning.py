@@ -0,0 +1,72 @@
+"""Tests for template-schema provisioning (TENANT_PROVISIONING='clone')."""
+
+from __future__ import annotations
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from core.models import Role
+from core.services.seed import DEFAULT_ROLES
+from multitenant.models import Tenant
+from multitenant.provisioning import TEMPLATE_TENANT_ID, build_template_schema
+from multitenant.schema import PUBLIC_SCHEMA_NAME, drop_schema, schema_context
+
+TEMPLATE = "test_tenant_template"
+
+
+def _index_names(schema_name: str) -> set[str]:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT indexname FROM pg_indexes WHERE schemaname = %s", [schema_name])
+        return {row[0] for row in cursor.fetchall()}
+
+
+@pytest.fixture
+def template_schema(settings):
+    settings.MULTITENANT_MODE = "schema"
+    settings.TENANT_TEMPLATE_SCHEMA = TEMPLATE
+    build_template_schema()
+    yield TEMPLATE
+    drop_schema(TEMPLATE)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCloneProvisioning:
+    def test_template_is_seeded_for_placeholder(self, template_schema):
+        with schema_context(template_schema, include_public=False):
+            assert Tenant.objects.filter(id=TEMPLATE_TENANT_ID).exists()
+            assert Role.objects.filter(organization_id=TEMPLATE_TENANT_ID).count() == len(
+                DEFAULT_ROLES
+            )
+
+    def test_create_tenant_clones_template(self, template_schema):
+        try:
+            call_command(
+                "create_tenant", "Clone Org", "clone-org", provisioning="clone", no_color=True
+            )
+            tenant = Tenant.objects.get(slug="clone-org")
+
+            with schema_context("clone-org", include_public=False):
+                local = Tenant.objects.get()
+                assert local.id == tenant.id
+                assert local.schema_name == "clone-org"
+                slugs = set(Role.objects.filter(organization=local).values_list("slug", flat=True))
+                assert slugs == {role["slug"] for role in DEFAULT_ROLES}
+                assert not Role.objects.filter(organization_id=TEMPLATE_TENANT_ID).exists()
+
+                # Sequences continue after the copied rows.
+                Role.objects.create(organization=local, name="Extra", slug="extra")
+
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT count(*) FROM django_migrations")
+                    assert cursor.fetchone()[0] > 0
+
+            assert _index_names(template_schema) == _index_names("clone-org")
+
+            # The template itself is left untouched.
+            with schema_context(template_schema, include_public=False):
+                assert Tenant.objects.filter(id=TEMPLATE_TENANT_ID).exists()
+        finally:
+            with schema_context(PUBLIC_SCHEMA_NAME):
+                Tenant.objects.filter(slug="clone-org").delete()
+            drop_schema("clone-org")
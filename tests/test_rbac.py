@@ -49,3 +49,58 @@ def test_membership_unique_per_user_org():
     with pytest.raises(Exception):
         Membership.objects.create(user=user, organization=tenant, role=role)
 
+
+
+@pytest.fixture
+def cached_member(db, settings):
+    from django.core.cache import cache
+
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    settings.POLICY_CACHE_TIMEOUT = 300
+    cache.clear()
+    tenant = Tenant.objects.create(name="Org4", slug="org4", schema_name="org4")
+    create_schema("org4")
+    seed_default_roles(tenant)
+    role = Role.objects.get(organization=tenant, slug="member")
+    user = User.objects.create_user(username="u4", email="u4@example.com", password="pass1234")
+    membership = Membership.objects.create(user=user, organization=tenant, role=role)
+    yield tenant, user, membership
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_permissions_are_cached_across_requests(cached_member, django_assert_num_queries):
+    tenant, user, _membership = cached_member
+    has_permission(user, tenant, "core.invite_members")
+
+    fresh_user = User.objects.get(pk=user.pk)  # next request: new user object
+    with django_assert_num_queries(0):
+        for codename in ("core.invite_members", "core.manage_roles", "billing.manage_billing"):
+            has_permission(fresh_user, tenant, codename)
+
+
+@pytest.mark.django_db
+def test_role_permission_change_invalidates_cache(cached_member):
+    tenant, user, membership = cached_member
+    assert has_permission(user, tenant, "core.manage_roles") is False
+
+    permission = Permission.objects.get(codename="core.manage_roles")
+    membership.role.permissions.add(permission)
+    assert has_permission(User.objects.get(pk=user.pk), tenant, "core.manage_roles") is True
+
+    membership.role.permissions.remove(permission)
+    assert has_permission(User.objects.get(pk=user.pk), tenant, "core.manage_roles") is False
+
+
+@pytest.mark.django_db
+def test_membership_change_invalidates_cache(cached_member):
+    tenant, user, membership = cached_member
+    assert has_permission(user, tenant, "core.manage_roles") is False
+
+    membership.role = Role.objects.get(organization=tenant, slug="owner")
+    membership.save()
+    assert has_permission(user, tenant, "core.manage_roles") is True
+
+    membership.is_active = False
+    membership.save()
+    assert has_permission(user, tenant, "core.manage_roles") is False
@@ -0,0 +1,61 @@
+"""Tests for the orjson renderer and parser."""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import io
+import json
+import uuid
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from common.api.renderers import FastJSONParser, FastJSONRenderer
+
+
+def test_matches_drf_for_serializer_output():
+    when = timezone.make_aware(datetime.datetime(2026, 1, 2, 3, 4, 5, 678901))
+    data = ReturnDict(
+        {
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "at": when,
+            "day": when.date(),
+            "label": gettext_lazy("Active"),
+            "tags": ("a", "b"),
+            "nested": [{"ok": True, "none": None}],
+        },
+        serializer=None,
+    )
+    fast = FastJSONRenderer().render(data, "application/json")
+    assert json.loads(fast) == json.loads(JSONRenderer().render(data, "application/json"))
+
+
+def test_decimal_keeps_precision():
+    body = FastJSONRenderer().render({"price": decimal.Decimal("19.990")}, "application/json")
+    assert json.loads(body) == {"price": "19.990"}
+
+
+def test_line_terminators_are_escaped():
+    body = FastJSONRenderer().render({"text": "a\u2028b"}, "application/json")
+    assert b"\\u2028" in body
+
+
+def test_indent_and_empty_body():
+    renderer = FastJSONRenderer()
+    assert renderer.render(None) == b""
+    body = renderer.render({"a": 1}, "application/json; indent=4")
+    assert body.startswith(b"{\n")
+
+
+def test_parser_round_trip_and_errors():
+    parser = FastJSONParser()
+    assert parser.parse(io.BytesIO(b'{"a": [1, 2.5]}')) == {"a": [1, 2.5]}
+    with pytest.raises(ParseError):
+        parser.parse(io.BytesIO(b"{not json"))
+    with pytest.raises(ParseError):
+        parser.parse(io.BytesIO(b'{"a": NaN}'))
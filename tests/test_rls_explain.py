@@ -0,0 +1,34 @@
+"""Tests for the typed RLS predicates and their EXPLAIN harness."""
+
+from __future__ import annotations
+
+import pytest
+
+from common.rls import enable_rls_sql, legacy_tenant_predicate, tenant_predicate
+from common.rls_explain import explain_query, explain_tables, index_regressions
+
+
+def test_policies_use_typed_predicate():
+    sql = "\n".join(enable_rls_sql(["core_role"]))
+    assert "::text" not in sql
+    assert tenant_predicate("organization_id") in sql
+    assert 'TO "rls_bypass"' in sql
+    assert "app.rls_bypass" not in sql
+
+
+def test_legacy_predicate_casts_column():
+    assert legacy_tenant_predicate("tenant_id").startswith("tenant_id::text")
+
+
+@pytest.mark.django_db
+class TestExplainHarness:
+    def test_typed_predicate_uses_fk_index(self):
+        typed = explain_query("core_role", "list", "typed")
+        legacy = explain_query("core_role", "list", "legacy")
+        assert typed.uses_index
+        assert not legacy.uses_index
+
+    def test_no_typed_regressions(self):
+        results = explain_tables(["core_role", "core_membership", "core_onboardingstate"])
+        assert results
+        assert index_regressions(results) == []
@@ -0,0 +1,85 @@
+"""Tests for the warm pool of pre-provisioned tenant schemas."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+from prometheus_client import REGISTRY
+
+from core.models import Role
+from multitenant.models import PooledSchema, Tenant
+from multitenant.pool import claim_pooled_schema, fill_schema_pool, pool_depth
+from multitenant.provisioning import build_template_schema
+from multitenant.schema import PUBLIC_SCHEMA_NAME, drop_schema, schema_context, schema_exists
+
+TEMPLATE = "test_pool_template"
+
+
+def _gauge_depth() -> float | None:
+    return REGISTRY.get_sample_value("tenant_schema_pool_depth")
+
+POOLED = override_settings(
+    MULTITENANT_MODE="schema",
+    TENANT_PROVISIONING="clone",
+    TENANT_TEMPLATE_SCHEMA=TEMPLATE,
+    TENANT_SCHEMA_POOL_SIZE=1,
+)
+
+
+@pytest.fixture
+def pool():
+    with POOLED:
+        build_template_schema()
+        yield
+        with schema_context(PUBLIC_SCHEMA_NAME):
+            for name in PooledSchema.objects.values_list("schema_name", flat=True):
+                drop_schema(name)
+            PooledSchema.objects.all().delete()
+        drop_schema(TEMPLATE)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSchemaPool:
+    def test_fill_reaches_target_and_is_idempotent(self, pool):
+        assert fill_schema_pool() == 1
+        assert pool_depth() == 1
+        assert fill_schema_pool() == 0
+
+    def test_depth_gauge_is_set_without_querying_on_scrape(
+        self, pool, django_assert_num_queries
+    ):
+        fill_schema_pool()
+        with django_assert_num_queries(0):
+            assert _gauge_depth() == 1
+
+    def test_claim_misses_on_empty_pool(self, pool):
+        tenant = Tenant(id=999, name="Empty", slug="empty-pool", schema_name="empty-pool")
+        assert claim_pooled_schema(tenant) is False
+
+    def test_claim_renames_and_assigns_schema(self, pool):
+        fill_schema_pool()
+        pooled_name = PooledSchema.objects.get().schema_name
+
+        with schema_context(PUBLIC_SCHEMA_NAME):
+            tenant = Tenant.objects.create(
+                name="Pooled", slug="pooled-org", schema_name="pooled-org"
+            )
+        try:
+            with mock.patch("multitenant.tasks.refill_schema_pool.delay") as refill:
+                assert claim_pooled_schema(tenant) is True
+            refill.assert_called_once()
+
+            assert pool_depth() == 0
+            assert _gauge_depth() == 0
+            assert not schema_exists(pooled_name)
+            with schema_context("pooled-org", include_public=False):
+                local = Tenant.objects.get()
+                assert local.id == tenant.id
+                assert local.schema_name == "pooled-org"
+                assert Role.objects.filter(organization=local, slug="owner").exists()
+        finally:
+            with schema_context(PUBLIC_SCHEMA_NAME):
+                Tenant.objects.filter(pk=tenant.pk).delete()
+            drop_schema("pooled-org")
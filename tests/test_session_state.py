@@ -0,0 +1,100 @@
+"""Tests for per-connection session settings tracking."""
+
+from __future__ import annotations
+
+import pytest
+from django.db import connection, transaction
+
+from common.rls import set_rls_bypass, set_tenant_id
+from common.session_state import (
+    SEARCH_PATH,
+    TENANT_ID,
+    apply_session_settings,
+    current_session_settings,
+    forget_session_settings,
+)
+from multitenant.schema import (
+    PUBLIC_SCHEMA_NAME,
+    get_current_schema,
+    schema_context,
+    set_schema,
+    set_tenant_session,
+)
+
+
+def _show(name: str) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT current_setting(%s, true)", [name])
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSessionState:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        forget_session_settings()
+        set_schema(PUBLIC_SCHEMA_NAME)
+        yield
+        set_tenant_session(PUBLIC_SCHEMA_NAME)
+
+    def test_redundant_set_is_skipped(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            set_schema("acme")
+        with django_assert_num_queries(0):
+            set_schema("acme")
+        assert get_current_schema() == "acme"
+
+    def test_nested_schema_context_is_free_when_unchanged(self, django_assert_num_queries):
+        set_schema("acme")
+        with django_assert_num_queries(0), schema_context("acme"), schema_context("acme"):
+            pass
+        assert get_current_schema() == "acme"
+
+    def test_tenant_session_is_one_statement(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            set_tenant_session("acme", tenant_id=42)
+        assert _show(TENANT_ID) == "42"
+        assert _show(SEARCH_PATH).replace('"', "") == "acme, public"
+
+        with django_assert_num_queries(0):
+            set_tenant_id(42)
+
+    def test_bypass_is_a_no_op_outside_shared_mode(self, settings, django_assert_num_queries):
+        settings.MULTITENANT_MODE = "schema"
+        with django_assert_num_queries(0):
+            set_rls_bypass()
+        assert _show("role") == "none"
+
+    def test_strict_search_path(self):
+        set_schema("acme")
+        with schema_context("acme", include_public=False):
+            assert _show(SEARCH_PATH).replace('"', "") == "acme"
+        assert _show(SEARCH_PATH).replace('"', "") == "acme, public"
+
+    def test_rolled_back_values_are_forgotten(self, django_assert_num_queries):
+        set_tenant_id(1)
+        try:
+            with transaction.atomic():
+                set_tenant_id(2)
+                assert current_session_settings()[TENANT_ID] == "2"
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        assert current_session_settings()[TENANT_ID] == "1"
+        assert _show(TENANT_ID) == "1"
+        with django_assert_num_queries(1):
+            set_tenant_id(2)
+
+    def test_committed_values_are_kept(self, django_assert_num_queries):
+        with transaction.atomic():
+            set_tenant_id(7)
+        with django_assert_num_queries(0):
+            set_tenant_id(7)
+
+    def test_reconnect_resets_tracking(self, django_assert_num_queries):
+        apply_session_settings({TENANT_ID: "9"})
+        connection.close()
+        with django_assert_num_queries(1):
+            apply_session_settings({TENANT_ID: "9"})
+        assert _show(TENANT_ID) == "9"
@@ -0,0 +1,164 @@
+"""Tests for shared-schema (RLS-only) tenancy helpers."""
+
+from __future__ import annotations
+
+import pytest
+from django.db import DatabaseError, connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from common.rls import (
+    bypass_role_sql,
+    enable_rls_sql,
+    existing_tenant_tables,
+    get_bypass_role,
+    rls_bypass,
+    set_transaction_tenant,
+    tenant_transaction,
+)
+from core.models import Role
+from multitenant.middleware import TenantMiddleware
+from multitenant.models import Tenant
+
+APP_ROLE = "rls_app_test"
+
+
+def _setting(name: str) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT current_setting(%s, true)", [name])
+        return cursor.fetchone()[0] or ""
+
+
+@pytest.fixture
+def bypass_role():
+    if connection.pg_version < 160000:
+        pytest.skip("The bypass role membership needs PostgreSQL 16.")
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            for statement in bypass_role_sql()[:2]:
+                cursor.execute(statement)
+    except DatabaseError:
+        pytest.skip("Test database user cannot create roles.")
+    return get_bypass_role()
+
+
+@pytest.fixture
+def tenant_roles(db):
+    """One role row for each of two tenants, created before any policy applies."""
+    rows = []
+    for slug in ("rls-a", "rls-b"):
+        tenant = Tenant.objects.create(name=slug, slug=slug, schema_name=slug)
+        rows.append(Role.objects.create(organization=tenant, name=slug, slug=slug))
+    return rows
+
+
+@pytest.fixture
+def app_role(tenant_roles):
+    """
+    Run the test as a plain role, like the app in production: no superuser,
+    not the tables' owner, policies on ``core_role``, bypass role granted.
+    """
+    if connection.pg_version < 160000:
+        pytest.skip("The bypass role membership needs PostgreSQL 16.")
+    statements = [
+        f'CREATE ROLE "{APP_ROLE}" NOLOGIN',
+        f'GRANT USAGE ON SCHEMA public TO "{APP_ROLE}"',
+        f'GRANT SELECT, INSERT, UPDATE ON core_role TO "{APP_ROLE}"',
+        f'GRANT USAGE ON ALL SEQUENCES IN SCHEMA public TO "{APP_ROLE}"',
+        *bypass_role_sql(member=f'"{APP_ROLE}"'),
+        *enable_rls_sql(["core_role"]),
+        f'SET SESSION AUTHORIZATION "{APP_ROLE}"',
+    ]
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+    except DatabaseError:
+        pytest.skip("Test database user cannot create roles or switch sessions.")
+    yield APP_ROLE
+    with connection.cursor() as cursor:
+        cursor.execute("RESET SESSION AUTHORIZATION")
+
+
+def _visible_tenants(tenant_roles) -> set[int]:
+    ids = [role.organization_id for role in tenant_roles]
+    rows = Role.objects.filter(organization_id__in=ids)
+    return set(rows.values_list("organization_id", flat=True))
+
+
+@pytest.mark.django_db(transaction=True)
+class TestTransactionTenant:
+    def test_requires_atomic_block(self):
+        with pytest.raises(transaction.TransactionManagementError):
+            set_transaction_tenant(1)
+
+    def test_tenant_is_dropped_at_commit(self):
+        with tenant_transaction(42):
+            assert _setting("app.tenant_id") == "42"
+            assert _setting("role") == "none"
+        assert _setting("app.tenant_id") == ""
+
+    def test_bypass_restores_previous_role(self, bypass_role):
+        with tenant_transaction(42):
+            with rls_bypass():
+                assert _setting("role") == bypass_role
+            assert _setting("role") == "none"
+            assert _setting("app.tenant_id") == "42"
+
+
+@pytest.mark.django_db
+def test_only_tables_with_tenant_column_get_policies():
+    tables = existing_tenant_tables()
+    assert "core_role" in tables
+    assert "core_onboardingstate" in tables
+    # Global permission catalog: no tenant column, scoped through roles.
+    assert "core_permission" not in tables
+    assert len(enable_rls_sql(tables)) == 6 * len(tables)
+
+
+@pytest.mark.django_db
+def test_bypass_role_is_not_inherited(app_role, tenant_roles):
+    first, second = (role.organization_id for role in tenant_roles)
+    assert _setting("is_superuser") == "off"
+    with tenant_transaction(first):
+        assert _visible_tenants(tenant_roles) == {first}
+        with rls_bypass():
+            assert _visible_tenants(tenant_roles) == {first, second}
+        assert _visible_tenants(tenant_roles) == {first}
+
+
+@pytest.mark.django_db
+def test_cross_tenant_reads_and_writes_are_denied(app_role, tenant_roles):
+    own, other = tenant_roles
+    with tenant_transaction(own.organization_id):
+        assert not Role.objects.filter(pk=other.pk).exists()
+        assert Role.objects.filter(pk=other.pk).update(name="taken") == 0
+        with pytest.raises(DatabaseError), transaction.atomic():
+            Role.objects.bulk_create(
+                [Role(organization_id=other.organization_id, name="x", slug="x")]
+            )
+    with tenant_transaction(other.organization_id):
+        assert Role.objects.get(pk=other.pk).name == other.name
+        assert not Role.objects.filter(slug="x").exists()
+    with tenant_transaction(None):
+        assert _visible_tenants(tenant_roles) == set()
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(MULTITENANT_MODE="shared", ALLOWED_HOSTS=["*"])
+def test_middleware_scopes_request_transaction(monkeypatch):
+    tenant = Tenant(id=7, slug="acme", schema_name="acme")
+    monkeypatch.setattr("multitenant.middleware.resolve_host", lambda host: tenant)
+    seen = {}
+
+    def view(request):
+        seen["tenant_id"] = _setting("app.tenant_id")
+        seen["atomic"] = connection.in_atomic_block
+        return HttpResponse("ok")
+
+    request = RequestFactory().get("/", HTTP_HOST="acme.test.com")
+    response = TenantMiddleware(view)(request)
+
+    assert response.status_code == 200
+    assert request.tenant is tenant
+    assert seen == {"tenant_id": "7", "atomic": True}
+    assert _setting("app.tenant_id") == ""
@@ -0,0 +1,97 @@
+"""Tests for ?fields= / ?exclude= sparse fieldsets."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from cms.models import ContentPage
+from cms.serializers import ContentPageListSerializer
+from cms.views import ContentPageViewSet
+from common.api.fieldsets import deferrable_columns, selected_fields
+from core.models import User
+from lms.models import Course
+from lms.serializers import CourseDetailSerializer
+from multitenant.models import Domain, Tenant
+
+
+class TestSelectedFields:
+    def test_fields_and_exclude(self):
+        available = ["id", "title", "slug", "tags"]
+        assert selected_fields(available, {}) == set(available)
+        assert selected_fields(available, {"fields": "id, title"}) == {"id", "title"}
+        assert selected_fields(available, {"exclude": "tags"}) == {"id", "title", "slug"}
+        assert selected_fields(available, {"fields": "id,tags", "exclude": "tags"}) == {"id"}
+
+    def test_unknown_field_is_rejected(self):
+        with pytest.raises(ValidationError) as exc:
+            selected_fields(["id", "title"], {"fields": "id,body"})
+        assert "fields" in exc.value.detail
+
+
+class TestDeferrableColumns:
+    def test_columns_outside_the_serializer_are_deferred(self):
+        deferred = deferrable_columns(ContentPageListSerializer(), ContentPage)
+        assert "body_mdx" in deferred
+        assert "frontmatter" in deferred
+        assert "title" not in deferred
+        assert "author" not in deferred
+
+    def test_unknown_sources_disable_deferral(self):
+        assert deferrable_columns(CourseDetailSerializer(), Course) == []
+
+
+@pytest.mark.django_db
+class TestContentPageSparseList:
+    @pytest.fixture
+    def tenant(self):
+        slug = f"sparse-{uuid.uuid4().hex[:8]}"
+        tenant = Tenant.objects.create(name="Sparse", slug=slug, schema_name=slug)
+        ContentPage.objects.create(organization=tenant, title="Hello", slug="hello", body_mdx="#")
+        return tenant
+
+    def _list(self, tenant, query):
+        user = User.objects.create_user(
+            username=f"u-{uuid.uuid4().hex[:6]}", email="sparse@example.com", password="x"
+        )
+        request = APIRequestFactory().get(f"/api/v1/cms/pages/{query}")
+        request.tenant = tenant
+        force_authenticate(request, user=user)
+        return ContentPageViewSet.as_view({"get": "list"})(request)
+
+    def test_only_requested_fields_are_returned(self, tenant):
+        response = self._list(tenant, "?fields=id,title")
+        assert response.status_code == 200
+        assert set(response.data["results"][0]) == {"id", "title"}
+
+    def test_unknown_field_returns_400(self, tenant):
+        assert self._list(tenant, "?fields=body_mdx").status_code == 400
+
+    def test_dropped_columns_are_deferred(self, tenant):
+        Domain.objects.create(tenant=tenant, domain=f"{tenant.slug}.acme.dev", is_primary=True)
+        user = User.objects.create_user(
+            username=f"u-{uuid.uuid4().hex[:6]}", email="sparse@example.com", password="x"
+        )
+        client = APIClient()
+        client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(
+                "/api/v1/cms/pages/?fields=id,title", HTTP_HOST=f"{tenant.slug}.acme.dev"
+            )
+        assert response.status_code == 200
+        assert [row["title"] for row in response.data["results"]] == ["Hello"]
+
+        selects = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if 'FROM "cms_contentpage"' in q["sql"] and "COUNT(" not in q["sql"]
+        ]
+        assert selects
+        for column in ("body_mdx", "excerpt", "tags"):
+            assert f'"cms_contentpage"."{column}"' not in selects[-1]
+        assert '"cms_contentpage"."title"' in selects[-1]
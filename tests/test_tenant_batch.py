@@ -0,0 +1,135 @@
+"""Tests for the cross-tenant batch executor and the tenant_batch command."""
+
+from __future__ import annotations
+
+import json
+from contextlib import nullcontext
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from multitenant import batch
+from multitenant.batch import FAILED, OK, list_tenants, run_for_tenants, run_tenant
+from multitenant.models import Tenant
+
+CALLS: list[str] = []
+FLAKY: dict[str, int] = {}
+
+
+def record(tenant):
+    CALLS.append(tenant.slug)
+
+
+def fail_for_beta(tenant):
+    if tenant.slug == "batch-b":
+        raise RuntimeError("boom")
+    CALLS.append(tenant.slug)
+
+
+def flaky(tenant):
+    FLAKY[tenant.slug] = FLAKY.get(tenant.slug, 0) + 1
+    if FLAKY[tenant.slug] == 1:
+        raise RuntimeError("first attempt")
+
+
+def rename_then_fail(tenant):
+    Tenant.objects.filter(id=tenant.id).update(name="changed")
+    raise RuntimeError("rollback")
+
+
+@pytest.fixture
+def tenants(db):
+    CALLS.clear()
+    FLAKY.clear()
+    for slug in ("batch-a", "batch-b", "batch-c"):
+        Tenant.objects.create(name=slug, slug=slug, schema_name=slug)
+    Tenant.objects.create(name="off", slug="batch-off", schema_name="batch-off", is_active=False)
+    return list_tenants(["batch-a", "batch-b", "batch-c", "batch-off"])
+
+
+@pytest.mark.django_db
+class TestRunForTenants:
+    def test_runs_once_per_active_tenant(self, tenants):
+        progress = []
+        report = run_for_tenants(record, tenants, progress=lambda *args: progress.append(args))
+        assert CALLS == ["batch-a", "batch-b", "batch-c"]
+        assert report.count(OK) == 3
+        assert [(done, total) for done, total, _ in progress] == [(1, 3), (2, 3), (3, 3)]
+
+    def test_failure_does_not_stop_the_batch(self, tenants):
+        report = run_for_tenants(fail_for_beta, tenants)
+        assert CALLS == ["batch-a", "batch-c"]
+        assert [o.slug for o in report.failures] == ["batch-b"]
+        assert "boom" in report.failures[0].error
+
+    def test_failed_tenants_are_retried(self, tenants):
+        report = run_for_tenants(flaky, tenants, retries=1)
+        assert report.count(OK) == 3
+        assert {o.slug: o.attempts for o in report.outcomes} == {
+            "batch-a": 2,
+            "batch-b": 2,
+            "batch-c": 2,
+        }
+
+    def test_each_tenant_runs_in_its_own_transaction(self, tenants):
+        report = run_for_tenants(rename_then_fail, tenants[:1])
+        assert report.count(FAILED) == 1
+        assert Tenant.objects.get(slug="batch-a").name == "batch-a"
+
+    def test_transaction_uses_the_tenant_database(self, tenants):
+        with (
+            mock.patch.object(batch, "get_current_database", return_value="tenant_db"),
+            mock.patch.object(batch.transaction, "atomic", return_value=nullcontext()) as atomic,
+        ):
+            assert run_tenant(record, tenants[0]).status == OK
+        atomic.assert_called_once_with(using="tenant_db")
+
+    def test_checkpoint_resumes_after_failures(self, tenants, tmp_path):
+        checkpoint = tmp_path / "batch.jsonl"
+        run_for_tenants(fail_for_beta, tenants, checkpoint=checkpoint)
+        entries = [json.loads(line) for line in checkpoint.read_text().splitlines()]
+        assert [(e["slug"], e["status"]) for e in entries] == [
+            ("batch-a", OK),
+            ("batch-b", FAILED),
+            ("batch-c", OK),
+        ]
+
+        CALLS.clear()
+        report = run_for_tenants(record, tenants, checkpoint=checkpoint)
+        assert CALLS == ["batch-b"]
+        assert report.resumed == ["batch-a", "batch-c"]
+
+
+@pytest.mark.django_db
+class TestTenantBatchCommand:
+    def test_reports_progress_and_summary(self, tenants):
+        out = StringIO()
+        call_command(
+            "tenant_batch",
+            f"{__name__}.record",
+            "--tenant=batch-a",
+            "--tenant=batch-c",
+            "--processes=1",
+            stdout=out,
+        )
+        output = out.getvalue()
+        assert "[1/2] batch-a" in output
+        assert "[2/2] batch-c" in output
+        assert "Summary: 2 ok, 0 failed" in output
+
+    def test_fails_when_a_tenant_fails(self, tenants):
+        with pytest.raises(CommandError, match="1 tenant"):
+            call_command(
+                "tenant_batch",
+                f"{__name__}.fail_for_beta",
+                "--processes=1",
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+
+    def test_unknown_callable(self, tenants):
+        with pytest.raises(CommandError, match="Cannot import"):
+            call_command("tenant_batch", "nope.missing", stdout=StringIO())
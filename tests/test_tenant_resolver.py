@@ -0,0 +1,100 @@
+"""Tests for the cached host → tenant resolver."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from multitenant import resolver
+from multitenant.models import Domain, Tenant
+from multitenant.schema import PUBLIC_SCHEMA_NAME, schema_context
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches(locmem_cache, settings):
+    settings.TENANT_CACHE_TIMEOUT = 300
+    settings.TENANT_CACHE_NEGATIVE_TIMEOUT = 30
+    settings.TENANT_CACHE_LOCAL_TTL = 10
+    settings.TENANT_CACHE_LOCAL_SIZE = 16
+    resolver.clear_local_cache()
+    yield
+    resolver.clear_local_cache()
+
+
+@pytest.fixture
+def tenant_with_domain():
+    slug = f"resolver-{uuid.uuid4().hex[:8]}"
+    with schema_context(PUBLIC_SCHEMA_NAME):
+        tenant = Tenant.objects.create(name="Resolver", slug=slug, schema_name=slug)
+        domain = Domain.objects.create(tenant=tenant, domain=f"{slug}.test.com", is_primary=True)
+    return tenant, domain
+
+
+@pytest.mark.django_db(transaction=True)
+class TestResolveHost:
+    def test_second_lookup_hits_no_database(self, tenant_with_domain, django_assert_num_queries):
+        tenant, domain = tenant_with_domain
+        first = resolver.resolve_host(domain.domain)
+        assert first.id == tenant.id
+
+        with django_assert_num_queries(0):
+            second = resolver.resolve_host(domain.domain)
+        assert second.id == tenant.id
+        assert second.schema_name == tenant.schema_name
+        assert second is not first
+
+    def test_unknown_host_is_negatively_cached(self, django_assert_num_queries):
+        assert resolver.resolve_host("nobody.test.com") is None
+        with django_assert_num_queries(0):
+            assert resolver.resolve_host("nobody.test.com") is None
+
+    def test_domain_creation_clears_negative_entry(self, tenant_with_domain):
+        tenant, _ = tenant_with_domain
+        assert resolver.resolve_host("late.test.com") is None
+
+        with schema_context(PUBLIC_SCHEMA_NAME):
+            Domain.objects.create(tenant=tenant, domain="late.test.com")
+
+        resolved = resolver.resolve_host("late.test.com")
+        assert resolved is not None
+        assert resolved.id == tenant.id
+
+    def test_deactivating_tenant_invalidates(self, tenant_with_domain):
+        tenant, domain = tenant_with_domain
+        assert resolver.resolve_host(domain.domain) is not None
+
+        with schema_context(PUBLIC_SCHEMA_NAME):
+            tenant.is_active = False
+            tenant.save()
+
+        assert resolver.resolve_host(domain.domain) is None
+
+    def test_renaming_domain_invalidates_old_host(self, tenant_with_domain):
+        tenant, domain = tenant_with_domain
+        old_host = domain.domain
+        assert resolver.resolve_host(old_host) is not None
+
+        with schema_context(PUBLIC_SCHEMA_NAME):
+            domain.domain = f"renamed-{old_host}"
+            domain.save()
+
+        assert resolver.resolve_host(old_host) is None
+        assert resolver.resolve_host(domain.domain).id == tenant.id
+
+
+class TestLocalCache:
+    def test_lru_evicts_oldest(self):
+        local = resolver._LocalCache()
+        local.set("a", 1, ttl=60, max_size=2)
+        local.set("b", 2, ttl=60, max_size=2)
+        assert local.get("a") == 1  # "a" becomes most recent
+        local.set("c", 3, ttl=60, max_size=2)
+        assert local.get("b") is None
+        assert local.get("a") == 1
+        assert local.get("c") == 3
+
+    def test_disabled_when_ttl_is_zero(self):
+        local = resolver._LocalCache()
+        local.set("a", 1, ttl=0, max_size=2)
+        assert local.get("a") is None
@@ -0,0 +1,119 @@
+"""Tests for the token-bucket TenantPlanThrottle and rate-limit headers."""
+
+from __future__ import annotations
+
+import uuid
+from unittest import mock
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from api import throttling
+from api.middleware import RateLimitHeadersMiddleware
+from billing.models import Plan
+from multitenant.models import Tenant
+
+
+@pytest.fixture(autouse=True)
+def _clean_buckets(locmem_cache, settings):
+    settings.API_THROTTLE_RATE_PER_MINUTE = 60
+    settings.API_THROTTLE_BURST = 3
+    settings.API_THROTTLE_USER_RATE_PER_MINUTE = 60
+    settings.API_THROTTLE_USER_BURST = 2
+    settings.API_THROTTLE_ANON_RATE_PER_MINUTE = 60
+    settings.API_THROTTLE_ANON_BURST = 2
+    throttling._local_buckets.clear()
+    yield
+    throttling._local_buckets.clear()
+
+
+def _request(tenant=None, user=None):
+    django_request = RequestFactory().get("/api/v1/roles/", REMOTE_ADDR="10.0.0.1")
+    django_request.tenant = tenant
+    request = Request(django_request)
+    request.user = user or mock.Mock(is_authenticated=False)
+    return request
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self):
+        with mock.patch.object(throttling.time, "monotonic", return_value=100.0):
+            results = [throttling.take_token("k", 3, 1.0).allowed for _ in range(4)]
+        assert results == [True, True, True, False]
+
+        with mock.patch.object(throttling.time, "monotonic", return_value=101.5):
+            state = throttling.take_token("k", 3, 1.0)
+        assert state.allowed is True
+        assert state.remaining == 0
+
+    def test_denied_state_reports_retry_after(self):
+        with mock.patch.object(throttling.time, "monotonic", return_value=100.0):
+            throttling.take_token("k", 1, 0.5)
+            state = throttling.take_token("k", 1, 0.5)
+        assert state.allowed is False
+        assert state.retry_after == pytest.approx(2.0)
+        assert state.headers()["RateLimit-Policy"] == "1;w=2"
+
+
+@pytest.mark.django_db
+class TestTenantPlanThrottle:
+    @pytest.fixture
+    def tenant(self):
+        slug = f"thr-{uuid.uuid4().hex[:8]}"
+        return Tenant.objects.create(name="T", slug=slug, schema_name=slug, plan_code="pro")
+
+    def test_plan_limits_override_defaults(self, tenant):
+        assert throttling.plan_limits(tenant) == (60, 3)
+        Plan.objects.create(
+            organization=tenant, code="pro", name="Pro", api_rate_per_minute=120, api_burst=10
+        )
+        assert throttling.plan_limits(tenant) == (120, 10)
+
+    def test_changing_the_plan_code_switches_limits(self, tenant):
+        Plan.objects.create(
+            organization=tenant, code="pro", name="Pro", api_rate_per_minute=120, api_burst=10
+        )
+        Plan.objects.create(
+            organization=tenant, code="team", name="Team", api_rate_per_minute=600, api_burst=50
+        )
+        assert throttling.plan_limits(tenant) == (120, 10)
+        tenant.plan_code = "team"
+        tenant.save()
+        assert throttling.plan_limits(tenant) == (600, 50)
+
+    def test_authenticated_requests_share_the_tenant_bucket(self, tenant):
+        user = mock.Mock(is_authenticated=True)
+        throttle = throttling.TenantPlanThrottle()
+        allowed = [throttle.allow_request(_request(tenant, user), None) for _ in range(4)]
+        assert allowed == [True, True, True, False]
+        assert throttle.wait() > 0
+
+    def test_authenticated_requests_without_tenant_use_a_user_bucket(self):
+        throttle = throttling.TenantPlanThrottle()
+        first = mock.Mock(is_authenticated=True, pk=1)
+        allowed = [throttle.allow_request(_request(None, first), None) for _ in range(3)]
+        assert allowed == [True, True, False]
+        other = mock.Mock(is_authenticated=True, pk=2)
+        assert throttle.allow_request(_request(None, other), None) is True
+
+    def test_anonymous_requests_use_the_anon_bucket(self, tenant):
+        throttle = throttling.TenantPlanThrottle()
+        allowed = [throttle.allow_request(_request(tenant), None) for _ in range(3)]
+        assert allowed == [True, True, False]
+
+    def test_headers_are_added_to_the_response(self, tenant):
+        request = _request(tenant, mock.Mock(is_authenticated=True))
+        throttling.TenantPlanThrottle().allow_request(request, None)
+        middleware = RateLimitHeadersMiddleware(lambda r: HttpResponse())
+        response = middleware(request._request)
+        assert response["RateLimit-Limit"] == "3"
+        assert response["RateLimit-Remaining"] == "2"
+        assert "RateLimit-Reset" in response
+
+    def test_backend_failure_allows_the_request(self, tenant):
+        with mock.patch.object(throttling, "take_token", return_value=None):
+            throttle = throttling.TenantPlanThrottle()
+            assert throttle.allow_request(_request(tenant), None) is True
+            assert throttle.wait() is None